@@ -27,53 +27,253 @@ short_description: Use ciscosmb cliconf to run command on Cisco SMB network devi
 description:
   - This ciscosmb plugin provides low level abstraction apis for
     sending and receiving CLI commands from Cisco SMB network devices.
+options:
+  config_window:
+    type: int
+    default: 0
+    description:
+      - Number of configuration lines C(edit_config) sends to the device
+        before it waits for the prompt and checks the output for errors.
+      - The default C(0) sends one line at a time and waits for the prompt
+        after each of them. This is the safe mode for every firmware.
+      - With a larger value the lines are pipelined in windows of this size.
+        A failing line is still reported and no further window is sent, but
+        the lines following it in the same window have already reached the
+        device.
+      - Windows are read directly off the ssh channel, without one (a
+        connection not using paramiko) the lines are sent one at a time.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_WINDOW
+    vars:
+      - name: ansible_ciscosmb_config_window
+  config_cache_dir:
+    type: path
+    description:
+      - Directory on the controller where the running configuration of
+        each host is kept between tasks and playbook runs.
+      - When set, C(get_config) of the running configuration first sends
+        the cheap C(show system) and downloads the configuration only when
+        the switch rebooted, its identity changed, a configuration change
+        was sent through this plugin or the cached copy is older than
+        I(config_cache_max_age).
+      - Changes made outside of Ansible (web UI, other CLI sessions) are
+        only noticed after I(config_cache_max_age).
+      - The files hold the full configuration, keep the directory private.
+      - Not set by default, the configuration is then always downloaded.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_CACHE_DIR
+    vars:
+      - name: ansible_ciscosmb_config_cache_dir
+  config_cache_max_age:
+    type: int
+    default: 3600
+    description:
+      - Seconds a cached running configuration is used at most, see
+        I(config_cache_dir).
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_CACHE_MAX_AGE
+    vars:
+      - name: ansible_ciscosmb_config_cache_max_age
+  config_transfer:
+    type: str
+    default: none
+    choices: [none, tftp, http, staged]
+    description:
+      - How C(edit_config) hands large changes to the switch. With C(none)
+        every line is typed on the CLI.
+      - C(tftp) and C(http) serve the lines as a file from the controller
+        for the duration of one C(copy <url> running-config), C(staged)
+        writes the file to I(config_transfer_dir) where an existing server
+        (for example SCP) publishes it as I(config_transfer_url).
+      - Used when the change has at least I(config_transfer_min_lines)
+        lines. The switch applies a copied file on top of the running
+        configuration, it removes nothing the file does not negate, so
+        C(replace) stays unsupported.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER
+    vars:
+      - name: ansible_ciscosmb_config_transfer
+  config_transfer_address:
+    type: str
+    description:
+      - Address of the controller as the switch reaches it, required for
+        I(config_transfer) C(tftp) and C(http).
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_ADDRESS
+    vars:
+      - name: ansible_ciscosmb_config_transfer_address
+  config_transfer_port:
+    type: int
+    description:
+      - Port the controller listens on, C(69) for C(tftp) and C(80) for
+        C(http) when not set. C(0) picks a free port.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_PORT
+    vars:
+      - name: ansible_ciscosmb_config_transfer_port
+  config_transfer_dir:
+    type: path
+    description:
+      - Directory the file is written to for I(config_transfer) C(staged).
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_DIR
+    vars:
+      - name: ansible_ciscosmb_config_transfer_dir
+  config_transfer_url:
+    type: str
+    description:
+      - URL the switch finds I(config_transfer_dir) at for I(config_transfer)
+        C(staged), for example C(scp://backup@192.0.2.10/configs).
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_URL
+    vars:
+      - name: ansible_ciscosmb_config_transfer_url
+  config_transfer_min_lines:
+    type: int
+    default: 50
+    description:
+      - Smallest change, in configuration lines, that is loaded by file
+        transfer when I(config_transfer) is set.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_MIN_LINES
+    vars:
+      - name: ansible_ciscosmb_config_transfer_min_lines
+  config_transfer_fetch:
+    type: bool
+    default: false
+    description:
+      - When I(config_transfer) is set, C(get_config) has the switch copy
+        its running or startup configuration to the controller the same
+        way, C(tftp) and C(http) (PUT) servers then receive the file.
+      - Falls back to C(show running-config) with a warning when the copy
+        fails.
+    env:
+      - name: ANSIBLE_CISCOSMB_CONFIG_TRANSFER_FETCH
+    vars:
+      - name: ansible_ciscosmb_config_transfer_fetch
 '''
 
-import re
+import hashlib
 import json
+import os
+import re
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
 
-from ansible.module_utils._text import to_text
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_text, to_bytes
 from ansible.plugins.cliconf import CliconfBase, enable_mode
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
 )
 from ansible.module_utils.common._collections_compat import Mapping
+from ansible_collections.community.ciscosmb.plugins.plugin_utils.file_transfer import (
+    file_transfer,
+)
+from ansible_collections.community.ciscosmb.plugins.terminal.ciscosmb import (
+    ResponseStream,
+    find_stderr,
+)
 
+# SG300, SG500, SG350, SG550X, SX550X, SF, CBS250, CBS350 ...
+SMB_SWITCH_MODEL_RE = re.compile(r'^(?:SG|SF|SX|CBS)\d')
+
+# "System Up Time (days,hour:min:sec):       483,01:39:47"
+SYSTEM_UPTIME_RE = re.compile(
+    r'^System Up Time \([^)]*\):\s+(\d+),(\d+):(\d+):(\d+)\s*$', re.M
+)
+# fields of show system naming the switch, the rest (uptime, the unit
+# temperature, fan and power supply tables) changes between runs
+SYSTEM_IDENTITY_RE = re.compile(
+    r'^(System Description|System Name|System MAC Address|System Object ID):[ \t]*(.*?)\s*$',
+    re.M,
+)
+# boot time computed from the uptime moves with the command round trip
+BOOT_TIME_SLACK = 60
+# bytes read from the ssh channel at a time by iter_command
+STREAM_CHUNK = 16384
+# "Copy: 2310 bytes copied in 00:00:01 [hh:mm:ss]"
+COPY_DONE_RE = re.compile(r"bytes copied|completed successfully", re.I)
+COPY_CONFIRM_PROMPT = r"\[[Yy]/[Nn]\]"
 
 
 class Cliconf(CliconfBase):
 
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        self._device_info = {}
+        self._command_timing = []
+
     def get_device_info(self):
+        """ probed once, cached for the life of the persistent connection """
+        if not self._device_info:
+            self._device_info = self._probe_device_info()
+        return self._device_info
+
+    def reset_device_info(self):
+        """ drop the cached device info, the next call probes again """
+        self._device_info = {}
+
+    def _probe_device_info(self):
+        """ version, model and hostname, once per connection
+
+        No single command has all three: show version has no model, show
+        system names the model without the PID suffix ansible_net_model
+        always had ("SG500-52" for "SG500-52-K9") and only show system has
+        the hostname. The three commands run once, get_device_info caches
+        the result.
+        """
         device_info = {}
         device_info['network_os'] = 'ciscosmb'
 
-        resource = self.get('show verison')
+        resource = self.get('show version')
         data = to_text(resource, errors='surrogate_or_strict').strip()
-        match = re.search(r'SW version  +(\S+) \(.*$', data)
+        # fw 1.x "SW version 1.4.8.6 ( ...", fw 2.x and 3.x "  Version: 2.4.5.71"
+        match = re.search(r'^(?:SW version|\s+Version:)\s+(\S+)', data, re.M)
         if match:
             device_info['network_os_version'] = match.group(1)
 
+        # the PID of the first unit, "SG500-52-K9", quoted on CBS firmware
         model = self.get('show inventory')
         data = to_text(model, errors='surrogate_or_strict').strip()
-        match = re.search(r'PID: (.+)$', data, re.M)
+        match = re.search(r'^PID:\s*"?([^"\s,]+)', data, re.M)
         if match:
             device_info['network_os_model'] = match.group(1)
 
         identity = self.get('show system')
         data = to_text(identity, errors='surrogate_or_strict').strip()
+        if 'network_os_model' not in device_info:
+            # no inventory, the description starts with the model less suffix
+            match = re.search(r'^System Description:\s+(\S+)', data, re.M)
+            if match:
+                device_info['network_os_model'] = match.group(1)
+
         match = re.search(r'System Name: +(\S+)', data, re.M)
         if match:
             device_info['network_os_hostname'] = match.group(1)
 
+        device_info['network_os_type'] = self._detect_device_type(
+            device_info.get('network_os_model')
+        )
+
         return device_info
 
     def check_device_type(self):
-         device_type = "L2"
-         try:
-             self.get(command="show vlan")
-         except Exception:
-             device_type = "L3"
-         return device_type
+        return self.get_device_info()['network_os_type']
+
+    def _detect_device_type(self, model):
+        """ L2 when the switch handles VLANs, known SMB families always do """
+        if model and SMB_SWITCH_MODEL_RE.match(model):
+            return "L2"
+
+        # unknown model, ask for a single VLAN instead of the whole table
+        try:
+            self.get(command="show vlan tag 1")
+        except Exception:
+            return "L3"
+        return "L2"
 
     @enable_mode
     def get_config(self, source='running', flags=None, format=None):
@@ -92,12 +292,133 @@ class Cliconf(CliconfBase):
                 "'flags' value %s is not supported for get_config" % flags
             )
 
-        if source == "running":
-            cmd = "show running-config "
-        else:
-            cmd = "show startup-config "
+        cache_dir = self.get_option("config_cache_dir")
+        if source != "running" or not cache_dir:
+            return self._download_config(source)
+
+        path = self._config_cache_path(cache_dir)
+        fingerprint, boot_time = self._config_fingerprint()
+        cached = self._read_config_cache(path)
+        if (
+            cached
+            and cached["fingerprint"] == fingerprint
+            and abs(cached["boot_time"] - boot_time) <= BOOT_TIME_SLACK
+            and time.time() - cached["stored"]
+            < self.get_option("config_cache_max_age")
+        ):
+            return cached["config"]
+
+        config = self._download_config(source)
+        self._write_config_cache(path, {
+            "fingerprint": fingerprint,
+            "boot_time": boot_time,
+            "stored": time.time(),
+            "config": to_text(config, errors="surrogate_then_replace"),
+        })
+        return config
 
-        return self.send_command(cmd)
+    def _download_config(self, source):
+        if (
+            self.get_option("config_transfer_fetch")
+            and self.get_option("config_transfer") != "none"
+        ):
+            try:
+                return self._upload_config(source)
+            except (AnsibleConnectionFailure, ValueError, EnvironmentError) as exc:
+                self._connection.queue_message(
+                    "warning",
+                    "fetching the %s configuration by file transfer failed, "
+                    "falling back to the CLI: %s" % (source, to_text(exc)),
+                )
+
+        return self.send_command("show %s-config " % source)
+
+    def _upload_config(self, source):
+        """ the switch copies its configuration to the controller """
+        with self._file_transfer(None) as transfer:
+            out = self.send_command(
+                "copy %s-config %s" % (source, transfer.url()),
+                prompt=COPY_CONFIRM_PROMPT,
+                answer="Y",
+            )
+            out = to_text(out, errors="surrogate_then_replace")
+            if not COPY_DONE_RE.search(out):
+                raise AnsibleConnectionFailure(
+                    "copy of the %s configuration to %s failed: %s"
+                    % (source, transfer.url(), out)
+                )
+            data = transfer.received()
+
+        if data is None:
+            raise AnsibleConnectionFailure(
+                "the switch reported a copy to %s but nothing arrived: %s"
+                % (transfer.url(), out)
+            )
+        return to_text(data, errors="surrogate_then_replace").replace("\r\n", "\n").strip()
+
+    def _config_cache_path(self, cache_dir):
+        host = to_text(self._connection.get_option("host"))
+        return os.path.join(
+            cache_dir, "%s.json" % re.sub(r"[^\w.-]", "_", host)
+        )
+
+    def _config_fingerprint(self):
+        """ boot time from the uptime plus a digest of the identity fields
+        of show system """
+        data = to_text(self.get("show system"), errors="surrogate_or_strict")
+
+        boot_time = 0
+        match = SYSTEM_UPTIME_RE.search(data)
+        if match:
+            days, hours, mins, secs = [int(n) for n in match.groups()]
+            uptime = ((days * 24 + hours) * 60 + mins) * 60 + secs
+            boot_time = int(time.time()) - uptime
+
+        identity = "\n".join(
+            "%s: %s" % field for field in SYSTEM_IDENTITY_RE.findall(data)
+        )
+        fingerprint = hashlib.sha1(
+            to_bytes(identity, errors="surrogate_or_strict")
+        ).hexdigest()
+        return fingerprint, boot_time
+
+    def _read_config_cache(self, path):
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or set(cached) != set(
+            ["fingerprint", "boot_time", "stored", "config"]
+        ):
+            return None
+        return cached
+
+    def _write_config_cache(self, path, entry):
+        """ write to a private temporary file, then rename over the old copy """
+        cache_dir = os.path.dirname(path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.rename(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def _drop_config_cache(self):
+        cache_dir = self.get_option("config_cache_dir")
+        if not cache_dir:
+            return
+
+        try:
+            os.unlink(self._config_cache_path(cache_dir))
+        except OSError:
+            pass
 
 
 
@@ -115,7 +436,10 @@ class Cliconf(CliconfBase):
         requests = []
 
         if commit:
-            self.send_command("configure terminal")
+            # whatever happens below, the cached configuration is outdated
+            self._drop_config_cache()
+
+            lines = []
             for line in to_list(candidate):
                 if not isinstance(line, Mapping):
                     line = {"command": line}
@@ -123,10 +447,28 @@ class Cliconf(CliconfBase):
                 cmd = line["command"]
 
                 if cmd != "end" and cmd[0] != "!":
-                    results.append(self.send_command(**line))
-                    requests.append(cmd)
+                    lines.append(line)
+
+            if self._use_config_transfer(lines):
+                results = self._copy_config(lines)
+            else:
+                self.send_command("configure terminal")
+
+                window = self.get_option("config_window")
+                # a window is read off the ssh channel, without one the
+                # lines go one at a time
+                shell = self._raw_shell() if window and window > 1 else None
+                if shell is not None:
+                    results = self._send_config_pipelined(lines, window, shell)
+                else:
+                    for line in lines:
+                        results.append(self.send_command(**line))
 
-            self.send_command("end")
+                self.send_command("end")
+            requests = [line["command"] for line in lines]
+
+            if any(cmd.startswith("hostname") for cmd in requests):
+                self.reset_device_info()
         else:
             raise ValueError("check mode is not supported")
 
@@ -135,11 +477,311 @@ class Cliconf(CliconfBase):
 
         return resp
 
+    def _use_config_transfer(self, lines):
+        if self.get_option("config_transfer") == "none":
+            return False
+
+        if any(set(line) != set(["command"]) for line in lines):
+            # answers to prompts can not be put in a file
+            return False
+
+        return len(lines) >= self.get_option("config_transfer_min_lines")
+
+    def _file_transfer(self, data):
+        """ server for the configured config_transfer, data None to receive """
+        mode = self.get_option("config_transfer")
+        if mode in ("tftp", "http") and not self.get_option("config_transfer_address"):
+            raise ValueError(
+                "config_transfer_address is required for config_transfer %s" % mode
+            )
+
+        return file_transfer(
+            mode,
+            data,
+            address=self.get_option("config_transfer_address"),
+            port=self.get_option("config_transfer_port"),
+            url=self.get_option("config_transfer_url"),
+            directory=self.get_option("config_transfer_dir"),
+        )
+
+    def _copy_config(self, lines):
+        """ the switch pulls the lines as a file from the controller """
+        data = "\n".join(line["command"] for line in lines) + "\n"
+        with self._file_transfer(data) as transfer:
+            out = self._copy_to_running(transfer.url())
+
+        if transfer.scheme and not transfer.served:
+            raise AnsibleConnectionFailure(
+                "the switch reported a copy of %s but never fetched it: %s"
+                % (transfer.url(), out)
+            )
+        return [out]
+
+    def _copy_to_running(self, url):
+        out = self.send_command(
+            "copy %s running-config" % url, prompt=COPY_CONFIRM_PROMPT, answer="Y"
+        )
+        out = to_text(out, errors="surrogate_then_replace")
+        if not COPY_DONE_RE.search(out):
+            raise AnsibleConnectionFailure(
+                "copy of the configuration from %s failed: %s" % (url, out)
+            )
+        return out
+
+    def _send_config_pipelined(self, lines, window, shell):
+        """ send config lines in windows, one prompt wait per window """
+        results = []
+        pending = []
+
+        for line in lines:
+            if set(line) != set(["command"]):
+                # lines answering a prompt can not be pipelined
+                results.extend(self._send_config_window(pending, shell))
+                pending = []
+                results.append(self.send_command(**line))
+                continue
+
+            pending.append(line["command"])
+            if len(pending) >= window:
+                results.extend(self._send_config_window(pending, shell))
+                pending = []
+
+        results.extend(self._send_config_window(pending, shell))
+        return results
+
+    def _send_config_window(self, commands, shell):
+        """ output of the whole window is reported against its last line """
+        if not commands:
+            return []
+
+        for cmd in commands:
+            self.send_command(cmd, sendonly=True)
+
+        lines, error = self._read_config_window(shell, commands)
+        if error:
+            raise self._config_window_failure(
+                commands, to_text(b"\n".join(lines), errors="surrogate_then_replace")
+            )
+
+        return [""] * (len(commands) - 1) + [
+            to_text(b"\n".join(lines), errors="surrogate_then_replace").strip()
+        ]
+
+    def _read_config_window(self, shell, commands):
+        """ reads the channel up to the prompt following the echo of the
+        last line of the window
+
+        The prompt after the echo of the first line already ends a plain
+        read, echoes, errors and prompts of the later lines would be left
+        for the next command. Returns the lines received and whether one
+        of them is an error message, the output of the last line follows
+        the last of the lines.
+        """
+        last = commands[-1]
+        echo = re.compile(br"[#>] ?" + re.escape(to_bytes(last.strip())) + br"\s*$")
+        echoes = sum(1 for cmd in commands if cmd.strip() == last.strip())
+
+        stream = ResponseStream()
+        lines = []
+        output = []
+        with self._command_timeout(shell):
+            while echoes or not stream.done:
+                for line in stream.feed(self._recv_chunk(shell, last)):
+                    lines.append(line)
+                    if echoes and echo.search(line):
+                        echoes -= 1
+                        output = []
+                    else:
+                        output.append(line)
+
+        if stream.error is not None:
+            return lines, True
+        return output, False
+
+    def _config_window_failure(self, commands, error):
+        failed = self._find_failed_config_line(commands, error)
+        if failed is None:
+            return AnsibleConnectionFailure(
+                "one of the configuration lines %s failed: %s"
+                % (", ".join(commands), error)
+            )
+        sent_after = commands[commands.index(failed) + 1:]
+        msg = "configuration line '%s' failed: %s" % (failed, error)
+        if sent_after:
+            msg += " (already sent after it: %s)" % ", ".join(sent_after)
+        return AnsibleConnectionFailure(msg)
+
+    def _find_failed_config_line(self, commands, error):
+        """ last echoed line before the first error message is the culprit """
+        data = to_bytes(error, errors="surrogate_or_strict")
+        match = find_stderr(data)
+        if not match:
+            return None
+        head = data[:match.start()]
+
+        failed = None
+        failed_at = -1
+        for cmd in commands:
+            at = head.rfind(to_bytes(cmd, errors="surrogate_or_strict"))
+            if at > failed_at or (
+                at == failed_at and at >= 0 and len(cmd) > len(failed)
+            ):
+                failed = cmd
+                failed_at = at
+
+        return failed
+
+    def run_commands(self, commands=None, check_rc=True):
+        """ all commands in one call, a failing one is reported by name
+
+        With check_rc False the response of a failing command is
+        ``{"error": message}``, so that the message is not parsed as output.
+        """
+        if commands is None:
+            raise ValueError("'commands' value is required")
+
+        responses = list()
+        timing = list()
+        for cmd in to_list(commands):
+            if not isinstance(cmd, Mapping):
+                cmd = {"command": cmd}
+            else:
+                cmd = dict(cmd)
+
+            output = cmd.pop("output", None)
+            if output:
+                raise ValueError(
+                    "'output' value %s is not supported for run_commands" % output
+                )
+
+            started = time.time()
+            try:
+                out = self.send_command(**cmd)
+            except AnsibleConnectionFailure as exc:
+                if check_rc:
+                    raise AnsibleConnectionFailure(
+                        "command '%s' failed: %s" % (cmd["command"], to_text(exc))
+                    )
+                out = {"error": to_text(getattr(exc, "err", exc), errors="surrogate_then_replace")}
+
+            timing.append({
+                "command": to_text(cmd["command"]),
+                "wall_time": round(time.time() - started, 6),
+                "bytes": len(to_bytes(out["error"] if isinstance(out, dict) else out,
+                                      errors="surrogate_then_replace")),
+            })
+            responses.append(out)
+
+        self._command_timing = timing
+        return responses
+
+    def get_command_timing(self):
+        """ time on the device connection and bytes received of every
+        command the last run_commands sent """
+        return self._command_timing
+
+    def iter_command(self, command):
+        """ yields the response of command line by line while it arrives
+
+        Reads the ssh channel directly, so no more than a chunk and the
+        unfinished line are held at any time. Without a paramiko channel the
+        buffered response is split instead.
+        """
+        shell = self._raw_shell()
+        if shell is None:
+            out = to_text(self.send_command(command), errors="surrogate_then_replace")
+            for line in out.splitlines():
+                yield line
+            return
+
+        stream = ResponseStream(command, self._connection.get_prompt())
+        with self._command_timeout(shell):
+            shell.sendall(to_bytes(command, errors="surrogate_or_strict") + b"\r")
+            try:
+                while not stream.done:
+                    for line in stream.feed(self._recv_chunk(shell, command)):
+                        yield to_text(line, errors="surrogate_then_replace")
+            finally:
+                # consumer gave up early, the rest must not leak into the next command
+                while not stream.done:
+                    stream.feed(self._recv_chunk(shell, command))
+
+        if stream.error is not None:
+            raise AnsibleConnectionFailure(
+                "command '%s' failed: %s"
+                % (command, to_text(stream.error, errors="surrogate_then_replace"))
+            )
+
+    def _raw_shell(self):
+        """ the paramiko channel of the connection, None without one
+
+        A libssh channel has no timeout of its own and returns nothing when
+        no data is there yet, it is left to send_command.
+        """
+        shell = getattr(self._connection, "_ssh_shell", None)
+        if shell is None and hasattr(self._connection, "_connect"):
+            self._connection._connect()
+            shell = getattr(self._connection, "_ssh_shell", None)
+
+        if shell is None or getattr(self._connection, "_ssh_type", None) != "paramiko":
+            return None
+        return shell
+
+    @contextmanager
+    def _command_timeout(self, shell):
+        """ reads of shell time out after persistent_command_timeout, the
+        timeout network_cli left on the channel is restored after """
+        previous = shell.gettimeout()
+        shell.settimeout(self._connection.get_option("persistent_command_timeout"))
+        try:
+            yield
+        finally:
+            shell.settimeout(previous)
+
+    def _recv_chunk(self, shell, command):
+        try:
+            data = shell.recv(STREAM_CHUNK)
+        except socket.timeout:
+            raise AnsibleConnectionFailure(
+                "timeout value %s seconds reached while reading the response to: %s"
+                % (shell.gettimeout(), command)
+            )
+        if not data:
+            raise AnsibleConnectionFailure(
+                "connection closed while reading the response to: %s" % command
+            )
+        return data
+
+    def get_to_file(self, command, path):
+        """ writes the response of command to path on the controller
+
+        Only the size of the output travels back over the persistent
+        connection socket.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        size = 0
+        lines = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for line in self.iter_command(command):
+                    data = to_bytes(line, errors="surrogate_or_strict") + b"\n"
+                    f.write(data)
+                    size += len(data)
+                    lines += 1
+            os.rename(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+        return {"path": path, "bytes": size, "lines": lines}
+
     def get(self, command, prompt=None, answer=None, sendonly=False, newline=True, check_all=False):
         return self.send_command(command=command, prompt=prompt, answer=answer, sendonly=sendonly, newline=newline, check_all=check_all)
 
     def get_capabilities(self):
         result = super().get_capabilities()
+        result['rpc'] = result['rpc'] + ['reset_device_info', 'get_to_file', 'get_command_timing']
         return json.dumps(result)
 
     def get_device_operations(self):
@@ -154,6 +796,7 @@ class Cliconf(CliconfBase):
             "supports_diff_match": True,
             "supports_diff_ignore_lines": True,
             "supports_generate_diff": True,
+            # a copy to running-config merges, nothing replaces
             "supports_replace": False,
         }
 
@@ -32,14 +32,16 @@ __metaclass__ = type
 import json
 import re
 import tempfile
+import time
 
 from ansible.module_utils._text import to_text, to_native
 from ansible.module_utils.basic import env_fallback
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list, ComplexList
 from ansible.module_utils.connection import Connection, ConnectionError
 
-# copy of https://github.com/napalm-automation/napalm/blob/develop/napalm/base/canonical_map.py
-from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_canonical_map import base_interfaces
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_interface_names import (
+    canonical_interface_names,
+)
 
 _DEVICE_CONFIGS = {}
 
@@ -54,144 +56,232 @@ ciscosmb_provider_spec = {
 ciscosmb_argument_spec = {}
 
 
-def ciscosmb_split_to_tables(data):
-    TABLE_HEADER = re.compile(r"^---+ +-+.*$")
-    EMPTY_LINE = re.compile(r"^ *$")
+TABLE_HEADER_RE = re.compile(r"^---+ +-+")
+TABLE_COLUMN_GAP_RE = re.compile(r" +")
+_TABLE_COLUMNS = {}
+_TABLE_COLUMNS_MAX = 64
 
-    tables = dict()
-    tableno = -1
-    lineno = 0
-    tabledataget = False
+
+def ciscosmb_iter_tables(data):
+    """ yields (header, data lines) of every table in a command output
+
+    A table starts at its dashed header line and ends at an empty line.
+    """
+    header = None
+    lines = []
 
     for line in data.splitlines():
-        if re.match(EMPTY_LINE, line):
-            tabledataget = False
+        if not line.strip(" "):
+            if header is not None:
+                yield header, lines
+                header = None
+                lines = []
             continue
 
-        if re.match(TABLE_HEADER, line):
-            tableno += 1
-            tabledataget = True
-            lineno = 0
-            tables[tableno] = dict()
-            tables[tableno]["header"] = line
-            tables[tableno]["data"] = dict()
+        if TABLE_HEADER_RE.match(line):
+            if header is not None:
+                yield header, lines
+            header = line
+            lines = []
             continue
 
-        if tabledataget:
-            tables[tableno]["data"][lineno] = line
-            lineno += 1
-            continue
+        if header is not None:
+            lines.append(line)
 
-    return tables
+    if header is not None:
+        yield header, lines
 
 
-def ciscosmb_parse_table(table, allow_overflow=True, allow_empty_fields=None):
+def ciscosmb_table_columns(header):
+    """ slices of the columns, a column ends where a gap in the dashes starts
 
-    if allow_empty_fields is None:
-        allow_empty_fields = list()
+    Fields lengths are different device to device, so they are read from the
+    header, once per distinct header.
+    """
+    try:
+        return _TABLE_COLUMNS[header]
+    except KeyError:
+        pass
 
-    fields_end = __get_table_columns_end(table["header"])
-    data = __get_table_data(
-        table["data"], fields_end, allow_overflow, allow_empty_fields
+    ends = [m.start() for m in TABLE_COLUMN_GAP_RE.finditer(header.strip())]
+    # allow "long" last field
+    columns = tuple(
+        slice(start, end) for start, end in zip([0] + ends, ends + [None])
     )
 
-    return data
+    if len(_TABLE_COLUMNS) >= _TABLE_COLUMNS_MAX:
+        _TABLE_COLUMNS.clear()
+    _TABLE_COLUMNS[header] = columns
+    return columns
 
 
-def __get_table_columns_end(headerline):
-    """ fields length are diferent device to device, detect them on horizontal lin """
-    fields_end = [m.start() for m in re.finditer("  *", headerline.strip())]
-    # fields_position.insert(0,0)
-    # fields_end.append(len(headerline))
-    fields_end.append(10000)  # allow "long" last field
+def ciscosmb_iter_rows(table, allow_overflow=True, allow_empty_fields=None):
+    """ yields the rows of a (header, data lines) table as tuples of fields
 
-    return fields_end
+    With allow_overflow a line with an empty field, other than those in
+    allow_empty_fields, continues the cells of the row before it.
+    """
+    header, lines = table
+    columns = ciscosmb_table_columns(header)
+    required = None
+    if allow_empty_fields:
+        required = [n for n in range(len(columns)) if n not in allow_empty_fields]
 
+    pending = None
+    for line in lines:
+        fields = [line[column].strip() for column in columns]
 
-def __line_to_fields(line, fields_end):
-    """ dynamic fields lenghts """
-    line_elems = {}
-    index = 0
-    f_start = 0
-    for f_end in fields_end:
-        line_elems[index] = line[f_start:f_end].strip()
-        index += 1
-        f_start = f_end
+        if not allow_overflow:
+            yield tuple(fields)
+            continue
 
-    return line_elems
+        if pending is not None and (
+            "" in fields if required is None else not all(fields[n] for n in required)
+        ):
+            for n, field in enumerate(fields):
+                if field:
+                    pending[n] += field
+            continue
 
+        if pending is not None:
+            yield tuple(pending)
+        pending = fields
 
-def __get_table_data(
-    tabledata, fields_end, allow_overflow=True, allow_empty_fields=None
-):
+    if pending is not None:
+        yield tuple(pending)
 
-    if allow_empty_fields is None:
-        allow_empty_fields = list()
-    data = dict()
 
-    dataindex = 0
-    for lineno in tabledata:
-        owerflownfields = list()
-        owerflow = False
+def ciscosmb_split_to_tables(data):
+    """ tables of ciscosmb_iter_tables as {number: {header, data: {lineno: line}}} """
+    tables = dict()
+    for tableno, (header, lines) in enumerate(ciscosmb_iter_tables(data)):
+        tables[tableno] = {"header": header, "data": dict(enumerate(lines))}
+    return tables
 
-        line = tabledata[lineno]
-        line_elems = __line_to_fields(line, fields_end)
 
-        if allow_overflow:
-            # search for overflown fields
-            for elemno in line_elems:
-                if elemno not in allow_empty_fields and line_elems[elemno] == "":
-                    owerflow = True
-                else:
-                    owerflownfields.append(elemno)
+def ciscosmb_parse_table(table, allow_overflow=True, allow_empty_fields=None):
+    """ rows of ciscosmb_iter_rows as {rowno: {fieldno: field}} """
+    lines = [table["data"][lineno] for lineno in sorted(table["data"])]
+    rows = ciscosmb_iter_rows(
+        (table["header"], lines), allow_overflow, allow_empty_fields
+    )
+    return dict((rowno, dict(enumerate(row))) for rowno, row in enumerate(rows))
+
 
-            if owerflow:
-                # concat owerflown elements to previous data
-                for fieldno in owerflownfields:
-                    data[dataindex - 1][fieldno] += line_elems[fieldno]
+def ciscosmb_merge_dicts(a, b, path=None):
+    "merges b into a"
+    return ciscosmb_merge_all_dicts(a, [b], path)
 
-            else:
-                data[dataindex] = line_elems
-                dataindex += 1
-        else:
-            data[dataindex] = line_elems
-            dataindex += 1
 
-    return data
+def ciscosmb_merge_all_dicts(a, dicts, path=None):
+    """ merges every dict of dicts into a, in order
 
+    Nested dicts are merged without recursion, a leaf present on both sides
+    must be equal. The dotted path of a conflict is only put together when
+    one is raised, from the chain of parent entries on the stack.
+    """
+    stack = []
+    for b in dicts:
+        # is b empty?
+        if not b:
+            continue
 
-def ciscosmb_merge_dicts(a, b, path=None):
-    "merges b into a"
-    if path is None:
-        path = []
-
-    # is b empty?
-    if not bool(b):
-        return a
-
-    for key in b:
-        if key in a:
-            if isinstance(a[key], dict) and isinstance(b[key], dict):
-                ciscosmb_merge_dicts(a[key], b[key], path + [str(key)])
-            elif a[key] == b[key]:
-                pass  # same leaf value
-            else:
-                raise Exception("Conflict at %s" % ".".join(path + [str(key)]))
-        else:
-            a[key] = b[key]
+        stack.append((a, b, None, None))
+        while stack:
+            entry = stack.pop()
+            target, source = entry[0], entry[1]
+            for key in source:
+                value = source[key]
+                if key not in target:
+                    target[key] = value
+                    continue
+
+                current = target[key]
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if value:
+                        stack.append((current, value, key, entry))
+                elif current != value:
+                    raise Exception("Conflict at %s" % _merge_conflict_path(path, entry, key))
     return a
 
 
+def _merge_conflict_path(path, entry, key):
+    keys = [str(key)]
+    while entry[3] is not None:
+        keys.append(str(entry[2]))
+        entry = entry[3]
+    keys.extend(str(p) for p in reversed(path or []))
+    return ".".join(reversed(keys))
+
+
 def interface_canonical_name(interface):
-    iftype = interface.rstrip(r"/\0123456789. ")
-    ifno = interface[len(iftype):].lstrip()
+    return canonical_interface_names.normalize(interface)
 
-    if iftype in base_interfaces:
-        iftype = base_interfaces[iftype]
 
-    interface = iftype + str(ifno)
+def interface_short_name(interface):
+    return canonical_interface_names.short(interface)
 
-    return interface
+
+# cell converters a table schema refers to by name
+CISCOSMB_COLUMN_TYPES = {
+    "str": lambda value: value,
+    "lower": lambda value: value.lower(),
+    "int": int,
+    "kbit": lambda value: int(value) * 1000,  # Mb/s to get speed in kb
+    "interface": canonical_interface_names.normalize,
+}
+
+
+def _compile_table_schema(schema):
+    """ column names, indexes and converters resolved once per table """
+    types = CISCOSMB_COLUMN_TYPES
+    key_index, key_type = schema["key"]
+    columns = []
+    for column in schema["columns"]:
+        name, index, type_name = column[:3]
+        when = column[3] if len(column) > 3 else None
+        columns.append((name, index, types[type_name], when))
+    return (
+        key_index,
+        types[key_type],
+        tuple(columns),
+        frozenset(schema.get("null", ())),
+        schema.get("overflow", True),
+        schema.get("allow_empty_fields"),
+    )
+
+
+def ciscosmb_parse_records(data, schema):
+    """ yields (key, record) for every row of the tables a command prints
+
+    schema is a list with one entry per table, in output order::
+
+        {
+            "key": (0, "interface"),              # column and type of the key
+            "columns": [
+                ("state", 6, "lower"),            # name, column, type
+                ("bandwith", 3, "kbit", (6, "Up")),  # None unless column 6 is Up
+            ],
+            "null": ["--"],                       # cells that mean no value
+            "overflow": True,                     # see ciscosmb_iter_rows
+            "allow_empty_fields": None,
+        }
+
+    Tables the output has beyond the schema are skipped.
+    """
+    for table_schema, table in zip(schema, ciscosmb_iter_tables(data)):
+        key_index, key_type, columns, null, overflow, allow_empty_fields = (
+            _compile_table_schema(table_schema)
+        )
+        for row in ciscosmb_iter_rows(table, overflow, allow_empty_fields):
+            record = dict()
+            for name, index, convert, when in columns:
+                value = row[index]
+                if value in null or (when is not None and row[when[0]] != when[1]):
+                    record[name] = None
+                else:
+                    record[name] = convert(value)
+            yield key_type(row[key_index]), record
 
 
 def get_provider_argspec():
@@ -273,24 +363,50 @@ def to_commands(module, commands):
     return transform(commands)
 
 
+def ciscosmb_enable_timing(module):
+    """ from now on run_commands records where the time of each batch goes
+
+    The batches end up in module._ciscosmb_timing, each one with the
+    time of the whole call and the time on the device connection and
+    bytes received of every command in it.
+    """
+    module._ciscosmb_timing = list()
+    return module._ciscosmb_timing
+
+
+def _record_timing(module, connection, commands, started):
+    batch = {'wall_time': round(time.time() - started, 6), 'commands': None}
+    try:
+        batch['commands'] = connection.get_command_timing()
+    except ConnectionError:
+        pass
+    if not batch['commands'] or len(batch['commands']) != len(commands):
+        # connection without per command timing
+        batch['commands'] = [
+            {'command': to_text(cmd), 'wall_time': None, 'bytes': None} for cmd in commands
+        ]
+    module._ciscosmb_timing.append(batch)
+
+
 def run_commands(module, commands, check_rc=True):
-    responses = list()
+    """ one round trip to the persistent connection for the whole list """
+    commands = to_list(commands)
     connection = get_connection(module)
+    timing = getattr(module, '_ciscosmb_timing', None)
+    started = time.time()
 
-    for cmd in to_list(commands):
-        if isinstance(cmd, dict):
-            command = cmd['command']
-            prompt = cmd['prompt']
-            answer = cmd['answer']
-        else:
-            command = cmd
-            prompt = None
-            answer = None
+    try:
+        outputs = connection.run_commands(commands=commands, check_rc=check_rc)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors='surrogate_then_replace'))
 
-        try:
-            out = connection.get(command, prompt, answer)
-        except ConnectionError as exc:
-            module.fail_json(msg=to_text(exc, errors='surrogate_then_replace'))
+    responses = list()
+    for cmd, out in zip(commands, outputs):
+        if isinstance(out, dict):
+            # check_rc=False, None for the callers to skip the command
+            module.warn(u'command %s failed: %s' % (to_text(cmd), out['error']))
+            responses.append(None)
+            continue
 
         try:
             out = to_text(out, errors='surrogate_or_strict')
@@ -300,4 +416,7 @@ def run_commands(module, commands, check_rc=True):
 
         responses.append(out)
 
+    if timing is not None:
+        _record_timing(module, connection, commands, started)
+
     return responses
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Interface name normalization shared by the facts parsers and the config
+classes of the collection.
+
+Names are split once into type and number, the type is looked up in a table
+compiled when the module is imported and the result is kept in a bounded
+cache, tables repeat the same few hundred port names on every run.
+
+Every consumer keeps its own table and so its own spelling, the facts of
+the napalm canonical map, the ios resource modules of IOS_INTERFACE_TYPES.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+
+# copy of https://github.com/napalm-automation/napalm/blob/develop/napalm/base/canonical_map.py
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_canonical_map import (
+    base_interfaces,
+    reverse_mapping,
+)
+
+# characters an interface number is made of, stripped off the end of a name
+INTERFACE_NUMBER_CHARS = "/\\0123456789.: "
+
+# (lower case prefix, type, short type) of the types the ios resource
+# modules know, any name starting with the prefix is of the type
+IOS_INTERFACE_TYPES = (
+    ("gi", "GigabitEthernet", "Gi"),
+    ("twe", "TwentyFiveGigE", "Twe"),
+    ("tw", "TwoGigabitEthernet", "Tw"),
+    ("te", "TenGigabitEthernet", "Te"),
+    ("fa", "FastEthernet", "Fa"),
+    ("fo", "FortyGigabitEthernet", "Fo"),
+    ("lon", "LongReachEthernet", "Lon"),
+    ("et", "Ethernet", "Et"),
+    ("vl", "Vlan", "Vl"),
+    ("lo", "loopback", "Lo"),
+    ("po", "Port-channel", "Po"),
+    ("nv", "nve", "nv"),
+    ("hu", "HundredGigE", "Hu"),
+    ("virtual-te", "Virtual-Template", "Vt"),
+    ("tu", "Tunnel", "Tu"),
+    ("se", "Serial", "Se"),
+)
+
+INTERFACE_NAMES_CACHE_MAX = 4096
+
+
+class InterfaceNames(object):
+    """ normalizes interface names by a table of types
+
+    names maps the exact (case sensitive) type as written to its canonical
+    type, prefixes are (lower case prefix, type, short type) tuples matched
+    case insensitively, the longest prefix wins. short_names maps canonical
+    types to the abbreviation short() returns.
+
+    A name of an unknown type keeps its type as written, like every name
+    it loses the blanks between type and number.
+    """
+
+    def __init__(self, names=None, prefixes=(), short_names=None, cache_size=INTERFACE_NAMES_CACHE_MAX):
+        self._names = dict(names or {})
+        self._short_names = dict(short_names or {})
+        self._prefixes = {}
+        for prefix, iftype, short in prefixes:
+            self._prefixes[prefix] = iftype
+            self._short_names.setdefault(iftype, short)
+
+        self._prefix_re = None
+        if self._prefixes:
+            # longest first, the alternation takes the first branch that matches
+            alternation = "|".join(
+                re.escape(prefix) for prefix in sorted(self._prefixes, key=len, reverse=True)
+            )
+            self._prefix_re = re.compile("(?:%s)" % alternation, re.I)
+
+        self._cache_size = cache_size
+        self._cache = {}
+        self._short_cache = {}
+        self._type_cache = {}
+
+    def split(self, name):
+        """ (type as written, number) of an interface name """
+        iftype = name.rstrip(INTERFACE_NUMBER_CHARS)
+        return iftype, name[len(iftype):].strip()
+
+    def type(self, name):
+        """ canonical type of the name, None when it is not known """
+        try:
+            return self._type_cache[name]
+        except KeyError:
+            pass
+
+        written = self.split(name)[0]
+        iftype = self._names.get(written)
+        if iftype is None and self._prefix_re is not None:
+            match = self._prefix_re.match(written)
+            if match:
+                iftype = self._prefixes[match.group().lower()]
+        self._remember(self._type_cache, name, iftype)
+        return iftype
+
+    def normalize(self, name):
+        """ canonical interface name, "gi1/0/1" to "GigabitEthernet1/0/1" """
+        if not name:
+            return name
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        written, number = self.split(name)
+        normalized = (self.type(name) or written) + number
+        self._remember(self._cache, name, normalized)
+        return normalized
+
+    def normalize_all(self, names):
+        """ list of the canonical names of names, in order """
+        cache = self._cache
+        normalize = self.normalize
+        return [cache[name] if name in cache else normalize(name) for name in names]
+
+    def short(self, name):
+        """ abbreviated interface name, "GigabitEthernet1/0/1" to "Gi1/0/1" """
+        if not name:
+            return name
+        try:
+            return self._short_cache[name]
+        except KeyError:
+            pass
+
+        written, number = self.split(name)
+        short = self._short_names.get(self.type(name))
+        abbreviated = (short or written) + number
+        self._remember(self._short_cache, name, abbreviated)
+        return abbreviated
+
+    def short_all(self, names):
+        """ list of the abbreviated names of names, in order """
+        return [self.short(name) for name in names]
+
+    def _remember(self, cache, name, value):
+        if len(cache) >= self._cache_size:
+            cache.clear()
+        cache[name] = value
+
+
+# names as in the napalm canonical map, used by the ciscosmb modules
+canonical_interface_names = InterfaceNames(names=base_interfaces, short_names=reverse_mapping)
+
+# names as the ios resource modules write them
+ios_interface_names = InterfaceNames(prefixes=IOS_INTERFACE_TYPES)
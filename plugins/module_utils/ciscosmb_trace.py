@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Parse trace of the collection, off unless ANSIBLE_CISCOSMB_TRACE names a
+file on the controller.
+
+Records are JSON objects, one per line, kept in memory and appended to the
+file in batches and when the module exits. Parsers guard their calls with
+``if ciscosmb_trace.enabled:`` so a disabled trace costs an attribute test.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import atexit
+import json
+import os
+import time
+
+TRACE_ENV = "ANSIBLE_CISCOSMB_TRACE"
+# records held before they are written
+TRACE_BUFFER = 256
+
+
+class Trace(object):
+    """ buffered JSON lines sink, disabled without a path """
+
+    def __init__(self, path=None, buffer_size=TRACE_BUFFER):
+        self.path = path
+        self.enabled = bool(path)
+        self.buffer_size = buffer_size
+        self._records = []
+
+    def record(self, source, **fields):
+        """ keeps a record of source (the parser) with fields """
+        if not self.enabled:
+            return
+        fields["source"] = source
+        fields["time"] = time.time()
+        fields["pid"] = os.getpid()
+        self._records.append(fields)
+        if len(self._records) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """ appends the records kept to the file, a failure turns the trace off """
+        if not self._records:
+            return
+        records, self._records = self._records, []
+        try:
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(record, default=str) + "\n" for record in records))
+        except (IOError, OSError):
+            self.enabled = False
+
+
+def trace_from_environment():
+    trace = Trace(os.environ.get(TRACE_ENV))
+    if trace.enabled:
+        atexit.register(trace.flush)
+    return trace
+
+
+ciscosmb_trace = trace_from_environment()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Set of VLAN ids kept as the bits of one integer, bit N set for VLAN N.
+
+A trunk allowing 1-4094 is one 4095 bit integer rather than 4094 strings,
+union and difference are single integer operations and the set renders
+back to the range list the CLI takes, e.g. ``1-10,20,30-40``.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils.six import integer_types, string_types
+
+VLAN_MIN = 1
+VLAN_MAX = 4094
+
+
+class VlanSet(object):
+    """ set of VLAN ids, parse with from_ranges and render with ranges """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits=0):
+        self.bits = bits
+
+    @classmethod
+    def from_ranges(cls, items):
+        """ set of the VLANs of a list of ids and ranges, ``["1-10", "20"]``,
+        or of a CLI range list, ``"1-10,20"``; ValueError for an id out of
+        1-4094 or a range whose end is not above its start
+        """
+        if isinstance(items, string_types + integer_types):
+            items = [items]
+        bits = 0
+        for item in items:
+            if isinstance(item, integer_types):
+                bits |= cls._range_bits(item, item)
+                continue
+            for part in item.split(","):
+                part = part.strip()
+                if not part:
+                    continue
+                if "-" in part:
+                    low, high = part.split("-", 1)
+                    low, high = int(low), int(high)
+                    if low >= high:
+                        raise ValueError("end of range not larger than the start of range: %s" % part)
+                else:
+                    low = high = int(part)
+                bits |= cls._range_bits(low, high)
+        return cls(bits)
+
+    @staticmethod
+    def _range_bits(low, high):
+        if low < VLAN_MIN or high > VLAN_MAX:
+            raise ValueError("VLAN id out of range %d-%d: %d-%d" % (VLAN_MIN, VLAN_MAX, low, high))
+        return ((1 << (high - low + 1)) - 1) << low
+
+    def ranges(self):
+        """ the set as a list of ids and ranges, ``["1-10", "20"]`` """
+        result = []
+        bits = self.bits
+        while bits:
+            low = (bits & -bits).bit_length() - 1
+            run = bits >> low
+            # number of trailing ones of run
+            length = (run ^ (run + 1)).bit_length() - 1
+            high = low + length - 1
+            result.append(str(low) if low == high else "%d-%d" % (low, high))
+            bits &= ~(((1 << length) - 1) << low)
+        return result
+
+    def __str__(self):
+        return ",".join(self.ranges())
+
+    def __repr__(self):
+        return "VlanSet(%r)" % str(self)
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __len__(self):
+        return bin(self.bits).count("1")
+
+    def __contains__(self, vlan):
+        return VLAN_MIN <= vlan <= VLAN_MAX and bool(self.bits >> vlan & 1)
+
+    def __bool__(self):
+        return bool(self.bits)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return isinstance(other, VlanSet) and self.bits == other.bits
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __or__(self, other):
+        return VlanSet(self.bits | other.bits)
+
+    def __and__(self, other):
+        return VlanSet(self.bits & other.bits)
+
+    def __sub__(self, other):
+        return VlanSet(self.bits & ~other.bits)
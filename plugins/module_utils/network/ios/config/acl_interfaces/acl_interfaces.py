@@ -25,6 +25,7 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.fac
 )
 from ansible.module_utils.six import iteritems
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
+    pair_by_name,
     remove_duplicate_interface,
     normalize_interface,
 )
@@ -168,11 +169,8 @@ class Acl_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 continue
             commands.extend(self._clear_config(interface, each, "replaced"))
             commands.extend(self._set_config(interface, each))
@@ -191,11 +189,8 @@ class Acl_Interfaces(ConfigBase):
         """
         commands = []
 
-        for each in have:
-            for interface in want:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for each, interface in pair_by_name(have, want):
+            if interface is None:
                 # We didn't find a matching desired state, which means we can
                 # pretend we recieved an empty desired state.
                 interface = dict(name=each["name"])
@@ -218,11 +213,8 @@ class Acl_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 # configuring non-existing interface
                 commands.extend(self._set_config(interface, dict()))
                 continue
@@ -241,11 +233,8 @@ class Acl_Interfaces(ConfigBase):
         commands = []
 
         if want:
-            for interface in want:
-                for each in have:
-                    if each["name"] == interface["name"]:
-                        break
-                else:
+            for interface, each in pair_by_name(want, have):
+                if each is None:
                     continue
                 commands.extend(self._clear_config(interface, each))
         else:
@@ -35,6 +35,8 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
 )
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     filter_dict_having_none_value,
+    index_by_name,
+    pair_by_name,
     remove_duplicate_interface,
 )
 
@@ -179,13 +181,10 @@ class Interfaces(ConfigBase):
         """
         commands = []
 
+        have_index = index_by_name(have)
         for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-                if interface["name"] in each["name"]:
-                    break
-            else:
+            each = self._find_interface(interface["name"], have_index, have)
+            if each is None:
                 # configuring non-existing interface
                 commands.extend(self._set_config(interface, dict()))
                 continue
@@ -208,15 +207,13 @@ class Interfaces(ConfigBase):
         """
         commands = []
 
+        want_index = index_by_name(want)
+        configured = set()
         for each in have:
-            for interface in want:
-                count = 0
-                if each["name"] == interface["name"]:
-                    break
-                if interface["name"] in each["name"]:
-                    break
-                count += 1
-            else:
+            interface = want_index.get(each["name"])
+            if interface is None:
+                interface = self._find_partial(each["name"], want)
+            if interface is None:
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
@@ -225,15 +222,15 @@ class Interfaces(ConfigBase):
             have_dict = filter_dict_having_none_value(interface, each)
             commands.extend(self._clear_config(dict(), have_dict))
             commands.extend(self._set_config(interface, each))
-            # as the pre-existing interface are now configured by
-            # above set_config call, deleting the respective
-            # interface entry from the want list
-            del want[count]
+            # the pre-existing interface is now configured by the
+            # above set_config call
+            configured.add(id(interface))
 
-        # Iterating through want list which now only have new interfaces to be
-        # configured
+        # Iterating through the rest of want which only has new interfaces to
+        # be configured
         for each in want:
-            commands.extend(self._set_config(each, dict()))
+            if id(each) not in configured:
+                commands.extend(self._set_config(each, dict()))
         # Remove the duplicate interface call
         commands = remove_duplicate_interface(commands)
 
@@ -250,11 +247,8 @@ class Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 # configuring non-existing interface
                 commands.extend(self._set_config(interface, dict()))
                 continue
@@ -275,11 +269,8 @@ class Interfaces(ConfigBase):
         commands = []
 
         if want:
-            for interface in want:
-                for each in have:
-                    if each["name"] == interface["name"]:
-                        break
-                else:
+            for interface, each in pair_by_name(want, have):
+                if each is None:
                     continue
                 interface = dict(name=interface["name"])
                 commands.extend(self._clear_config(interface, each))
@@ -290,6 +281,24 @@ class Interfaces(ConfigBase):
 
         return commands
 
+    def _find_interface(self, name, have_index, have):
+        """ The interface of have named name, or else the first one whose
+        name contains it
+        """
+        if name in have_index:
+            return have_index[name]
+        for each in have:
+            if name in each["name"]:
+                return each
+        return None
+
+    def _find_partial(self, name, want):
+        """ The first interface of want whose name is part of name """
+        for interface in want:
+            if interface["name"] in name:
+                return interface
+        return None
+
     def _set_config(self, want, have):
         # Set the interface config based on the want and have config
         commands = []
@@ -24,6 +24,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.facts.facts import (
     Facts,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VlanSet,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     dict_to_set,
     normalize_interface,
@@ -34,6 +37,7 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
 )
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     filter_dict_having_none_value,
+    pair_by_name,
     remove_duplicate_interface,
 )
 
@@ -56,6 +60,8 @@ class L2_Interfaces(ConfigBase):
         "native_vlan": "switchport trunk native vlan",
         "allowed_vlans": "switchport trunk allowed vlan",
         "allowed_vlans_add": "switchport trunk allowed vlan add",
+        "allowed_vlans_remove": "switchport trunk allowed vlan remove",
+        "pruning_vlans_remove": "switchport trunk pruning vlan remove",
     }
 
     def get_l2_interfaces_facts(self, data=None):
@@ -183,11 +189,8 @@ class L2_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
             commands.extend(self._clear_config(dict(), have_dict))
@@ -207,11 +210,8 @@ class L2_Interfaces(ConfigBase):
         """
         commands = []
 
-        for each in have:
-            for interface in want:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for each, interface in pair_by_name(have, want):
+            if interface is None:
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
@@ -236,11 +236,8 @@ class L2_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 # configuring non-existing interface
                 commands.extend(self._set_config(interface, dict(), module))
                 continue
@@ -260,11 +257,8 @@ class L2_Interfaces(ConfigBase):
         commands = []
 
         if want:
-            for interface in want:
-                for each in have:
-                    if each["name"] == interface["name"]:
-                        break
-                else:
+            for interface, each in pair_by_name(want, have):
+                if each is None:
                     continue
                 interface = dict(name=interface["name"])
                 commands.extend(self._clear_config(interface, each))
@@ -275,55 +269,54 @@ class L2_Interfaces(ConfigBase):
 
         return commands
 
-    def _check_for_correct_vlan_range(self, vlan, module):
-        # Function to check if the VLAN range passed is Valid
-        for each in vlan:
-            vlan_range = each.split("-")
-            if len(vlan_range) > 1:
-                if int(vlan_range[0]) < int(vlan_range[1]):
-                    return True
-                else:
-                    module.fail_json(
-                        msg="Command rejected: Bad VLAN list - end of range not larger than the"
-                        " start of range!"
-                    )
-            else:
-                return True
-
-    def _expand_vlan_range_if_any(self, param_type, vlan):
-        temp = []
-        check = False
-        for each in vlan:
-            if "-" in each and param_type == "have":
-                l, h = map(int, each.split("-"))
-                temp.extend([str(e) for e in range(l, h + 1)])
-            elif "-" in each and param_type == "want":
-                check = True
-                temp.append(each)
-            else:
-                temp.append(each)
-        return check, temp
+    def _vlan_set(self, vlans, module):
+        # the VLANs of a list of VLAN ids and ranges
+        try:
+            return VlanSet.from_ranges(vlans)
+        except ValueError as exc:
+            module.fail_json(msg="Command rejected: Bad VLAN list - {0}!".format(exc))
+
+    def _set_trunk_vlans(self, interface, key, want_vlans, have_vlans, commands):
+        # Set allowed or pruning vlans by the difference of want and have,
+        # merged only adds, replaced and overridden also remove
+        if have_vlans is None:
+            cmd = self.trunk_cmds[key] + " {0}".format(want_vlans)
+            add_command_to_config_list(interface, cmd, commands)
+            return
+        add = want_vlans - have_vlans
+        if add:
+            cmd = self.trunk_cmds[key + "_add"] + " {0}".format(add)
+            add_command_to_config_list(interface, cmd, commands)
+        if self.state != "merged":
+            remove = have_vlans - want_vlans
+            if remove:
+                cmd = self.trunk_cmds[key + "_remove"] + " {0}".format(remove)
+                add_command_to_config_list(interface, cmd, commands)
 
     def _set_config(self, want, have, module):
         # Set the interface config based on the want and have config
         commands = []
         interface = "interface " + want["name"]
 
-        # expand a have allowed and pruning vlan if any
-        if have.get("trunk") and want.get("trunk"):
-            for each in ["allowed_vlans", "pruning_vlans"]:
-                if have["trunk"].get(each) and want["trunk"].get(each):
-                    check, want["trunk"][
-                        each
-                    ] = self._expand_vlan_range_if_any(
-                        "want", want["trunk"][each]
-                    )
-                    if not check:
-                        check, have["trunk"][
-                            each
-                        ] = self._expand_vlan_range_if_any(
-                            "have", have["trunk"][each]
-                        )
+        # the allowed and pruning vlans are compared as sets, not by the
+        # rest of the trunk diff
+        vlan_sets = []
+        if want.get("trunk"):
+            want = dict(want, trunk=dict(want["trunk"]))
+            have_trunk = dict(have.get("trunk") or {})
+            if have.get("trunk"):
+                have = dict(have, trunk=have_trunk)
+            for each in ("allowed_vlans", "pruning_vlans"):
+                want_vlans = want["trunk"].pop(each, None)
+                have_vlans = have_trunk.pop(each, None)
+                if want_vlans:
+                    want_vlans = self._vlan_set(want_vlans, module)
+                    if have_vlans:
+                        have_vlans = self._vlan_set(have_vlans, module)
+                    else:
+                        have_vlans = None
+                    if want_vlans != have_vlans:
+                        vlan_sets.append((each, want_vlans, have_vlans))
 
         # Get the diff b/w want and have
         want_dict = dict_to_set(want)
@@ -337,6 +330,7 @@ class L2_Interfaces(ConfigBase):
         else:
             diff = want_dict - have_dict
 
+        mode = None
         if diff:
             diff = dict(diff)
             mode = diff.get("mode")
@@ -366,60 +360,14 @@ class L2_Interfaces(ConfigBase):
                         diff.get("native_vlan")
                     )
                     add_command_to_config_list(interface, cmd, commands)
-                allowed_vlans = diff.get("allowed_vlans")
-                pruning_vlans = diff.get("pruning_vlans")
-
-                if allowed_vlans and self._check_for_correct_vlan_range(
-                    allowed_vlans, module
-                ):
-                    diff = None
-                    if self.state == "merged":
-                        have_trunk = have.get("trunk")
-                        if have_trunk and have_trunk.get("allowed_vlans"):
-                            have_allowed_vlans = have_trunk.get(
-                                "allowed_vlans"
-                            )
-                            allowed_vlans = list(allowed_vlans)
-                            diff = set(allowed_vlans).difference(
-                                set(have_allowed_vlans)
-                            )
-                            allowed_vlans = list(diff) if diff else tuple()
-                    allowed_vlans = ",".join(allowed_vlans)
-                    if allowed_vlans:
-                        trunk_cmd = (
-                            self.trunk_cmds["allowed_vlans_add"]
-                            if self.state == "merged" and diff
-                            else self.trunk_cmds["allowed_vlans"]
-                        )
-                        cmd = trunk_cmd + " {0}".format(allowed_vlans)
-                        add_command_to_config_list(interface, cmd, commands)
-                if pruning_vlans and self._check_for_correct_vlan_range(
-                    pruning_vlans, module
-                ):
-                    diff = None
-                    if self.state == "merged":
-                        have_trunk = have.get("trunk")
-                        if have_trunk and have_trunk.get("pruning_vlans"):
-                            have_pruning_vlans = have_trunk.get(
-                                "pruning_vlans"
-                            )
-                            pruning_vlans = list(pruning_vlans)
-                            diff = set(pruning_vlans).difference(
-                                set(have_pruning_vlans)
-                            )
-                            pruning_vlans = list(diff) if diff else tuple()
-                    pruning_vlans = ",".join(pruning_vlans)
-                    if pruning_vlans:
-                        trunk_cmd = (
-                            self.trunk_cmds["pruning_vlans_add"]
-                            if self.state == "merged" and diff
-                            else self.trunk_cmds["pruning_vlans"]
-                        )
-                        cmd = trunk_cmd + " {0}".format(pruning_vlans)
-                        add_command_to_config_list(interface, cmd, commands)
-            if mode:
-                cmd = "switchport mode {0}".format(mode)
-                add_command_to_config_list(interface, cmd, commands)
+
+        for each, want_vlans, have_vlans in vlan_sets:
+            self._set_trunk_vlans(
+                interface, each, want_vlans, have_vlans, commands
+            )
+        if mode:
+            cmd = "switchport mode {0}".format(mode)
+            add_command_to_config_list(interface, cmd, commands)
 
         return commands
 
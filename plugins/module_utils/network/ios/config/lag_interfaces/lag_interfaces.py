@@ -35,6 +35,7 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
     normalize_interface,
 )
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
+    pair_by_name,
     remove_duplicate_interface,
 )
 
@@ -174,35 +175,26 @@ class Lag_interfaces(ConfigBase):
         """
         commands = []
 
+        names, members = self._index_have(have)
         for interface in want:
             for each_interface in interface.get("members"):
-                for each in have:
-                    if each.get("members"):
-                        for every in each.get("members"):
-                            match = False
-                            if every["member"] == each_interface["member"]:
-                                match = True
-                                break
-                            continue
-                        if match:
-                            have_dict = self.filter_dict_having_none_value(
-                                interface, each
-                            )
-                            commands.extend(
-                                self._clear_config(dict(), have_dict)
-                            )
-                            commands.extend(
-                                self._set_config(interface, each, module)
-                            )
-                    elif each.get("name") == each_interface["member"]:
-                        have_dict = self.filter_dict_having_none_value(
-                            interface, each
-                        )
-                        commands.extend(self._clear_config(dict(), have_dict))
-                        commands.extend(
-                            self._set_config(interface, each, module)
-                        )
-                        break
+                member = each_interface["member"]
+                named = names.get(member)
+                # the port-channels having the member ahead of the member
+                # interface itself, then the interface
+                matches = [
+                    each
+                    for position, each in members.get(member, [])
+                    if named is None or position < named[0]
+                ]
+                if named is not None:
+                    matches.append(named[1])
+                for each in matches:
+                    have_dict = self.filter_dict_having_none_value(
+                        interface, each
+                    )
+                    commands.extend(self._clear_config(dict(), have_dict))
+                    commands.extend(self._set_config(interface, each, module))
         # Remove the duplicate interface call
         commands = remove_duplicate_interface(commands)
 
@@ -266,22 +258,17 @@ class Lag_interfaces(ConfigBase):
         """
         commands = []
 
+        names = self._index_have(have)[0]
         for interface in want:
             for each_interface in interface.get("members"):
-                for each in have:
-                    if each.get("members"):
-                        for every in each.get("members"):
-                            if every["member"] == each_interface["member"]:
-                                break
-                    elif each.get("name") == each_interface["member"]:
-                        break
-                else:
+                named = names.get(each_interface["member"])
+                if named is None:
                     if self.state == "rendered":
                         commands.extend(
                             self._set_config(interface, dict(), module)
                         )
                     continue
-                commands.extend(self._set_config(interface, each, module))
+                commands.extend(self._set_config(interface, named[1], module))
 
         return commands
 
@@ -295,11 +282,8 @@ class Lag_interfaces(ConfigBase):
         commands = []
 
         if want:
-            for interface in want:
-                for each in have:
-                    if each.get("name") == interface["name"]:
-                        break
-                else:
+            for interface, each in pair_by_name(want, have):
+                if each is None:
                     continue
                 commands.extend(self._clear_config(interface, each))
         else:
@@ -308,6 +292,21 @@ class Lag_interfaces(ConfigBase):
 
         return commands
 
+    def _index_have(self, have):
+        """ Index have by member: the interfaces without members by name,
+        the port-channels by each of their members, with their position in
+        have so lookups keep the order of a scan
+        """
+        names = {}
+        members = {}
+        for position, each in enumerate(have):
+            if each.get("members"):
+                for member in set(every["member"] for every in each["members"]):
+                    members.setdefault(member, []).append((position, each))
+            else:
+                names.setdefault(each.get("name"), (position, each))
+        return names, members
+
     def filter_dict_having_none_value(self, want, have):
         # Generate dict with have dict value which is None in want dict
         test_dict = dict()
@@ -35,6 +35,7 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
 )
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     filter_dict_having_none_value,
+    pair_by_name,
     remove_duplicate_interface,
 )
 
@@ -176,11 +177,8 @@ class Lldp_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
             commands.extend(self._clear_config(dict(), have_dict))
@@ -199,11 +197,8 @@ class Lldp_Interfaces(ConfigBase):
         """
         commands = []
 
-        for each in have:
-            for interface in want:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+        for each, interface in pair_by_name(have, want):
+            if interface is None:
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
@@ -226,11 +221,8 @@ class Lldp_Interfaces(ConfigBase):
         """
         commands = []
 
-        for interface in want:
-            for each in have:
-                if interface["name"] == each["name"]:
-                    break
-            else:
+        for interface, each in pair_by_name(want, have):
+            if each is None:
                 if self.state == "rendered":
                     commands.extend(self._set_config(interface, dict()))
                 continue
@@ -248,11 +240,8 @@ class Lldp_Interfaces(ConfigBase):
         commands = []
 
         if want:
-            for interface in want:
-                for each in have:
-                    if each["name"] == interface["name"]:
-                        break
-                else:
+            for interface, each in pair_by_name(want, have):
+                if each is None:
                     continue
                 interface = dict(name=interface["name"])
                 commands.extend(self._clear_config(interface, each))
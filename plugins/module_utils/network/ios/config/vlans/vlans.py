@@ -28,6 +28,11 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.fac
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     dict_to_set,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VLAN_MAX,
+    VLAN_MIN,
+    VlanSet,
+)
 
 
 class Vlans(ConfigBase):
@@ -136,6 +141,13 @@ class Vlans(ConfigBase):
                     self.state
                 )
             )
+        for each in want or []:
+            if not VLAN_MIN <= each["vlan_id"] <= VLAN_MAX:
+                self._module.fail_json(
+                    msg="vlan_id {0} is out of range {1}-{2}".format(
+                        each["vlan_id"], VLAN_MIN, VLAN_MAX
+                    )
+                )
 
         if self.state == "overridden":
             commands = self._state_overridden(want, have)
@@ -154,21 +166,13 @@ class Vlans(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
-
-        check = False
+        have_index = self._index_by_vlan_id(have)
+        blocks = []
         for each in want:
-            for every in have:
-                if every["vlan_id"] == each["vlan_id"]:
-                    check = True
-                    break
-                continue
-            if check:
-                commands.extend(self._set_config(each, every))
-            else:
-                commands.extend(self._set_config(each, dict()))
+            every = have_index.get(each["vlan_id"], dict())
+            blocks.append((each["vlan_id"], self._set_config(each, every)))
 
-        return commands
+        return self._group_ranges(blocks)
 
     def _state_overridden(self, want, have):
         """ The command generator when state is overridden
@@ -177,32 +181,24 @@ class Vlans(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
-
-        want_local = want
+        want_index = self._index_by_vlan_id(want)
+        blocks = []
         for each in have:
-            count = 0
-            for every in want_local:
-                if each["vlan_id"] == every["vlan_id"]:
-                    break
-                count += 1
-            else:
+            every = want_index.pop(each["vlan_id"], None)
+            if every is None:
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
-                commands.extend(self._clear_config(every, each))
+                blocks.append((each["vlan_id"], self._clear_config(dict(), each)))
                 continue
-            commands.extend(self._set_config(every, each))
-            # as the pre-existing VLAN are now configured by
-            # above set_config call, deleting the respective
-            # VLAN entry from the want_local list
-            del want_local[count]
+            blocks.append((each["vlan_id"], self._set_config(every, each)))
 
-        # Iterating through want_local list which now only have new VLANs to be
-        # configured
-        for each in want_local:
-            commands.extend(self._set_config(each, dict()))
+        # the VLANs of want left are new VLANs to be configured
+        for each in want:
+            every = want_index.pop(each["vlan_id"], None)
+            if every is not None:
+                blocks.append((each["vlan_id"], self._set_config(every, dict())))
 
-        return commands
+        return self._group_ranges(blocks)
 
     def _state_merged(self, want, have):
         """ The command generator when state is merged
@@ -211,21 +207,13 @@ class Vlans(ConfigBase):
         :returns: the commands necessary to merge the provided into
                   the current configuration
         """
-        commands = []
-
-        check = False
+        have_index = self._index_by_vlan_id(have)
+        blocks = []
         for each in want:
-            for every in have:
-                if each.get("vlan_id") == every.get("vlan_id"):
-                    check = True
-                    break
-                continue
-            if check:
-                commands.extend(self._set_config(each, every))
-            else:
-                commands.extend(self._set_config(each, dict()))
+            every = have_index.get(each.get("vlan_id"), dict())
+            blocks.append((each.get("vlan_id"), self._set_config(each, every)))
 
-        return commands
+        return self._group_ranges(blocks)
 
     def _state_deleted(self, want, have):
         """ The command generator when state is deleted
@@ -234,24 +222,52 @@ class Vlans(ConfigBase):
         :returns: the commands necessary to remove the current configuration
                   of the provided objects
         """
-        commands = []
+        blocks = []
 
         if want:
-            check = False
+            have_index = self._index_by_vlan_id(have)
             for each in want:
-                for every in have:
-                    if each.get("vlan_id") == every.get("vlan_id"):
-                        check = True
-                        break
-                    check = False
-                    continue
-                if check:
-                    commands.extend(self._clear_config(each, every))
+                every = have_index.get(each.get("vlan_id"))
+                if every is not None:
+                    blocks.append((every["vlan_id"], self._clear_config(each, every)))
         else:
             for each in have:
-                commands.extend(self._clear_config(dict(), each))
+                blocks.append((each["vlan_id"], self._clear_config(dict(), each)))
 
-        return commands
+        return self._group_ranges(blocks)
+
+    def _index_by_vlan_id(self, vlans):
+        # the VLANs by id, the first entry of an id wins
+        index = {}
+        for each in vlans:
+            index.setdefault(each.get("vlan_id"), each)
+        return index
+
+    def _group_ranges(self, blocks):
+        """ Join the commands of every VLAN, the VLANs which are only
+        created or only removed grouped into one range command each
+
+        :param blocks: (vlan_id, commands) of every VLAN
+        :rtype: A list
+        :returns: the commands
+        """
+        created = []
+        removed = []
+        commands = []
+        for vlan_id, block in blocks:
+            if block == ["vlan {0}".format(vlan_id)]:
+                created.append(vlan_id)
+            elif block == ["no vlan {0}".format(vlan_id)]:
+                removed.append(vlan_id)
+            else:
+                commands.extend(block)
+
+        ranges = []
+        if removed:
+            ranges.append("no vlan {0}".format(VlanSet.from_ranges(removed)))
+        if created:
+            ranges.append("vlan {0}".format(VlanSet.from_ranges(created)))
+        return ranges + commands
 
     def remove_command_from_config_list(self, vlan, cmd, commands):
         if vlan not in commands and cmd != "vlan":
@@ -340,6 +356,10 @@ class Vlans(ConfigBase):
         ):
             negate_have_config(diff, have_diff, vlan, commands)
 
+        if not have and vlan not in commands:
+            # a new VLAN is created even without settings
+            commands.insert(0, vlan)
+
         return commands
 
     def _clear_config(self, want, have):
@@ -24,9 +24,15 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     get_interface_type,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.acl_interfaces.acl_interfaces import (
     Acl_InterfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Acl_InterfacesFacts(object):
@@ -48,8 +54,8 @@ class Acl_InterfacesFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_acl_interfaces_data(self, connection):
-        return connection.get(
-            "sh running-config | include interface|ip access-group|ipv6 traffic-filter"
+        return get_running_config(self._module, connection).include(
+            "interface", "ip access-group", "ipv6 traffic-filter"
         )
 
     def populate_facts(self, connection, ansible_facts, data=None):
@@ -96,6 +102,8 @@ class Acl_InterfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("acl_interfaces", section=conf)
         match = re.search(r"^(\S+)", conf)
         intf = match.group(1)
 
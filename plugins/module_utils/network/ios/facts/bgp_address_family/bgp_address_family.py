@@ -21,6 +21,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.bgp_address_family import (
     Bgp_address_familyTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.bgp_address_family.bgp_address_family import (
     Bgp_address_familyArgs,
 )
@@ -35,7 +38,9 @@ class Bgp_address_familyFacts(object):
         self.argument_spec = Bgp_address_familyArgs.argument_spec
 
     def get_bgp_address_family_data(self, connection):
-        return connection.get("sh running-config | section ^router bgp")
+        return get_running_config(self._module, connection).section(
+            "router bgp"
+        )
 
     def _process_facts(self, objs):
         """ makes data as per the facts after data obtained from parsers
@@ -20,6 +20,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.bgp_global import (
     Bgp_globalTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.bgp_global.bgp_global import (
     Bgp_globalArgs,
 )
@@ -34,7 +37,9 @@ class Bgp_globalFacts(object):
         self.argument_spec = Bgp_globalArgs.argument_spec
 
     def get_bgp_global_data(self, connection):
-        return connection.get("sh running-config | section ^router bgp")
+        return get_running_config(self._module, connection).section(
+            "router bgp"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for Bgp_global network resource
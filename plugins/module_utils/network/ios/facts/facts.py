@@ -17,6 +17,9 @@ __metaclass__ = type
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    RunningConfig,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.facts.interfaces.interfaces import (
     InterfacesFacts,
 )
@@ -137,14 +140,20 @@ class Facts(FactsBase):
         :rtype: dict
         :return: the facts gathered
         """
-        if self.VALID_RESOURCE_SUBSETS:
-            self.get_network_resources_facts(
-                FACT_RESOURCE_SUBSETS, resource_facts_type, data
-            )
+        # all resource facts classes of this run share one running-config
+        # download, the next run (e.g. after a change) fetches a new one
+        self._module._ios_running_config = RunningConfig(self._connection)
+        try:
+            if self.VALID_RESOURCE_SUBSETS:
+                self.get_network_resources_facts(
+                    FACT_RESOURCE_SUBSETS, resource_facts_type, data
+                )
 
-        if self.VALID_LEGACY_GATHER_SUBSETS:
-            self.get_network_legacy_facts(
-                FACT_LEGACY_SUBSETS, legacy_facts_type
-            )
+            if self.VALID_LEGACY_GATHER_SUBSETS:
+                self.get_network_legacy_facts(
+                    FACT_LEGACY_SUBSETS, legacy_facts_type
+                )
+        finally:
+            del self._module._ios_running_config
 
         return self.ansible_facts, self._warnings
@@ -24,9 +24,15 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
     get_interface_type,
     normalize_interface,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.interfaces.interfaces import (
     InterfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class InterfacesFacts(object):
@@ -48,7 +54,9 @@ class InterfacesFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_interfaces_data(self, connection):
-        return connection.get("sh running-config | begin ^interface")
+        return get_running_config(self._module, connection).section(
+            "interface"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for interfaces
@@ -94,6 +102,8 @@ class InterfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("interfaces", section=conf)
         match = re.search(r"^(\S+)", conf)
         intf = match.group(1)
 
@@ -23,9 +23,20 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
     get_interface_type,
     normalize_interface,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.l2_interfaces.l2_interfaces import (
     L2_InterfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VLAN_MAX,
+    VLAN_MIN,
+    VlanSet,
+)
 
 
 class L2_InterfacesFacts(object):
@@ -47,7 +58,9 @@ class L2_InterfacesFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_l2_interfaces_data(self, connection):
-        return connection.get("show running-config | begin ^interface")
+        return get_running_config(self._module, connection).section(
+            "interface"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for interfaces
@@ -81,6 +94,32 @@ class L2_InterfacesFacts(object):
 
         return ansible_facts
 
+    VLANS_RE = r"^\s*switchport trunk %s (?:(add|remove|except) )?(\S+)\s*$"
+
+    def parse_vlans(self, conf, keyword):
+        """ The VLANs of the trunk lines of keyword as a range list, the
+        lines apply in order as the device does
+        """
+        vlans = None
+        for action, value in re.findall(self.VLANS_RE % keyword, conf, re.M):
+            if value == "all":
+                value = VlanSet.from_ranges("%d-%d" % (VLAN_MIN, VLAN_MAX))
+            elif value == "none":
+                value = VlanSet()
+            else:
+                value = VlanSet.from_ranges(value)
+            if action == "remove":
+                vlans = (vlans or VlanSet()) - value
+            elif action == "except":
+                vlans = VlanSet.from_ranges("%d-%d" % (VLAN_MIN, VLAN_MAX)) - value
+            elif action == "add":
+                vlans = (vlans or VlanSet()) | value
+            else:
+                vlans = value
+        if vlans is None:
+            return None
+        return vlans.ranges()
+
     def render_config(self, spec, conf):
         """
         Render config as dictionary structure and delete keys from spec for null values
@@ -90,9 +129,8 @@ class L2_InterfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
-
-        of = open("/tmp/facts_l2_interfaces.log","a")
-        of.write("Conf: %s\n" % conf)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("l2_interfaces", section=conf)
 
         match = re.search(r"^(\S+)", conf)
         intf = match.group(1)
@@ -130,18 +168,8 @@ class L2_InterfacesFacts(object):
             native_vlan = utils.parse_conf_arg(conf, "native vlan")
             if native_vlan:
                 trunk["native_vlan"] = int(native_vlan)
-            allowed_vlan = utils.parse_conf_arg(conf, "allowed vlan")
-            if allowed_vlan:
-                trunk["allowed_vlans"] = allowed_vlan.split(",")
-            allowed_vlan_add_all = re.findall("allowed vlan add.*", conf)
-            if allowed_vlan_add_all:
-                for each in allowed_vlan_add_all:
-                    trunk["allowed_vlans"].extend(
-                        each.split("allowed vlan add ")[1].split(",")
-                    )
-            pruning_vlan = utils.parse_conf_arg(conf, "pruning vlan")
-            if pruning_vlan:
-                trunk["pruning_vlans"] = pruning_vlan.split(",")
+            trunk["allowed_vlans"] = self.parse_vlans(conf, "allowed vlan")
+            trunk["pruning_vlans"] = self.parse_vlans(conf, "pruning vlan")
 
             config["trunk"] = trunk
 
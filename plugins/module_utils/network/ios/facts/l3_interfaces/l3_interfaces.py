@@ -25,6 +25,9 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.l3_interfaces import (
     L3_interfacesTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.l3_interfaces.l3_interfaces import (
     L3_interfacesArgs,
 )
@@ -39,7 +42,9 @@ class L3_InterfacesFacts(object):
         self.argument_spec = L3_interfacesArgs.argument_spec
 
     def get_l3_interfaces_data(self, connection):
-        return connection.get("show running-config | begin ^interface")
+        return get_running_config(self._module, connection).section(
+            "interface"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for l3 interfaces
@@ -22,6 +22,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.lacp.lacp import (
     LacpArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class LacpFacts(object):
@@ -82,6 +85,8 @@ class LacpFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("lacp", section=conf)
 
         config["system"]["priority"] = int(conf.split(",")[0])
 
@@ -24,9 +24,15 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
     get_interface_type,
     normalize_interface,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.lacp_interfaces.lacp_interfaces import (
     Lacp_InterfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Lacp_InterfacesFacts(object):
@@ -61,7 +67,9 @@ class Lacp_InterfacesFacts(object):
 
         objs = []
         if not data:
-            data = connection.get("show running-config | section ^interface")
+            data = get_running_config(self._module, connection).section(
+                "interface"
+            )
         # operate on a collection of resource x
         config = ("\n" + data).split("\ninterface ")
 
@@ -94,6 +102,8 @@ class Lacp_InterfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("lacp_interfaces", section=conf)
         match = re.search(r"^(\S+)", conf)
         intf = match.group(1)
         if get_interface_type(intf) == "unknown":
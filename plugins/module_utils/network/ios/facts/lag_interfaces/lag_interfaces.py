@@ -25,9 +25,15 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
     get_interface_type,
     normalize_interface,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.lag_interfaces.lag_interfaces import (
     Lag_interfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Lag_interfacesFacts(object):
@@ -59,7 +65,9 @@ class Lag_interfacesFacts(object):
         objs = []
 
         if not data:
-            data = connection.get("show running-config | begin ^interface")
+            data = get_running_config(self._module, connection).section(
+                "interface"
+            )
         # operate on a collection of resource x
         config = ("\n" + data).split("\ninterface ")
         for conf in config:
@@ -101,9 +109,8 @@ class Lag_interfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
-
-        of = open("/tmp/facts_lag.log","a")
-        of.write("Conf: %s\n" % conf)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("lag_interfaces", section=conf)
 
         match = re.search(r"^(\S+)", conf)
         intf = match.group(1)
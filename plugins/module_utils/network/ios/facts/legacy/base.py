@@ -193,6 +193,7 @@ class Interfaces(FactsBase):
     def populate(self):
         super(Interfaces, self).populate()
 
+        self.facts["interfaces"] = dict()
         self.facts["all_ipv4_addresses"] = list()
         self.facts["all_ipv6_addresses"] = list()
         self.facts["neighbors"] = {}
@@ -217,7 +218,7 @@ class Interfaces(FactsBase):
 
         if data and not any(err in data for err in lldp_errs):
             neighbors = self.run(["show lldp neighbors detail"])
-            if neighbors:
+            if neighbors and neighbors[0]:
                 self.facts["neighbors"].update(
                     self.parse_neighbors(neighbors[0])
                 )
@@ -227,7 +228,7 @@ class Interfaces(FactsBase):
 
         if data and not any(err in data for err in cdp_errs):
             cdp_neighbors = self.run(["show cdp neighbors detail"])
-            if cdp_neighbors:
+            if cdp_neighbors and cdp_neighbors[0]:
                 self.facts["neighbors"].update(
                     self.parse_cdp_neighbors(cdp_neighbors[0])
                 )
@@ -252,7 +253,7 @@ class Interfaces(FactsBase):
 
     def populate_ipv4_interfaces(self, data):
         for key, value in data.items():
-            self.facts["interfaces"][key]["ipv4"] = list()
+            self.facts["interfaces"].setdefault(key, dict())["ipv4"] = list()
             primary_address = addresses = []
             primary_address = re.findall(
                 r"Internet address is (.+)$", value, re.M
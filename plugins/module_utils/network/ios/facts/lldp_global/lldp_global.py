@@ -19,9 +19,15 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Lldp_globalFacts(object):
@@ -43,7 +49,9 @@ class Lldp_globalFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_lldp_global_data(self, connection):
-        return connection.get("show running-config | section ^lldp")
+        return get_running_config(self._module, connection).section(
+            "lldp"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lldp_global
@@ -84,6 +92,8 @@ class Lldp_globalFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("lldp_global", section=conf)
 
         holdtime = utils.parse_conf_arg(conf, "lldp holdtime")
         timer = utils.parse_conf_arg(conf, "lldp timer")
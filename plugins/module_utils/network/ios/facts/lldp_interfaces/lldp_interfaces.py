@@ -27,6 +27,9 @@ from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.uti
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_InterfacesArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Lldp_InterfacesFacts(object):
@@ -91,6 +94,8 @@ class Lldp_InterfacesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("lldp_interfaces", section=conf)
         match = re.search(r"^(\S+)(:)", conf)
         intf = ""
         if match:
@@ -21,6 +21,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.logging_global import (
     Logging_globalTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.logging_global.logging_global import (
     Logging_globalArgs,
 )
@@ -34,7 +37,9 @@ class Logging_globalFacts(object):
         self.argument_spec = Logging_globalArgs.argument_spec
 
     def get_logging_data(self, connection):
-        return connection.get("show running-config | include logging")
+        return get_running_config(self._module, connection).include(
+            "logging"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for Logging_global network resource
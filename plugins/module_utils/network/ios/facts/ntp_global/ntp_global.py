@@ -20,6 +20,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.ntp_global import (
     Ntp_globalTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.ntp_global.ntp_global import (
     Ntp_globalArgs,
 )
@@ -53,7 +56,9 @@ class Ntp_globalFacts(object):
         return objs
 
     def get_ntp_data(self, connection):
-        return connection.get("show running-config | section ^ntp")
+        return get_running_config(self._module, connection).section(
+            "ntp"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for Ntp_global network resource
@@ -16,6 +16,9 @@ __metaclass__ = type
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.ospfv2.ospfv2 import (
     Ospfv2Args,
 )
@@ -36,7 +39,9 @@ class Ospfv2Facts(object):
         self.argument_spec = Ospfv2Args.argument_spec
 
     def get_ospfv2_data(self, connection):
-        return connection.get("sh running-config | section ^router ospf")
+        return get_running_config(self._module, connection).section(
+            "router ospf"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for ospfv2
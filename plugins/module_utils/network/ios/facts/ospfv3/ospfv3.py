@@ -18,6 +18,9 @@ from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.ospfv3.ospfv3 import (
     Ospfv3Args,
 )
@@ -38,7 +41,9 @@ class Ospfv3Facts(object):
         self.argument_spec = Ospfv3Args.argument_spec
 
     def get_ospfv3_data(self, connection):
-        return connection.get("sh running-config | section ^router ospfv3")
+        return get_running_config(self._module, connection).section(
+            "router ospfv3"
+        )
 
     def parse(self, net_template_obj):
         """ Overrided network template parse
@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.prefix_lists import (
     Prefix_listsTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.prefix_lists.prefix_lists import (
     Prefix_listsArgs,
 )
@@ -37,8 +40,8 @@ class Prefix_listsFacts(object):
         self.argument_spec = Prefix_listsArgs.argument_spec
 
     def get_prefix_list_data(self, connection):
-        return connection.get(
-            "sh running-config | section ^ip prefix-list|^ipv6 prefix-list"
+        return get_running_config(self._module, connection).section(
+            "ip prefix-list", "ipv6 prefix-list"
         )
 
     def populate_facts(self, connection, ansible_facts, data=None):
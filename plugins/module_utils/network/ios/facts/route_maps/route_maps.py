@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.rm_templates.route_maps import (
     Route_mapsTemplate,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.route_maps.route_maps import (
     Route_mapsArgs,
 )
@@ -47,7 +50,9 @@ class Route_mapsFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_route_maps_data(self, connection):
-        return connection.get("sh running-config | section ^route-map")
+        return get_running_config(self._module, connection).section(
+            "route-map"
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for Route_maps network resource
@@ -22,12 +22,18 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     netmask_to_cidr,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    get_running_config,
+)
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.static_routes.static_routes import (
     Static_RoutesArgs,
 )
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
     is_valid_ip,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
 
 
 class Static_RoutesFacts(object):
@@ -50,8 +56,8 @@ class Static_RoutesFacts(object):
         self.generated_spec = utils.generate_dict(facts_argument_spec)
 
     def get_static_routes_data(self, connection):
-        return connection.get(
-            "sh running-config | section ^ip route|ipv6 route"
+        return get_running_config(self._module, connection).section(
+            "ip route", "ipv6 route"
         )
 
     def populate_facts(self, connection, ansible_facts, data=None):
@@ -173,6 +179,8 @@ class Static_RoutesFacts(object):
         :returns: The generated config
         """
         config = deepcopy(spec)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("static_routes", section=conf)
         config["address_families"] = []
         route_dict = dict()
         final_route = dict()
@@ -22,6 +22,12 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.vlans.vlans import (
     VlansArgs,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VlanSet,
+)
 
 
 class VlansFacts(object):
@@ -59,68 +65,12 @@ class VlansFacts(object):
         :rtype: dictionary
         :returns: facts
         """
-
-        objs = []
-        mtu_objs = []
-        remote_objs = []
-        final_objs = []
         if not data:
             data = self.get_vlans_data(connection)
-        # operate on a collection of resource x
-        config = data.split("\n")
-        # Get individual vlan configs separately
-        vlan_info = ""
-        temp = ""
-        vlan_name = True
-        for conf in config:
-            if len(list(filter(None, conf.split(" ")))) <= 2 and vlan_name:
-                temp = temp + conf
-                if len(list(filter(None, temp.split(" ")))) <= 2:
-                    continue
-            if "VLAN Name" in conf:
-                vlan_info = "Name"
-            elif "VLAN Type" in conf:
-                vlan_info = "Type"
-                vlan_name = False
-            elif "Remote SPAN" in conf:
-                vlan_info = "Remote"
-                vlan_name = False
-            elif "VLAN AREHops" in conf or "STEHops" in conf:
-                vlan_info = "Hops"
-                vlan_name = False
-            elif "Primary Secondary" in conf:
-                vlan_info = "Primary"
-                vlan_name = False
-            if temp:
-                conf = temp
-                temp = ""
-            if (
-                conf
-                and " " not in filter(None, conf.split("-"))
-                and not conf.split(" ")[0] == ""
-            ):
-                obj = self.render_config(self.generated_spec, conf, vlan_info)
-                if "mtu" in obj:
-                    mtu_objs.append(obj)
-                elif "remote_span" in obj:
-                    remote_objs = obj
-                elif obj:
-                    objs.append(obj)
-        # Appending MTU value to the retrieved dictionary
-        for o, m in zip(objs, mtu_objs):
-            o.update(m)
-            final_objs.append(o)
-
-        # Appending Remote Span value to related VLAN:
-        if remote_objs:
-            if remote_objs.get("remote_span"):
-                for each in remote_objs.get("remote_span"):
-                    for every in final_objs:
-                        if each == every.get("vlan_id"):
-                            every.update({"remote_span": True})
-                            break
+        objs = self.parse_vlans(data)
+
         facts = {}
-        if final_objs:
+        if objs:
             facts["vlans"] = []
             params = utils.validate_config(
                 self.argument_spec, {"config": objs}
@@ -132,50 +82,105 @@ class VlansFacts(object):
 
         return ansible_facts
 
-    def render_config(self, spec, conf, vlan_info):
+    # section of show vlan by the words of its header
+    SECTIONS = (
+        ("VLAN Name", "Name"),
+        ("VLAN Type", "Type"),
+        ("Remote SPAN", "Remote"),
+        ("VLAN AREHops", "Hops"),
+        ("STEHops", "Hops"),
+        ("Primary Secondary", "Primary"),
+    )
+
+    STATUSES = ("active", "suspended", "act", "sus")
+
+    def parse_vlans(self, data):
         """
-        Render config as dictionary structure and delete keys
-          from spec for null values
+        Parse show vlan in one pass, a row of the VLAN Name section adds
+        a VLAN, the rows of the later sections update it by id
 
-        :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param data: The output of show vlan
+        :rtype: list
+        :returns: The VLANs in the order of the output
+        """
+        objs = []
+        vlans = {}
+        section = None
+        # VLAN of a Name row whose status is on the next line
+        pending = None
+        for line in data.split("\n"):
+            tokens = line.split()
+            if not tokens or line.startswith("--"):
+                continue
+            for header, name in self.SECTIONS:
+                if line.startswith(header):
+                    section = name
+                    break
+            else:
+                if ciscosmb_trace.enabled:
+                    ciscosmb_trace.record("vlans", section=line)
+
+                if section == "Name":
+                    if not line[0].isspace() and tokens[0].isdigit():
+                        obj = self.render_config(tokens)
+                        objs.append(obj)
+                        vlans.setdefault(obj["vlan_id"], obj)
+                        pending = obj if len(tokens) < 3 else None
+                    elif pending is not None:
+                        # a name filling its column wraps the status, other
+                        # continuation lines list more ports
+                        if tokens[0].split("/")[0] in self.STATUSES:
+                            pending.update(self.parse_status(tokens[0]))
+                        pending = None
+                elif section == "Type":
+                    obj = vlans.get(int(tokens[0])) if tokens[0].isdigit() else None
+                    if obj is not None and len(tokens) > 3 and tokens[3].isdigit():
+                        obj["mtu"] = int(tokens[3])
+                elif section == "Remote":
+                    for vlan_id in self.parse_remote_span(line):
+                        if vlan_id in vlans:
+                            vlans[vlan_id]["remote_span"] = True
+
+        return objs
+
+    def parse_status(self, status):
+        """ state and shutdown of the status column of a VLAN """
+        config = {}
+        if "/" in status:
+            state = status.split("/")[0]
+            if state == "sus":
+                config["state"] = "suspend"
+            elif state == "act":
+                config["state"] = "active"
+            config["shutdown"] = "enabled"
+        else:
+            if status == "suspended":
+                config["state"] = "suspend"
+            elif status == "active":
+                config["state"] = "active"
+            config["shutdown"] = "disabled"
+        return config
+
+    def parse_remote_span(self, line):
+        """ VLAN ids of a line of the Remote SPAN VLANs section """
+        try:
+            return VlanSet.from_ranges(line.replace(" ", ""))
+        except ValueError:
+            return VlanSet()
+
+    def render_config(self, conf):
+        """
+        Render a row of the VLAN Name section as dictionary structure,
+          keys without a value left out
+
+        :param conf: The words of the row
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
-
-        if vlan_info == "Name" and "VLAN Name" not in conf:
-            conf = list(filter(None, conf.split(" ")))
-            config["vlan_id"] = int(conf[0])
+        config = {"vlan_id": int(conf[0])}
+        if len(conf) > 1:
             config["name"] = conf[1]
-            try:
-                if len(conf[2].split("/")) > 1:
-                    if conf[2].split("/")[0] == "sus":
-                        config["state"] = "suspend"
-                    elif conf[2].split("/")[0] == "act":
-                        config["state"] = "active"
-                    config["shutdown"] = "enabled"
-                else:
-                    if conf[2] == "suspended":
-                        config["state"] = "suspend"
-                    elif conf[2] == "active":
-                        config["state"] = "active"
-                    config["shutdown"] = "disabled"
-            except IndexError:
-                pass
-        elif vlan_info == "Type" and "VLAN Type" not in conf:
-            conf = list(filter(None, conf.split(" ")))
-            config["mtu"] = int(conf[3])
-        elif vlan_info == "Remote":
-            if len(conf.split(",")) > 1 or conf.isdigit():
-                remote_span_vlan = []
-                if len(conf.split(",")) > 1:
-                    remote_span_vlan = conf.split(",")
-                else:
-                    remote_span_vlan.append(conf)
-                remote_span = []
-                for each in remote_span_vlan:
-                    remote_span.append(int(each))
-                config["remote_span"] = remote_span
-
-        return utils.remove_empties(config)
+        if len(conf) > 2:
+            config.update(self.parse_status(conf[2]))
+
+        return config
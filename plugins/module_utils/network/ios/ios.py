@@ -36,6 +36,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     to_list,
 )
 from ansible.module_utils.connection import Connection, ConnectionError
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_interface_names import (
+    ios_interface_names,
+)
 
 _DEVICE_CONFIGS = {}
 
@@ -135,13 +138,94 @@ def get_config(module, flags=None):
         return cfg
 
 
+class RunningConfig(object):
+    """ one "show running-config" download, indexed by top level section
+
+    The config is fetched on first use through the cliconf get_config, so
+    its on disk cache and file transfer apply, and split once into blocks,
+    a block being a top level line with its indented children. Blocks are
+    indexed by the first word of their top level line.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._text = None
+        self._sections = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = to_text(
+                self._connection.get_config(),
+                errors="surrogate_then_replace",
+            )
+        return self._text
+
+    def _index(self):
+        sections = {}
+        block = None
+        for line in self.text.splitlines():
+            if not line.strip() or line.startswith("!"):
+                block = None
+            elif line[0] == " " and block is not None:
+                block.append(line)
+            elif line[0] != " ":
+                block = [line]
+                sections.setdefault(line.split(" ", 1)[0], []).append(block)
+        return sections
+
+    def section(self, *keywords):
+        """ blocks whose top level line starts with one of keywords,
+        like "| section ^keyword" """
+        if self._sections is None:
+            self._sections = self._index()
+
+        keys = []
+        for keyword in keywords:
+            key = keyword.split(" ", 1)[0]
+            if key not in keys:
+                keys.append(key)
+
+        found = []
+        for key in keys:
+            for block in self._sections.get(key, []):
+                if block[0].startswith(keywords):
+                    found.append("\n".join(block))
+        return "\n".join(found)
+
+    def include(self, *words):
+        """ lines containing one of words, like "| include word" """
+        return "\n".join(
+            line
+            for line in self.text.splitlines()
+            if any(word in line for word in words)
+        )
+
+
+def get_running_config(module, connection):
+    """ the running config snapshot shared by the current facts run,
+    a private one when there is none """
+    if hasattr(module, "_ios_running_config"):
+        return module._ios_running_config
+    return RunningConfig(connection)
+
+
 def run_commands(module, commands, check_rc=True):
     connection = get_connection(module)
     try:
-        return connection.run_commands(commands=commands, check_rc=check_rc)
+        outputs = connection.run_commands(commands=commands, check_rc=check_rc)
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc))
 
+    responses = list()
+    for cmd, out in zip(to_list(commands), outputs):
+        if isinstance(out, dict):
+            # check_rc=False, None for the callers to skip the command
+            module.warn("command %s failed: %s" % (to_text(cmd), out["error"]))
+            out = None
+        responses.append(out)
+    return responses
+
 
 def load_config(module, commands):
     connection = get_connection(module)
@@ -156,54 +240,4 @@ def load_config(module, commands):
 def normalize_interface(name):
     """Return the normalized interface name
     """
-    if not name:
-        return
-
-    def _get_number(name):
-        digits = ""
-        for char in name:
-            if char.isdigit() or char in "/.":
-                digits += char
-        return digits
-
-    if name.lower().startswith("gi"):
-        if_type = "GigabitEthernet"
-    elif name.lower().startswith("twe"):
-        if_type = "TwentyFiveGigE"
-    elif name.lower().startswith("tw"):
-        if_type = "TwoGigabitEthernet"
-    elif name.lower().startswith("te"):
-        if_type = "TenGigabitEthernet"
-    elif name.lower().startswith("fa"):
-        if_type = "FastEthernet"
-    elif name.lower().startswith("fo"):
-        if_type = "FortyGigabitEthernet"
-    elif name.lower().startswith("et"):
-        if_type = "Ethernet"
-    elif name.lower().startswith("vl"):
-        if_type = "Vlan"
-    elif name.lower().startswith("lo"):
-        if_type = "loopback"
-    elif name.lower().startswith("po"):
-        if_type = "port-channel"
-    elif name.lower().startswith("nv"):
-        if_type = "nve"
-    elif name.lower().startswith("hu"):
-        if_type = "HundredGigE"
-    elif name.lower().startswith("se"):
-        if_type = "Serial"
-    else:
-        if_type = None
-
-    number_list = name.split(" ")
-    if len(number_list) == 2:
-        if_number = number_list[-1].strip()
-    else:
-        if_number = _get_number(name)
-
-    if if_type:
-        proper_interface = if_type + if_number
-    else:
-        proper_interface = name
-
-    return proper_interface
+    return ios_interface_names.normalize(name)
@@ -16,6 +16,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     is_masklen,
     to_netmask,
 )
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_interface_names import (
+    ios_interface_names,
+)
 
 
 def remove_command_from_config_list(interface, cmd, commands):
@@ -294,100 +297,34 @@ def is_valid_ip(ip_str):
 def normalize_interface(name):
     """Return the normalized interface name
     """
-    if not name:
-        return
-
-    def _get_number(name):
-        digits = ""
-        for char in name:
-            if char.isdigit() or char in "/.":
-                digits += char
-        return digits
-
-    if name.lower().startswith("gi"):
-        if_type = "GigabitEthernet"
-    elif name.lower().startswith("twe"):
-        if_type = "TwentyFiveGigE"
-    elif name.lower().startswith("tw"):
-        if_type = "TwoGigabitEthernet"
-    elif name.lower().startswith("te"):
-        if_type = "TenGigabitEthernet"
-    elif name.lower().startswith("fa"):
-        if_type = "FastEthernet"
-    elif name.lower().startswith("fo"):
-        if_type = "FortyGigabitEthernet"
-    elif name.lower().startswith("long"):
-        if_type = "LongReachEthernet"
-    elif name.lower().startswith("et"):
-        if_type = "Ethernet"
-    elif name.lower().startswith("vl"):
-        if_type = "Vlan"
-    elif name.lower().startswith("lo"):
-        if_type = "loopback"
-    elif name.lower().startswith("po"):
-        if_type = "Port-channel"
-    elif name.lower().startswith("nv"):
-        if_type = "nve"
-    elif name.lower().startswith("hu"):
-        if_type = "HundredGigE"
-    elif name.lower().startswith("virtual-te"):
-        if_type = "Virtual-Template"
-    elif name.lower().startswith("tu"):
-        if_type = "Tunnel"
-    elif name.lower().startswith("se"):
-        if_type = "Serial"
-    else:
-        if_type = None
-
-    number_list = name.split(" ")
-    if len(number_list) == 2:
-        number = number_list[-1].strip()
-    else:
-        number = _get_number(name)
+    return ios_interface_names.normalize(name)
 
-    if if_type:
-        proper_interface = if_type + number
-    else:
-        proper_interface = name
 
-    return proper_interface
+def normalize_interfaces(names):
+    """Return the normalized names of a list of interfaces
+    """
+    return ios_interface_names.normalize_all(names)
 
 
 def get_interface_type(interface):
     """Gets the type of interface
     """
+    return ios_interface_names.type(interface) or "unknown"
 
-    if interface.upper().startswith("GI"):
-        return "GigabitEthernet"
-    elif interface.upper().startswith("TW"):
-        return "TwoGigabitEthernet"
-    elif interface.upper().startswith("TE"):
-        return "TenGigabitEthernet"
-    elif interface.upper().startswith("FA"):
-        return "FastEthernet"
-    elif interface.upper().startswith("FO"):
-        return "FortyGigabitEthernet"
-    elif interface.upper().startswith("LON"):
-        return "LongReachEthernet"
-    elif interface.upper().startswith("ET"):
-        return "Ethernet"
-    elif interface.upper().startswith("VL"):
-        return "Vlan"
-    elif interface.upper().startswith("LO"):
-        return "loopback"
-    elif interface.upper().startswith("PO"):
-        return "Port-channel"
-    elif interface.upper().startswith("NV"):
-        return "nve"
-    elif interface.upper().startswith("TWE"):
-        return "TwentyFiveGigE"
-    elif interface.upper().startswith("HU"):
-        return "HundredGigE"
-    elif interface.upper().startswith("VIRTUAL-TE"):
-        return "Virtual-Template"
-    elif interface.upper().startswith("TU"):
-        return "Tunnel"
-    elif interface.upper().startswith("SE"):
-        return "Serial"
-    else:
-        return "unknown"
+
+def index_by_name(items):
+    """Index a list of interface dicts by name, the first dict of a name
+    wins as it does for a scan of the list
+    """
+    index = {}
+    for item in items:
+        index.setdefault(item["name"], item)
+    return index
+
+
+def pair_by_name(want, have):
+    """Pair every dict of want with the dict of have of the same name, or
+    None, looking each name up once instead of scanning have for it
+    """
+    have_index = index_by_name(have)
+    return [(item, have_index.get(item["name"])) for item in want]
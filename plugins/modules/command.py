@@ -62,6 +62,12 @@ options:
         trying the command again.
     default: 1
     type: int
+  timing:
+    description:
+      - Return in I(timing) how long every command took on the device
+        connection and how many bytes it returned.
+    default: false
+    type: bool
 notes:
   - Supports C(check_mode).
 '''
@@ -103,6 +109,13 @@ stdout_lines:
   returned: always apart from low level errors (such as action plugin)
   type: list
   sample: [['...', '...'], ['...'], ['...']]
+timing:
+  description:
+    - One entry per try, C(wall_time) of the whole try and by command in
+      C(commands) the C(wall_time) on the device connection and the C(bytes) received.
+  returned: when timing is enabled
+  type: list
+  sample: [{"wall_time": 0.52, "commands": [{"command": "show version", "wall_time": 0.41, "bytes": 1130}]}]
 failed_conditions:
   description: The list of conditionals that have failed.
   returned: failed
@@ -115,6 +128,7 @@ import time
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import Conditional
 from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import run_commands
 from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import ciscosmb_argument_spec
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import ciscosmb_enable_timing
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import string_types
 
@@ -136,7 +150,8 @@ def main():
         match=dict(default='all', choices=['all', 'any']),
 
         retries=dict(default=10, type='int'),
-        interval=dict(default=1, type='int')
+        interval=dict(default=1, type='int'),
+        timing=dict(default=False, type='bool')
     )
 
     argument_spec.update(ciscosmb_argument_spec)
@@ -153,6 +168,9 @@ def main():
     interval = module.params['interval']
     match = module.params['match']
 
+    if module.params['timing']:
+        result['timing'] = ciscosmb_enable_timing(module)
+
     while retries > 0:
         responses = run_commands(module, module.params['commands'])
 
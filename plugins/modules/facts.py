@@ -26,11 +26,67 @@ options:
         values to include a larger subset.  Values can also be used
         with an initial C(!) to specify that a specific subset should
         not be collected.
+      - The interfaces subset can be narrowed down to the sections
+        C(interfaces.status), C(interfaces.configuration), C(interfaces.description),
+        C(interfaces.addresses) and C(interfaces.neighbors), only the commands
+        the selected sections need are sent to the device.
     required: false
     type: list
     elements: str
-    choices: [ 'default', 'all', 'hardware', 'config', 'interfaces', '!hardware', '!config', '!interfaces' ]
+    choices: [ 'default', 'all', 'hardware', 'config', 'interfaces', '!hardware', '!config', '!interfaces',
+               'interfaces.addresses', 'interfaces.configuration', 'interfaces.description',
+               'interfaces.neighbors', 'interfaces.status',
+               '!interfaces.addresses', '!interfaces.configuration', '!interfaces.description',
+               '!interfaces.neighbors', '!interfaces.status' ]
     default: '!config'
+  cache_dir:
+    description:
+      - Directory on the controller where the facts of each host are kept
+        between runs, see I(max_age).
+      - Facts served from the cache are as old as the cache entry, for
+        example C(ansible_net_uptime) is not counted on.
+      - Not set by default, all facts are then gathered from the device.
+    required: false
+    type: path
+  max_age:
+    description:
+      - Seconds the facts of a subset are served from I(cache_dir) at
+        most before they are gathered from the device again, by subset
+        name (C(default), C(hardware), C(config) or C(interfaces)).
+      - Subsets not listed are always gathered from the device.
+    required: false
+    type: dict
+    default: {}
+  config_dir:
+    description:
+      - Directory on the controller the running configuration of the
+        C(config) subset is written to, instead of returning it in
+        C(ansible_net_config). C(ansible_net_config_file) then tells
+        where it is, its size and hash.
+      - The file is named after the host, see I(config_content_addressed).
+      - The persistent connection writes the configuration to the file
+        while it arrives from the device.
+    required: false
+    type: path
+  config_compress:
+    description:
+      - Write the file of I(config_dir) gzip compressed, with a C(.cfg.gz) suffix.
+    required: false
+    type: bool
+    default: false
+  config_content_addressed:
+    description:
+      - Name the file of I(config_dir) after the SHA-256 of the configuration,
+        hosts or runs with the same configuration share one file.
+    required: false
+    type: bool
+    default: false
+  timing:
+    description:
+      - Return C(ansible_net_timing), where the time of the run went.
+    required: false
+    type: bool
+    default: false
 notes:
   - Supports C(check_mode).
 """
@@ -45,6 +101,27 @@ EXAMPLES = """
     gather_subset:
       - config
 
+- name: Collect only the link state of the interfaces
+  community.ciscosmb.facts:
+    gather_subset:
+      - interfaces.status
+
+- name: Gather version, inventory and storage at most once a day
+  community.ciscosmb.facts:
+    gather_subset:
+      - hardware
+    cache_dir: ~/.ansible/ciscosmb_facts
+    max_age:
+      default: 86400
+      hardware: 86400
+
+- name: Write the running config to a file instead of into the facts
+  community.ciscosmb.facts:
+    gather_subset:
+      - config
+    config_dir: /srv/backup/ciscosmb
+    config_compress: true
+
 - name: Do not collect hardware facts
   community.ciscosmb.facts:
     gather_subset:
@@ -56,6 +133,20 @@ ansible_net_gather_subset:
   description: The list of fact subsets collected from the device.
   returned: always
   type: list
+ansible_net_timing:
+  description:
+    - Time of the whole run in C(wall_time).
+    - By command in C(commands), C(wall_time) spent on the device connection and C(bytes) received.
+    - By subset in C(subsets), its commands with their total C(wall_time) and C(bytes),
+      and C(parse_cpu_time), the CPU time its parsers took.
+    - C(run_commands_time), the time of the command batches including the
+      round trip to the persistent connection and decoding.
+  returned: when timing is enabled
+  type: dict
+ansible_net_cached_subsets:
+  description: The fact subsets served from I(cache_dir) instead of the device.
+  returned: when cache_dir is set
+  type: list
 
 # default
 ansible_net_model:
@@ -112,39 +203,66 @@ ansible_net_memtotal_mb:
 # config
 ansible_net_config:
   description: The current active config from the device.
-  returned: when config is configured
+  returned: when config is configured and config_dir is not set
   type: str
+ansible_net_config_file:
+  description:
+    - The file in I(config_dir) the current active config was written to,
+      C(path), C(size) and C(sha256) of the uncompressed config and whether it is C(compressed).
+  returned: when config is configured and config_dir is set
+  type: dict
+  sample: {"path": "/backup/sw-1.cfg.gz", "size": 48211, "sha256": "9f86d0...", "compressed": true}
 
 # interfaces
 ansible_net_all_ipv4_addresses:
   description: All IPv4 addresses configured on the device.
-  returned: when interfaces is configured
+  returned: when interfaces or interfaces.addresses is configured
   type: list
 ansible_net_all_ipv6_addresses:
   description: All IPv6 addresses configured on the device.
-  returned: when interfaces is configured
+  returned: when interfaces or interfaces.addresses is configured
   type: list
 ansible_net_interfaces:
   description: A hash of all interfaces running on the system.
-  returned: when interfaces is configured
+  returned: when interfaces or any interfaces section but neighbors is configured
   type: dict
 ansible_net_neighbors:
   description: The list of neighbors from the remote device.
-  returned: when interfaces is configured
+  returned: when interfaces or interfaces.neighbors is configured
   type: dict
 
 """
+import gzip
+import hashlib
+import json
+import os
 import re
+import tempfile
+import time
+
+try:
+    from time import process_time
+except ImportError:
+    # Python 2
+    from time import clock as process_time
 
 from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import (
+    ciscosmb_enable_timing,
+    get_connection,
     run_commands,
     ciscosmb_argument_spec,
     interface_canonical_name,
-    ciscosmb_split_to_tables,
-    ciscosmb_parse_table,
-    ciscosmb_merge_dicts,
+    ciscosmb_iter_tables,
+    ciscosmb_iter_rows,
+    ciscosmb_merge_all_dicts,
+    ciscosmb_parse_records,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import (
+    ciscosmb_trace,
 )
+from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.connection import ConnectionError
 from ansible.module_utils.six import iteritems
 
 
@@ -158,9 +276,11 @@ class FactsBase(object):
         self.responses = None
 
     def populate(self):
-        self.responses = run_commands(
-            self.module, commands=self.COMMANDS, check_rc=False
-        )
+        # a CommandPlan may have run the commands already
+        if self.responses is None:
+            self.responses = run_commands(
+                self.module, commands=self.COMMANDS, check_rc=False
+            )
 
     def run(self, cmd):
         return run_commands(self.module, commands=cmd, check_rc=False)
@@ -175,6 +295,14 @@ class Default(FactsBase):
         "show inventory",
     ]
 
+    # one module of show inventory, NAME and DESCR on a line, PID, VID and
+    # SN on the next; CBS firmware does not quote NAME and DESCR
+    INVENTORY_RE = re.compile(
+        r'^\s*NAME:[ \t]*"?(?P<name>[^"\r\n]*?)"?[ \t]+DESCR:[ \t]*"?(?P<descr>[^"\r\n]*?)"?[ \t]*$\s*'
+        r'^\s*PID:[ \t]*(?P<pid>[^\r\n]*?)[ \t]+VID:[ \t]*(?P<vid>[^\r\n]*?)[ \t]+SN:[ \t]*(?P<sn>\S*)',
+        re.M,
+    )
+
     def populate(self):
         super(Default, self).populate()
 
@@ -194,16 +322,15 @@ class Default(FactsBase):
 
         data = self.responses[3]
         if data:
-            modules = self.parse_inventory(data)
-            stacked_models = self.parse_stacked_models(modules)
-            if len(stacked_models) >= 2:
-                stacked_serialnums = self.parse_stacked_serialnums(modules)
-                self.facts["stacked_models"] = stacked_models
-                self.facts["stacked_serialnums"] = stacked_serialnums
-            self.facts["model"] = self.parse_model(modules)
-            self.facts["serialnum"] = self.parse_serialnum(modules)
-            self.facts["hw_version"] = self.parse_hw_version(modules)
-            self.facts["hw_modules"] = modules
+            modules, units = self.parse_inventory(data)
+            if len(units) >= 2:
+                self.facts["stacked_models"] = [unit["pid"] for unit in units]
+                self.facts["stacked_serialnums"] = [unit["sn"] for unit in units]
+            if units:
+                self.facts["model"] = self.parse_model(units)
+                self.facts["serialnum"] = units[0]["sn"]
+                self.facts["hw_version"] = units[0]["vid"]
+            self.facts["hw_modules"] = modules or None
 
     # show version
     def parse_version(self, data):
@@ -243,77 +370,31 @@ class Default(FactsBase):
 
     # show inventory
     def parse_inventory(self, data):
-        # make 1 module 1 line
-        data = re.sub(r"\nPID", "  PID", data)
-        # delete empty lines
-        data = re.sub(r"^\n", "", data)
-        data = re.sub(r"\n\n", "", data)
-        data = re.sub(r"\n\s*\n", r"\n", data)
-
-        lines = data.splitlines()
+        """ (modules by NAME, stack units ordered by unit number)
 
+        Every unit of a stack is a module named by its number, the other
+        modules (SFPs, ...) are named after the port they sit in.
+        """
         modules = {}
-        for line in lines:
-            # remove extra chars
-            line = re.sub(r'"', r"", line)
-            line = re.sub(r"\s+", r" ", line)
-            # normalize lines
-            line = re.sub(r":\s", r'"', line)
-            line = re.sub(r'\s+DESCR"', r'"DESCR"', line)
-            line = re.sub(r'\s+PID"', r'"PID"', line)
-            line = re.sub(r'\s+VID"', r'"VID"', line)
-            line = re.sub(r'\s+SN"', r'"SN"', line)
-            line = re.sub(r"\s*$", r"", line)
-
-            match = re.search(
-                r'^NAME"(?P<name>[^"]+)"DESCR"(?P<descr>[^"]+)"PID"(?P<pid>[^"]+)"VID"(?P<vid>[^"]+)"SN"(?P<sn>\S+)\s*',
-                line,
+        units = []
+        for match in self.INVENTORY_RE.finditer(data):
+            modul = dict(
+                (key, " ".join(value.split())) for key, value in iteritems(match.groupdict())
             )
-
-            modul = match.groupdict()
             modules[modul["name"]] = modul
+            if modul["name"].isdigit():
+                units.append(modul)
+
+        units.sort(key=lambda unit: int(unit["name"]))
+        return modules, units
 
-        if modules:
-            return modules
-
-    def parse_stacked_models(self, data):
-        # every inventory has module with NAME: "1"
-        # stacks have modules 2 3 ... 8
-        models = []
-        for n in range(1, 9):
-            # index is string
-            if str(n) in data:
-                models.append(data[str(n)]["pid"])
-        return models
-
-    def parse_stacked_serialnums(self, data):
-        # every inventory has module with NAME: "1"
-        # stacks have modules 2 3 ... 8
-        sn = []
-        for n in range(1, 9):
-            # index is string
-            if str(n) in data:
-                sn.append(data[str(n)]["sn"])
-        return sn
-
-    def parse_model(self, data):
-        # every inventory has module with NAME: "1"
-        model = data["1"]["pid"]
-        if "stacked_models" in self.facts:
+    def parse_model(self, units):
+        model = units[0]["pid"]
+        if len(units) >= 2:
             model = re.sub(r"-.*$", "", model)
             model = "Stack " + model
         return model
 
-    def parse_serialnum(self, data):
-        # every inventory has module with NAME: "1"
-        sn = data["1"]["sn"]
-        return sn
-
-    def parse_hw_version(self, data):
-        # every inventory has module with NAME: "1"
-        sn = data["1"]["vid"]
-        return sn
-
 
 class Hardware(FactsBase):
 
@@ -346,12 +427,81 @@ class Config(FactsBase):
 
     COMMANDS = ["show running-config detailed"]
 
+    CHUNK = 65536
+
+    def __init__(self, module):
+        super(Config, self).__init__(module)
+        self.config_dir = module.params.get("config_dir") if module else None
+        if self.config_dir:
+            # downloaded by populate, straight into a file
+            self.COMMANDS = []
+
     def populate(self):
         super(Config, self).populate()
+        if self.config_dir:
+            self.facts["config_file"] = self.populate_config_file()
+            return
+
         data = self.responses[0]
         if data:
             self.facts["config"] = data
 
+    def populate_config_file(self):
+        """ running config streamed to a file in config_dir
+
+        The persistent connection writes the response to the file as it
+        arrives, neither the module nor the facts ever hold the text.
+        """
+        compress = self.module.params["config_compress"]
+        content_addressed = self.module.params["config_content_addressed"]
+        connection = get_connection(self.module)
+
+        if not os.path.isdir(self.config_dir):
+            os.makedirs(self.config_dir, 0o700)
+        fd, download = tempfile.mkstemp(dir=self.config_dir, suffix=".tmp")
+        os.close(fd)
+        fd, stored = tempfile.mkstemp(dir=self.config_dir, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            try:
+                connection.get_to_file(command=Config.COMMANDS[0], path=download)
+            except ConnectionError as exc:
+                self.module.fail_json(msg="unable to download the running config: %s" % exc)
+
+            digest = hashlib.sha256()
+            size = 0
+            with open(download, "rb") as source:
+                target = gzip.open(stored, "wb") if compress else open(stored, "wb")
+                with target:
+                    for chunk in iter(lambda: source.read(self.CHUNK), b""):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        target.write(chunk)
+
+            if content_addressed:
+                name = digest.hexdigest()
+            else:
+                name = re.sub(r"[^\w.-]", "_", to_text(connection.get_option("host")))
+            path = os.path.join(self.config_dir, name + (".cfg.gz" if compress else ".cfg"))
+
+            if content_addressed and os.path.exists(path):
+                # same content, same file
+                os.unlink(stored)
+            else:
+                os.rename(stored, path)
+        finally:
+            for tmp in (download, stored):
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+
+        return {
+            "path": path,
+            "size": size,
+            "sha256": digest.hexdigest(),
+            "compressed": compress,
+        }
+
 
 class Interfaces(FactsBase):
 
@@ -365,215 +515,159 @@ class Interfaces(FactsBase):
         "show lldp neighbors",
     ]
 
+    # commands each section of the interfaces subset needs, gather_subset
+    # selects sections as interfaces.<section>
+    SECTIONS = {
+        "status": ["show ports jumbo-frame", "show interfaces status"],
+        "configuration": ["show interfaces configuration"],
+        "description": ["show interfaces description"],
+        "addresses": ["show ports jumbo-frame", "show ip interface", "show ipv6 interface brief"],
+        "neighbors": ["show lldp neighbors"],
+    }
+
+    # show interfaces status, ports then port channels
+    STATUS_TABLES = [
+        {
+            "key": (0, "interface"),
+            "columns": [
+                ("type", 1, "str"),
+                ("duplex", 2, "lower"),
+                ("bandwith", 3, "kbit", (6, "Up")),
+                ("negotiation", 4, "lower"),
+                ("control", 5, "lower"),
+                ("state", 6, "lower"),
+                ("presure", 7, "lower"),
+                ("mode", 8, "lower"),
+            ],
+            "null": ["--"],
+        },
+        {
+            "key": (0, "interface"),
+            "columns": [
+                ("type", 1, "str"),
+                ("duplex", 2, "lower"),
+                ("bandwith", 3, "kbit", (6, "Up")),
+                ("negotiation", 4, "lower"),
+                ("control", 5, "lower"),
+                ("state", 6, "lower"),
+            ],
+            "null": ["--"],
+        },
+    ]
+
+    # show interfaces configuration, ports then port channels
+    CONFIGURATION_TABLES = [
+        {
+            "key": (0, "interface"),
+            "columns": [
+                ("admin_state", 6, "lower"),
+                ("mdix", 8, "lower"),
+            ],
+        },
+        {
+            "key": (0, "interface"),
+            "columns": [
+                ("admin_state", 5, "lower"),
+            ],
+        },
+    ]
+
+    # show interfaces description, ports then port channels
+    DESCRIPTION_TABLES = [
+        {
+            "key": (0, "interface"),
+            "columns": [("description", 1, "str")],
+            "null": [""],
+            "overflow": False,
+        },
+    ] * 2
+
     DETAIL_RE = re.compile(
         r"([\w\d\-]+)=\"?(\w{3}/\d{2}/\d{4}\s\d{2}:\d{2}:\d{2}|[\w\d\-\.:/]+)"
     )
     WRAPPED_LINE_RE = re.compile(r"^\s+(?!\d)")
 
+    def __init__(self, module, sections=None):
+        super(Interfaces, self).__init__(module)
+        # unknown until show ports jumbo-frame answered
+        self._mtu = None
+        self.sections = frozenset(self.SECTIONS if sections is None else sections)
+        needed = set()
+        for section in self.sections:
+            needed.update(self.SECTIONS[section])
+        self.COMMANDS = [command for command in Interfaces.COMMANDS if command in needed]
+
     def populate(self):
         super(Interfaces, self).populate()
+        responses = dict(zip(self.COMMANDS, self.responses))
 
-        self.facts["interfaces"] = dict()
-        self.facts["all_ipv4_addresses"] = list()
-        self.facts["all_ipv6_addresses"] = list()
-        self.facts["neighbors"] = list()
-
-        data = self.responses[0]
+        data = responses.get("show ports jumbo-frame")
         if data:
             self.populate_interfaces_mtu(data)
 
-        data = self.responses[1]
-        if data:
-            self.populate_addresses_ipv4(data)
+        if self.sections.intersection(("status", "configuration", "description", "addresses")):
+            self.facts["interfaces"] = dict()
 
-        data = self.responses[2]
-        if data:
-            self.populate_addresses_ipv6(data)
+        # table records first, addresses only add the interfaces they miss
+        tables = list()
 
-        data = self.responses[3]
+        data = responses.get("show interfaces status")
         if data:
-            self.populate_interfaces_status(data)
-
-        #data = self.responses[4]
-        #if data:
-        #    self.populate_interfaces_configuration(data)
-
-        #data = self.responses[5]
-        #if data:
-        #    self.populate_interfaces_description(data)
-
-        #data = self.responses[6]
-        #if data:
-        #    self.populate_neighbors(data)
-
-    def _populate_interfaces_status_interface(self, interface_table):
-        interfaces = dict()
-
-        for key in interface_table:
-
-            i = interface_table[key]
-            interface = dict()
-            interface["state"] = i[6].lower()
-            interface["type"] = i[1]
-            interface["mtu"] = self._mtu
-            interface["duplex"] = i[2].lower()
-            interface["negotiation"] = i[4].lower()
-            interface["control"] = i[5].lower()
-            interface["presure"] = i[7].lower()
-            interface["mode"] = i[8].lower()
-
-            if i[6] == "Up":
-                interface["bandwith"] = int(i[3]) * 1000  # to get speed in kb
-            else:
-                interface["bandwith"] = None
-
-            for key in interface:
-                if interface[key] == "--":
-                    interface[key] = None
+            tables.append(self.parse_interfaces_status(data))
 
-            interfaces[interface_canonical_name(i[0])] = interface
-        return interfaces
-
-    def _populate_interfaces_status_portchanel(self, interface_table):
-        interfaces = dict()
-
-        for key in interface_table:
-
-            interface = dict()
-            i = interface_table[key]
-            interface["state"] = i[6].lower()
-            interface["type"] = i[1]
-            interface["mtu"] = self._mtu
-            interface["duplex"] = i[2].lower()
-            interface["negotiation"] = i[4].lower()
-            interface["control"] = i[5].lower()
-
-            if i[6] == "Up":
-                interface["bandwith"] = int(i[3]) * 1000  # to get speed in kb
-            else:
-                interface["bandwith"] = None
-
-            for key in interface:
-                if interface[key] == "--":
-                    interface[key] = None
-
-            interfaces[interface_canonical_name(i[0])] = interface
-
-        return interfaces
-
-    def populate_interfaces_status(self, data):
-        tables = ciscosmb_split_to_tables(data)
-
-        interface_table = ciscosmb_parse_table(tables[0])
-        portchanel_table = ciscosmb_parse_table(tables[1])
-
-        interfaces = self._populate_interfaces_status_interface(interface_table)
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
-        interfaces = self._populate_interfaces_status_portchanel(portchanel_table)
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
-
-    def _populate_interfaces_configuration_interface(self, interface_table):
-        interfaces = dict()
-
-        for key in interface_table:
-
-            i = interface_table[key]
-            interface = dict()
-            interface["admin_state"] = i[6].lower()
-            interface["mdix"] = i[8].lower()
-
-            interfaces[interface_canonical_name(i[0])] = interface
-        return interfaces
-
-    def _populate_interfaces_configuration_portchanel(self, interface_table):
-        interfaces = dict()
-
-        for key in interface_table:
+        data = responses.get("show interfaces configuration")
+        if data:
+            tables.append(self.parse_interfaces_configuration(data))
 
-            interface = dict()
-            i = interface_table[key]
+        data = responses.get("show interfaces description")
+        if data:
+            tables.append(self.parse_interfaces_description(data))
 
-            interface["admin_state"] = i[5].lower()
+        if tables:
+            self.facts["interfaces"] = ciscosmb_merge_all_dicts(self.facts["interfaces"], tables)
 
-            interfaces[interface_canonical_name(i[0])] = interface
+        if "addresses" in self.sections:
+            self.facts["all_ipv4_addresses"] = list()
+            self.facts["all_ipv6_addresses"] = list()
 
-        return interfaces
+            data = responses.get("show ip interface")
+            if data:
+                self.populate_addresses_ipv4(data)
 
-    def populate_interfaces_configuration(self, data):
-        tables = ciscosmb_split_to_tables(data)
+            data = responses.get("show ipv6 interface brief")
+            if data:
+                self.populate_addresses_ipv6(data)
 
-        interface_table = ciscosmb_parse_table(tables[0])
-        portchanel_table = ciscosmb_parse_table(tables[1])
+        if "neighbors" in self.sections:
+            self.facts["neighbors"] = list()
 
-        interfaces = self._populate_interfaces_configuration_interface(interface_table)
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
-        interfaces = self._populate_interfaces_configuration_portchanel(
-            portchanel_table
-        )
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
+            data = responses.get("show lldp neighbors")
+            if data:
+                self.populate_neighbors(data)
 
-    def _populate_interfaces_description_interface(self, interface_table):
+    def _parse_interfaces_records(self, data, schema, **extra):
         interfaces = dict()
-
-        for key in interface_table:
-
-            i = interface_table[key]
-            interface = dict()
-            interface["description"] = i[1]
-
-            if interface["description"] == "":
-                interface["description"] = None
-
-            interfaces[interface_canonical_name(i[0])] = interface
+        for name, interface in ciscosmb_parse_records(data, schema):
+            interface.update(extra)
+            interfaces[name] = interface
         return interfaces
 
-    def _populate_interfaces_description_portchanel(self, interface_table):
-        interfaces = dict()
-
-        for key in interface_table:
-
-            interface = dict()
-            i = interface_table[key]
+    def parse_interfaces_status(self, data):
+        return self._parse_interfaces_records(data, self.STATUS_TABLES, mtu=self._mtu)
 
-            interface["description"] = i[1]
+    def parse_interfaces_configuration(self, data):
+        return self._parse_interfaces_records(data, self.CONFIGURATION_TABLES)
 
-            if interface["description"] == "":
-                interface["description"] = None
-
-            interfaces[interface_canonical_name(i[0])] = interface
-
-        return interfaces
-
-    def populate_interfaces_description(self, data):
-        tables = ciscosmb_split_to_tables(data)
-
-        interface_table = ciscosmb_parse_table(tables[0], False)
-        portchanel_table = ciscosmb_parse_table(tables[1], False)
-
-        interfaces = self._populate_interfaces_description_interface(interface_table)
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
-        interfaces = self._populate_interfaces_description_portchanel(portchanel_table)
-        self.facts["interfaces"] = ciscosmb_merge_dicts(
-            self.facts["interfaces"], interfaces
-        )
+    def parse_interfaces_description(self, data):
+        return self._parse_interfaces_records(data, self.DESCRIPTION_TABLES)
 
     def _populate_address_ipv4(self, ip_table):
         ips = list()
 
-        for key in ip_table:
-            cidr = ip_table[key][0]
+        for row in ip_table:
+            cidr = row[0]
 
-            interface = interface_canonical_name(ip_table[key][1])
+            interface = interface_canonical_name(row[1])
             ip, mask = cidr.split("/")
 
             ips.append(ip)
@@ -591,8 +685,8 @@ class Interfaces(FactsBase):
 
     def populate_addresses_ipv4(self, data):
 
-        tables = ciscosmb_split_to_tables(data)
-        ip_table = ciscosmb_parse_table(tables[0])
+        tables = list(ciscosmb_iter_tables(data))
+        ip_table = ciscosmb_iter_rows(tables[0])
 
 
         ips = self._populate_address_ipv4(ip_table)
@@ -601,9 +695,9 @@ class Interfaces(FactsBase):
     def _populate_address_ipv6(self, ip_table):
         ips = list()
 
-        for key in ip_table:
-            ip = ip_table[key][3]
-            interface = interface_canonical_name(ip_table[key][0])
+        for row in ip_table:
+            ip = row[3]
+            interface = interface_canonical_name(row[0])
 
             ips.append(ip)
 
@@ -633,9 +727,9 @@ class Interfaces(FactsBase):
             return
 
     def populate_addresses_ipv6(self, data):
-        tables = ciscosmb_split_to_tables(data)
+        tables = list(ciscosmb_iter_tables(data))
 
-        ip_table = ciscosmb_parse_table(tables[0])
+        ip_table = ciscosmb_iter_rows(tables[0])
         ips = self._populate_address_ipv6(ip_table)
         self.facts["all_ipv6_addresses"] = ips
 
@@ -650,13 +744,12 @@ class Interfaces(FactsBase):
         self._mtu = mtu
 
     def populate_neighbors(self, data):
-        tables = ciscosmb_split_to_tables(data)
+        tables = list(ciscosmb_iter_tables(data))
 
-        neighbor_table = ciscosmb_parse_table(tables[0], allow_empty_fields=[3])
+        neighbor_table = ciscosmb_iter_rows(tables[0], allow_empty_fields=[3])
 
         neighbors = dict()
-        for key in neighbor_table:
-            neighbor = neighbor_table[key]
+        for neighbor in neighbor_table:
 
             ifcname = interface_canonical_name(neighbor[0])
 
@@ -673,6 +766,117 @@ class Interfaces(FactsBase):
         self.facts["neighbors"] = neighbors
 
 
+class CommandPlan(object):
+    """ the commands of all the subsets gathered, each sent once
+
+    Subsets asking for the same command share its output, all of them go
+    to the device in a single run_commands batch.
+    """
+
+    def __init__(self, instances):
+        self.instances = instances
+        self.commands = list()
+        self._index = dict()
+        for inst in instances:
+            for command in inst.COMMANDS:
+                if command not in self._index:
+                    self._index[command] = len(self.commands)
+                    self.commands.append(command)
+
+    def run(self, module):
+        """ hands every subset the responses to its COMMANDS, in order """
+        responses = list()
+        if self.commands:
+            responses = run_commands(module, commands=self.commands, check_rc=False)
+
+        for inst in self.instances:
+            inst.responses = [responses[self._index[command]] for command in inst.COMMANDS]
+
+
+class FactsTiming(object):
+    """ where the time of a facts run goes, for ansible_net_timing """
+
+    def __init__(self, module):
+        self.started = time.time()
+        self.batches = ciscosmb_enable_timing(module)
+        self.subsets = dict()
+
+    def add_subset(self, subset, inst, parse_cpu_time):
+        self.subsets[subset] = {
+            "commands": list(inst.COMMANDS),
+            "parse_cpu_time": round(parse_cpu_time, 6),
+        }
+
+    def result(self):
+        commands = dict()
+        for batch in self.batches:
+            for entry in batch["commands"]:
+                commands[entry["command"]] = {
+                    "wall_time": entry["wall_time"],
+                    "bytes": entry["bytes"],
+                }
+
+        for subset in self.subsets.values():
+            measured = [commands[command] for command in subset["commands"] if command in commands]
+            subset["wall_time"] = round(sum(entry["wall_time"] or 0 for entry in measured), 6)
+            subset["bytes"] = sum(entry["bytes"] or 0 for entry in measured)
+
+        return {
+            "wall_time": round(time.time() - self.started, 6),
+            "run_commands_time": round(sum(batch["wall_time"] for batch in self.batches), 6),
+            "commands": commands,
+            "subsets": self.subsets,
+        }
+
+
+class FactsCache(object):
+    """ facts of one host by subset, in a JSON file on the controller """
+
+    def __init__(self, cache_dir, host):
+        self.path = os.path.join(cache_dir, "%s.json" % re.sub(r"[^\w.-]", "_", host))
+        self.entries = self._read()
+        self.changed = False
+
+    def get(self, subset, max_age):
+        """ facts of subset stored less than max_age seconds ago, or None """
+        entry = self.entries.get(subset)
+        if not isinstance(entry, dict) or not isinstance(entry.get("facts"), dict):
+            return None
+        if not 0 <= time.time() - entry.get("stored", 0) < max_age:
+            return None
+        return entry["facts"]
+
+    def put(self, subset, facts):
+        self.entries[subset] = {"stored": time.time(), "facts": facts}
+        self.changed = True
+
+    def save(self):
+        """ write to a private temporary file, then rename over the old copy """
+        if not self.changed:
+            return
+
+        cache_dir = os.path.dirname(self.path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.entries, f)
+            os.rename(tmp, self.path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+        return entries if isinstance(entries, dict) else dict()
+
+
 FACT_SUBSETS = dict(
     default=Default,
     hardware=Hardware,
@@ -681,6 +885,7 @@ FACT_SUBSETS = dict(
 )
 
 VALID_SUBSETS = frozenset(FACT_SUBSETS.keys())
+INTERFACES_SUBSETS = sorted("interfaces.%s" % section for section in Interfaces.SECTIONS)
 
 warnings = list()
 
@@ -701,8 +906,14 @@ def main():
                 "!hardware",
                 "!interfaces",
                 "!config",
-            ],
-        )
+            ] + INTERFACES_SUBSETS + ["!" + subset for subset in INTERFACES_SUBSETS],
+        ),
+        cache_dir=dict(type="path"),
+        max_age=dict(type="dict", default={}),
+        timing=dict(type="bool", default=False),
+        config_dir=dict(type="path"),
+        config_compress=dict(type="bool", default=False),
+        config_content_addressed=dict(type="bool", default=False),
     )
 
     argument_spec.update(ciscosmb_argument_spec)
@@ -711,8 +922,19 @@ def main():
 
     gather_subset = module.params["gather_subset"]
 
+    max_age = dict()
+    for subset, seconds in iteritems(module.params["max_age"]):
+        if subset not in VALID_SUBSETS:
+            module.fail_json(msg="Bad subset in max_age: %s" % subset)
+        try:
+            max_age[subset] = int(seconds)
+        except (TypeError, ValueError):
+            module.fail_json(msg="max_age of %s is not a number of seconds: %s" % (subset, seconds))
+
     runable_subsets = set()
     exclude_subsets = set()
+    interfaces_sections = set()
+    exclude_sections = set()
 
     for subset in gather_subset:
         if subset == "all":
@@ -728,6 +950,15 @@ def main():
         else:
             exclude = False
 
+        if subset in INTERFACES_SUBSETS:
+            section = subset.split(".", 1)[1]
+            if exclude:
+                exclude_sections.add(section)
+            else:
+                interfaces_sections.add(section)
+                runable_subsets.add("interfaces")
+            continue
+
         if subset not in VALID_SUBSETS:
             module.fail_json(msg="Bad subset: %s" % subset)
 
@@ -735,6 +966,8 @@ def main():
             exclude_subsets.add(subset)
         else:
             runable_subsets.add(subset)
+            if subset == "interfaces":
+                interfaces_sections.update(Interfaces.SECTIONS)
 
     if not runable_subsets:
         runable_subsets.update(VALID_SUBSETS)
@@ -742,16 +975,76 @@ def main():
     runable_subsets.difference_update(exclude_subsets)
     runable_subsets.add("default")
 
+    # interfaces picked by all, or by default, gathers every section
+    if not interfaces_sections:
+        interfaces_sections.update(Interfaces.SECTIONS)
+    interfaces_sections.difference_update(exclude_sections)
+
+    gathered = set(runable_subsets)
+    if "interfaces" in runable_subsets and interfaces_sections != set(Interfaces.SECTIONS):
+        gathered.discard("interfaces")
+        if interfaces_sections:
+            gathered.update("interfaces.%s" % section for section in interfaces_sections)
+        else:
+            runable_subsets.discard("interfaces")
+
     facts = dict()
-    facts["gather_subset"] = list(runable_subsets)
+    facts["gather_subset"] = sorted(gathered)
+
+    cache = None
+    if module.params["cache_dir"]:
+        try:
+            host = to_text(get_connection(module).get_option("host"))
+        except ConnectionError as exc:
+            module.fail_json(msg="unable to find the host to cache the facts of: %s" % exc)
+        cache = FactsCache(module.params["cache_dir"], host)
+        facts["cached_subsets"] = list()
 
     instances = list()
-    for key in runable_subsets:
-        instances.append(FACT_SUBSETS[key](module))
+    for key in sorted(runable_subsets):
+        if key == "interfaces":
+            inst = Interfaces(module, interfaces_sections)
+            # a cache entry holds the sections it was gathered with
+            cache_key = "interfaces.%s" % ",".join(sorted(interfaces_sections))
+        else:
+            inst = FACT_SUBSETS[key](module)
+            cache_key = key
+            if key == "config" and inst.config_dir:
+                cache_key = "config.file"
+
+        if cache is not None and key in max_age:
+            cached = cache.get(cache_key, max_age[key])
+            if cached is not None:
+                facts.update(cached)
+                facts["cached_subsets"].append(key)
+                continue
+        instances.append((key, cache_key, inst))
 
-    for inst in instances:
+    timing = None
+    if module.params["timing"]:
+        timing = FactsTiming(module)
+
+    CommandPlan([inst for key, cache_key, inst in instances]).run(module)
+
+    for key, cache_key, inst in instances:
+        started = process_time()
         inst.populate()
+        if timing is not None:
+            timing.add_subset(key, inst, process_time() - started)
+        if ciscosmb_trace.enabled:
+            ciscosmb_trace.record("facts", subset=key, commands=inst.COMMANDS, facts=sorted(inst.facts))
         facts.update(inst.facts)
+        if cache is not None and key in max_age:
+            cache.put(cache_key, inst.facts)
+
+    if cache is not None:
+        try:
+            cache.save()
+        except (IOError, OSError) as exc:
+            warnings.append("unable to write the facts cache %s: %s" % (cache.path, exc))
+
+    if timing is not None:
+        facts["timing"] = timing.result()
 
     ansible_facts = dict()
     for key, value in iteritems(facts):
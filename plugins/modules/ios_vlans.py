@@ -717,10 +717,13 @@ after:
     The configuration returned will always be in the same format
      of the parameters above.
 commands:
-  description: The set of commands pushed to the remote device.
+  description:
+    - The set of commands pushed to the remote device.
+    - VLANs which are only created or only removed are grouped into one range command,
+      for example C(vlan 100-199,300).
   returned: always
   type: list
-  sample: ['vlan 20', 'name vlan_20', 'mtu 600', 'remote-span']
+  sample: ['no vlan 30-39', 'vlan 100-199', 'vlan 20', 'name vlan_20', 'mtu 600', 'remote-span']
 """
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.vlans.vlans import (
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Controller side of a file copy the switch makes with ``copy <url> ...`` or
+``copy ... <url>``.
+
+Every server hands out, or takes, a single file under an unguessable name
+and only while the ``with`` block runs. Without data a server receives.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import abc
+import os
+import socket
+import struct
+import threading
+import uuid
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six import add_metaclass
+from ansible.module_utils.six.moves import BaseHTTPServer
+
+TFTP_RRQ = 1
+TFTP_WRQ = 2
+TFTP_DATA = 3
+TFTP_ACK = 4
+TFTP_ERROR = 5
+TFTP_BLOCK = 512
+TFTP_RETRIES = 5
+# seconds to wait for an ack before sending the block again
+TFTP_TIMEOUT = 2.0
+# seconds the serving threads take at most to notice they should stop
+POLL_INTERVAL = 0.5
+
+
+@add_metaclass(abc.ABCMeta)
+class FileTransfer(object):
+    """ base of the servers, the file is bytes, url() is what the switch gets
+
+    served counts the complete transfers, in either direction.
+    """
+
+    scheme = None
+
+    def __init__(self, data, address, port=None, suffix=".cfg"):
+        self.receiving = data is None
+        self.data = None if self.receiving else to_bytes(data, errors="surrogate_or_strict")
+        self.address = address
+        self.port = port
+        self.name = "ansible-%s%s" % (uuid.uuid4().hex, suffix)
+        self.served = 0
+
+    def url(self):
+        return "%s://%s:%d/%s" % (self.scheme, self.address, self.port, self.name)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @abc.abstractmethod
+    def start(self):
+        """ makes the file available to the switch, or ready to be sent """
+
+    @abc.abstractmethod
+    def stop(self):
+        """ withdraws the file """
+
+    def received(self):
+        """ the file the switch sent, None until it did """
+        return self.data if self.receiving and self.served else None
+
+
+class ServedTransfer(FileTransfer):
+    """ base of the servers answering the switch from a thread """
+
+    def __init__(self, *args, **kwargs):
+        super(ServedTransfer, self).__init__(*args, **kwargs)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @abc.abstractmethod
+    def serve(self):
+        """ answers the switch until stop() is called, runs in the thread """
+
+
+class TftpTransfer(ServedTransfer):
+    """ TFTP (RFC 1350, octet mode) reading or writing the one file """
+
+    scheme = "tftp"
+
+    def __init__(self, data, address, port=69, bind="", **kwargs):
+        super(TftpTransfer, self).__init__(data, address, port, **kwargs)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((bind, port))
+        self._socket.settimeout(POLL_INTERVAL)
+        self.port = self._socket.getsockname()[1]
+
+    def url(self):
+        if self.port == 69:
+            return "tftp://%s/%s" % (self.address, self.name)
+        return super(TftpTransfer, self).url()
+
+    def stop(self):
+        super(TftpTransfer, self).stop()
+        self._socket.close()
+
+    def serve(self):
+        while not self._stop.is_set():
+            try:
+                packet, peer = self._socket.recvfrom(TFTP_BLOCK + 4)
+            except socket.timeout:
+                continue
+
+            opcode, filename = self._parse_request(packet)
+            session = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                session.bind((self._socket.getsockname()[0], 0))
+                session.settimeout(TFTP_TIMEOUT)
+                wanted = TFTP_WRQ if self.receiving else TFTP_RRQ
+                if opcode != wanted:
+                    self._send_error(session, peer, 4, "illegal TFTP operation")
+                elif filename != self.name:
+                    self._send_error(session, peer, 1, "file not found")
+                elif self.receiving:
+                    data = self._receive_file(session, peer)
+                    if data is not None:
+                        self.data = data
+                        self.served += 1
+                elif self._send_file(session, peer):
+                    self.served += 1
+            finally:
+                session.close()
+
+    def _parse_request(self, packet):
+        if len(packet) < 4:
+            return None, None
+        opcode = struct.unpack("!H", packet[:2])[0]
+        filename = to_text(packet[2:].split(b"\0")[0], errors="surrogate_then_replace")
+        return opcode, filename.lstrip("/")
+
+    def _send_error(self, session, peer, code, message):
+        session.sendto(
+            struct.pack("!HH", TFTP_ERROR, code) + to_bytes(message) + b"\0", peer
+        )
+
+    def _send_file(self, session, peer):
+        """ lock step, one block out, its ack back; a short block ends it """
+        block = 1
+        while True:
+            chunk = self.data[(block - 1) * TFTP_BLOCK:block * TFTP_BLOCK]
+            packet = struct.pack("!HH", TFTP_DATA, block & 0xFFFF) + chunk
+            for attempt in range(TFTP_RETRIES):
+                if self._stop.is_set():
+                    return False
+                session.sendto(packet, peer)
+                if self._wait_ack(session, peer, block):
+                    break
+            else:
+                return False
+
+            if len(chunk) < TFTP_BLOCK:
+                return True
+            block += 1
+
+    def _receive_file(self, session, peer):
+        """ ack each block, the ack of the previous one again on a timeout """
+        chunks = []
+        block = 0
+        while True:
+            ack = struct.pack("!HH", TFTP_ACK, block & 0xFFFF)
+            for attempt in range(TFTP_RETRIES):
+                if self._stop.is_set():
+                    return None
+                session.sendto(ack, peer)
+                chunk = self._wait_data(session, peer, block + 1)
+                if chunk is not None:
+                    break
+            else:
+                return None
+
+            chunks.append(chunk)
+            block += 1
+            if len(chunk) < TFTP_BLOCK:
+                session.sendto(struct.pack("!HH", TFTP_ACK, block & 0xFFFF), peer)
+                return b"".join(chunks)
+
+    def _wait_data(self, session, peer, block):
+        while True:
+            try:
+                packet, sender = session.recvfrom(TFTP_BLOCK + 4)
+            except socket.timeout:
+                return None
+            if sender != peer or len(packet) < 4:
+                continue
+            opcode, number = struct.unpack("!HH", packet[:4])
+            if opcode == TFTP_ERROR:
+                return None
+            if opcode == TFTP_DATA and number == block & 0xFFFF:
+                return packet[4:]
+
+    def _wait_ack(self, session, peer, block):
+        while True:
+            try:
+                packet, sender = session.recvfrom(TFTP_BLOCK + 4)
+            except socket.timeout:
+                return False
+            if sender != peer or len(packet) < 4:
+                continue
+            opcode, acked = struct.unpack("!HH", packet[:4])
+            if opcode == TFTP_ERROR:
+                return False
+            if opcode == TFTP_ACK and acked == block & 0xFFFF:
+                return True
+
+
+class HttpTransfer(ServedTransfer):
+    """ plain HTTP GET, or PUT when receiving, of the one file """
+
+    scheme = "http"
+
+    def __init__(self, data, address, port=80, bind="", **kwargs):
+        super(HttpTransfer, self).__init__(data, address, port, **kwargs)
+        transfer = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+            def do_PUT(self):
+                if not transfer.receiving or self.path.lstrip("/") != transfer.name:
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                transfer.data = self.rfile.read(length)
+                transfer.served += 1
+                self.send_response(201)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                if transfer.receiving or self.path.lstrip("/") != transfer.name:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(transfer.data)))
+                self.end_headers()
+                self.wfile.write(transfer.data)
+                transfer.served += 1
+
+            def log_message(self, *args):
+                pass
+
+        self._server = BaseHTTPServer.HTTPServer((bind, port), Handler)
+        self.port = self._server.server_address[1]
+
+    def serve(self):
+        self._server.serve_forever(poll_interval=POLL_INTERVAL)
+
+    def stop(self):
+        self._server.shutdown()
+        super(HttpTransfer, self).stop()
+        self._server.server_close()
+
+
+class StagedTransfer(FileTransfer):
+    """ file put in a directory an existing server (scp, sftp, ...) publishes """
+
+    def __init__(self, data, url, directory, **kwargs):
+        super(StagedTransfer, self).__init__(data, None, **kwargs)
+        self.base_url = url.rstrip("/")
+        self.path = os.path.join(directory, self.name)
+
+    def url(self):
+        return "%s/%s" % (self.base_url, self.name)
+
+    def start(self):
+        if self.receiving:
+            return
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.data)
+
+    def received(self):
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def stop(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def file_transfer(mode, data, address=None, port=None, url=None, directory=None):
+    """ server for mode, one of tftp, http or staged; data None to receive """
+    if mode == "tftp":
+        return TftpTransfer(data, address, 69 if port is None else port)
+    if mode == "http":
+        return HttpTransfer(data, address, 80 if port is None else port)
+    if mode == "staged":
+        return StagedTransfer(data, url, directory)
+    raise ValueError("unknown file transfer mode %s" % mode)
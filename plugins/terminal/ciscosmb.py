@@ -33,6 +33,75 @@ from ansible.utils.display import Display
 
 display = Display()
 
+# (name, pattern, flags, keyword) of every error message the device may
+# answer with, keyword is lower case text any match of the rule contains
+STDERR_RULES = [
+    ("error", br"% ?Error", 0, b"error"),
+    ("percent_message", br"^% \w+", re.M, b"% "),
+    ("bad_secret", br"% ?Bad secret", 0, b"bad secret"),
+    ("bad_passwords", br"[\r\n%] Bad passwords", 0, b" bad passwords"),
+    ("invalid_input", br"invalid input", re.I, b"invalid input"),
+    ("incomplete_command", br"(?:incomplete|ambiguous) command", re.I, b" command"),
+    ("connection_timed_out", br"connection timed out", re.I, b"connection timed out"),
+    # "[^\r\n]+ not found", anchored at the line start it matches at anyway,
+    # instead of retrying the rest of the line from every character
+    ("not_found", br"(?:\A|(?<=[\r\n]))[^\r\n]+ not found", 0, b" not found"),
+    ("returned_error_code", br"'[^']' +returned error code: ?\d+", 0, b"returned error code"),
+    ("bad_mask", br"Bad mask", re.I, b"bad mask"),
+    ("overlaps", br"% ?(\S+) ?overlaps with ?(\S+)", re.I, b"overlaps with"),
+    ("error_label", br"[%\S] ?Error: ?[\s]+", re.I, b"error:"),
+    ("informational", br"[%\S] ?Informational: ?[\s]+", re.I, b"informational:"),
+    ("authorization_failed", br"Command authorization failed", 0, b"command authorization failed"),
+]
+
+_INLINE_FLAGS = ((re.I, b"i"), (re.M, b"m"))
+
+
+def _combine_rules(rules):
+    """ one alternation, each rule a named group with its own flags """
+    branches = []
+    for name, pattern, flags, keyword in rules:
+        inline = b"".join(char for flag, char in _INLINE_FLAGS if flags & flag)
+        if inline:
+            pattern = b"(?" + inline + b":" + pattern + b")"
+        branches.append(b"(?P<" + to_bytes(name) + b">" + pattern + b")")
+    return re.compile(b"|".join(branches))
+
+
+# single pass over the response, match.lastgroup names the rule that matched
+STDERR_RE = _combine_rules(STDERR_RULES)
+STDERR_KEYWORDS = tuple(set(rule[3] for rule in STDERR_RULES))
+
+
+def find_stderr(data):
+    """ first error message in data, match.lastgroup names the rule
+
+    Every match contains its rule keyword and, but for a quoted line break,
+    stays on the line of it. Plain substring tests find the earliest keyword
+    and the alternation only runs from the line it is on, clean output is
+    never run through it at all.
+    """
+    lowered = data.lower()
+    found = [at for at in (lowered.find(keyword) for keyword in STDERR_KEYWORDS) if at >= 0]
+    if not found:
+        return None
+
+    line_start = lowered.rfind(b"\n", 0, min(found))
+    return STDERR_RE.search(data, max(line_start - 2, 0))
+
+
+class StderrSearch(object):
+    """ find_stderr in the shape of a compiled pattern
+
+    network_cli calls search() of every entry of terminal_stderr_re on the
+    response received so far and logs the pattern of the one matching.
+    """
+
+    pattern = STDERR_RE.pattern
+
+    def search(self, data):
+        return find_stderr(data)
+
 
 class TerminalModule(TerminalBase):
 
@@ -42,22 +111,7 @@ class TerminalModule(TerminalBase):
         re.compile(br"[\r\n]?[\w\+\-\.:\/\[\]]+(?:\([^\)]+\)){0,3}(?:[>#]) ?$")
     ]
 
-    terminal_stderr_re = [
-        re.compile(br"% ?Error"),
-        re.compile(br"^% \w+", re.M),
-        re.compile(br"% ?Bad secret"),
-        re.compile(br"[\r\n%] Bad passwords"),
-        re.compile(br"invalid input", re.I),
-        re.compile(br"(?:incomplete|ambiguous) command", re.I),
-        re.compile(br"connection timed out", re.I),
-        re.compile(br"[^\r\n]+ not found"),
-        re.compile(br"'[^']' +returned error code: ?\d+"),
-        re.compile(br"Bad mask", re.I),
-        re.compile(br"% ?(\S+) ?overlaps with ?(\S+)", re.I),
-        re.compile(br"[%\S] ?Error: ?[\s]+", re.I),
-        re.compile(br"[%\S] ?Informational: ?[\s]+", re.I),
-        re.compile(br"Command authorization failed"),
-    ]
+    terminal_stderr_re = [StderrSearch()]
 
     def on_open_shell(self):
         try:
@@ -127,3 +181,48 @@ class TerminalModule(TerminalBase):
 
         elif prompt.endswith(b"#"):
             self._exec_cli_command(b"disable")
+
+
+class ResponseStream(object):
+    """ splits a command response arriving in chunks into lines
+
+    Only the unfinished last line is kept between chunks, it is where the
+    prompt ending the response shows up.
+    """
+
+    def __init__(self, command=None, prompt=None):
+        self.command = to_bytes(command).strip() if command else None
+        self.prompt = to_bytes(prompt).strip() if prompt else None
+        self.error = None
+        self.done = False
+        self._partial = b""
+
+    def feed(self, data):
+        """ returns the complete lines in data, without line ends """
+        data = self._partial + data
+        for regex in TerminalModule.ansi_re:
+            data = regex.sub(b"", data)
+
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+
+        out = []
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if self.command is not None:
+                # first line is the echo of the command
+                echo, self.command = self.command, None
+                if line.strip().endswith(echo):
+                    continue
+            if self.error is None and find_stderr(b"\n" + line):
+                self.error = line
+            out.append(line)
+
+        self.done = self._is_prompt(self._partial)
+        return out
+
+    def _is_prompt(self, line):
+        if self.prompt:
+            return line.strip() == self.prompt
+        return any(regex.search(line) for regex in TerminalModule.terminal_stdout_re)
+
@@ -0,0 +1,97 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Merging the per table interface dicts of a synthetic 8 unit, 416 port stack
+(status, configuration, description and addresses): the recursive merge the
+collection used before against ciscosmb_merge_dicts and
+ciscosmb_merge_all_dicts.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_merge_dicts.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import timeit
+
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import (
+    ciscosmb_merge_all_dicts,
+    ciscosmb_merge_dicts,
+)
+
+UNITS = 8
+PORTS = 52
+
+
+def stack_tables():
+    names = ["GigabitEthernet%d/0/%d" % (unit, port)
+             for unit in range(1, UNITS + 1) for port in range(1, PORTS + 1)]
+    status = dict(
+        (name, {"type": "1G-Copper", "duplex": "full", "bandwith": 1000000, "negotiation": "enabled",
+                "control": "off", "state": "up", "presure": "disabled", "mode": "off", "mtu": 1518})
+        for name in names
+    )
+    configuration = dict((name, {"admin_state": "up", "mdix": "auto"}) for name in names)
+    description = dict((name, {"description": "port %s" % name}) for name in names)
+    addresses = dict(
+        (name, {"ipv4": [{"address": "10.0.%d.1" % n, "subnet": "24"}], "mtu": 1518})
+        for n, name in enumerate(names[:64])
+    )
+    return [status, configuration, description, addresses]
+
+
+# the merge ciscosmb_merge_dicts used to run
+def old_merge_dicts(a, b, path=None):
+    if path is None:
+        path = []
+
+    if not bool(b):
+        return a
+
+    for key in b:
+        if key in a:
+            if isinstance(a[key], dict) and isinstance(b[key], dict):
+                old_merge_dicts(a[key], b[key], path + [str(key)])
+            elif a[key] == b[key]:
+                pass
+            else:
+                raise Exception("Conflict at %s" % ".".join(path + [str(key)]))
+        else:
+            a[key] = b[key]
+    return a
+
+
+def old(tables):
+    merged = {}
+    for table in tables:
+        merged = old_merge_dicts(merged, table)
+    return merged
+
+
+def new(tables):
+    merged = {}
+    for table in tables:
+        merged = ciscosmb_merge_dicts(merged, table)
+    return merged
+
+
+def batch(tables):
+    return ciscosmb_merge_all_dicts({}, tables)
+
+
+def main():
+    tables = stack_tables()
+    assert old(copy.deepcopy(tables)) == new(copy.deepcopy(tables)) == batch(copy.deepcopy(tables))
+
+    print("%d ports, %d tables" % (UNITS * PORTS, len(tables)))
+    for label, func in (("recursive merge", old), ("ciscosmb_merge_dicts", new), ("ciscosmb_merge_all_dicts", batch)):
+        # the merge fills the first table's dicts, every run gets fresh ones
+        runs = [copy.deepcopy(tables) for n in range(50)]
+        best = min(timeit.repeat(lambda: func(runs.pop()), number=10, repeat=5)) / 10
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Table parsing of a synthetic 8 unit, 416 port ``show interfaces status``:
+the dict based parser the collection used before against
+ciscosmb_iter_tables / ciscosmb_iter_rows.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_table_parser.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+import timeit
+
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import (
+    ciscosmb_iter_rows,
+    ciscosmb_iter_tables,
+)
+
+UNITS = 8
+PORTS = 52
+
+
+def interfaces_status():
+    lines = [
+        "                                             Flow Link          Back   Mdix",
+        "Port     Type         Duplex  Speed Neg      ctrl State       Pressure Mode",
+        "-------- ------------ ------  ----- -------- ---- ----------- -------- -------",
+    ]
+    for unit in range(1, UNITS + 1):
+        for port in range(1, PORTS + 1):
+            if port % 3:
+                lines.append("gi%d/0/%-4d 1G-Copper    Full    1000  Enabled  Off  Up          Disabled Off    " % (unit, port))
+            else:
+                lines.append("gi%d/0/%-4d 1G-Copper      --      --     --     --  Down           --     --    " % (unit, port))
+    lines += [
+        "",
+        "                                          Flow    Link        ",
+        "Ch       Type    Duplex  Speed  Neg      control  State       ",
+        "-------- ------- ------  -----  -------- -------  ----------- ",
+    ]
+    for channel in range(1, 33):
+        lines.append("Po%-6d    --     --      --      --       --    Not Present " % channel)
+    return "\n".join(lines) + "\n"
+
+
+# the parser ciscosmb_split_to_tables / ciscosmb_parse_table used to run
+def old_split_to_tables(data):
+    TABLE_HEADER = re.compile(r"^---+ +-+.*$")
+    EMPTY_LINE = re.compile(r"^ *$")
+
+    tables = dict()
+    tableno = -1
+    lineno = 0
+    tabledataget = False
+
+    for line in data.splitlines():
+        if re.match(EMPTY_LINE, line):
+            tabledataget = False
+            continue
+
+        if re.match(TABLE_HEADER, line):
+            tableno += 1
+            tabledataget = True
+            lineno = 0
+            tables[tableno] = dict()
+            tables[tableno]["header"] = line
+            tables[tableno]["data"] = dict()
+            continue
+
+        if tabledataget:
+            tables[tableno]["data"][lineno] = line
+            lineno += 1
+            continue
+
+    return tables
+
+
+def old_parse_table(table, allow_overflow=True, allow_empty_fields=None):
+    if allow_empty_fields is None:
+        allow_empty_fields = list()
+
+    fields_end = [m.start() for m in re.finditer("  *", table["header"].strip())]
+    fields_end.append(10000)
+
+    data = dict()
+    dataindex = 0
+    for lineno in table["data"]:
+        owerflownfields = list()
+        owerflow = False
+
+        line = table["data"][lineno]
+        line_elems = {}
+        index = 0
+        f_start = 0
+        for f_end in fields_end:
+            line_elems[index] = line[f_start:f_end].strip()
+            index += 1
+            f_start = f_end
+
+        if allow_overflow:
+            for elemno in line_elems:
+                if elemno not in allow_empty_fields and line_elems[elemno] == "":
+                    owerflow = True
+                else:
+                    owerflownfields.append(elemno)
+
+            if owerflow:
+                for fieldno in owerflownfields:
+                    data[dataindex - 1][fieldno] += line_elems[fieldno]
+            else:
+                data[dataindex] = line_elems
+                dataindex += 1
+        else:
+            data[dataindex] = line_elems
+            dataindex += 1
+
+    return data
+
+
+def old(data):
+    tables = old_split_to_tables(data)
+    return [
+        [row[0] for row in old_parse_table(tables[n]).values()] for n in sorted(tables)
+    ]
+
+
+def new(data):
+    return [[row[0] for row in ciscosmb_iter_rows(table)] for table in ciscosmb_iter_tables(data)]
+
+
+def main():
+    data = interfaces_status()
+    assert old(data) == new(data)
+
+    print("show interfaces status: %d ports, %d bytes" % (UNITS * PORTS, len(data)))
+    for label, func in (("dict parser", old), ("iter_tables/iter_rows", new)):
+        best = min(timeit.repeat(lambda: func(data), number=50, repeat=5)) / 50
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Error scanning of large responses: the 14 separate rules terminal_stderr_re
+used to hold against the combined STDERR_RE and find_stderr, the search
+network_cli now runs through StderrSearch. network_cli searches the whole
+response received so far after every chunk.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_terminal_stderr.py [megabytes]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+import sys
+import timeit
+
+from ansible_collections.community.ciscosmb.plugins.terminal.ciscosmb import (
+    STDERR_RE,
+    find_stderr,
+)
+
+SEPARATE_RULES = [
+    (br"% ?Error", 0),
+    (br"^% \w+", re.M),
+    (br"% ?Bad secret", 0),
+    (br"[\r\n%] Bad passwords", 0),
+    (br"invalid input", re.I),
+    (br"(?:incomplete|ambiguous) command", re.I),
+    (br"connection timed out", re.I),
+    (br"[^\r\n]+ not found", 0),
+    (br"'[^']' +returned error code: ?\d+", 0),
+    (br"Bad mask", re.I),
+    (br"% ?(\S+) ?overlaps with ?(\S+)", re.I),
+    (br"[%\S] ?Error: ?[\s]+", re.I),
+    (br"[%\S] ?Informational: ?[\s]+", re.I),
+    (br"Command authorization failed", 0),
+]
+
+CHUNK = 16384
+
+
+def running_config(megabytes):
+    block = (
+        b"interface GigabitEthernet1/0/%d\r\n"
+        b" description access port of room %d\r\n"
+        b" switchport mode access\r\n"
+        b" switchport access vlan 20\r\n"
+        b"!\r\n"
+    )
+    lines = []
+    size = 0
+    port = 0
+    while size < megabytes * 1024 * 1024:
+        port += 1
+        line = block % (port, port)
+        lines.append(line)
+        size += len(line)
+    return b"".join(lines) + b"switch#"
+
+
+def separate(rules, data):
+    return [m for m in (r.search(data) for r in rules) if m]
+
+
+def combined(data):
+    return STDERR_RE.search(data)
+
+
+def with_error(data):
+    """ an error at the very end, find_stderr can not skip the alternation """
+    return data[:-7] + b"% Error: bad VLAN\r\nswitch#"
+
+
+def separate_growing(rules, data):
+    """ every chunk rescans the whole response received so far """
+    for end in range(CHUNK, len(data) + CHUNK, CHUNK):
+        separate(rules, data[:end])
+
+
+def find_stderr_growing(data):
+    for end in range(CHUNK, len(data) + CHUNK, CHUNK):
+        find_stderr(data[:end])
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    data = running_config(megabytes)
+    rules = [re.compile(pattern, flags) for pattern, flags in SEPARATE_RULES]
+    failed = with_error(data)
+
+    print("response: %d bytes, %d byte chunks" % (len(data), CHUNK))
+    for label, func, number in (
+        ("14 rules, whole response", lambda: separate(rules, data), 5),
+        ("combined, whole response", lambda: combined(data), 5),
+        ("find_stderr, whole response", lambda: find_stderr(data), 5),
+        ("14 rules, error at the end", lambda: separate(rules, failed), 5),
+        ("find_stderr, error at the end", lambda: find_stderr(failed), 5),
+        ("14 rules, rescan per chunk", lambda: separate_growing(rules, data), 1),
+        ("find_stderr, rescan per chunk", lambda: find_stderr_growing(data), 1),
+    ):
+        best = min(timeit.repeat(func, number=number, repeat=3)) / number
+        print("%-30s %8.2f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
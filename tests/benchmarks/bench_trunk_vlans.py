@@ -0,0 +1,67 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Diffing the allowed VLANs of 48 trunk ports that allow 1-4094 against a
+desired list with one range taken out: the string expansion l2_interfaces
+used before against VlanSet.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_trunk_vlans.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import timeit
+
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VlanSet,
+)
+
+PORTS = 48
+HAVE = ["1-4094"]
+WANT = ["1-99", "200-4094"]
+
+
+# the expansion and diff l2_interfaces used to run
+def old_diff(want, have):
+    expanded = []
+    for each in have:
+        if "-" in each:
+            low, high = map(int, each.split("-"))
+            expanded.extend([str(vlan) for vlan in range(low, high + 1)])
+        else:
+            expanded.append(each)
+    wanted = []
+    for each in want:
+        if "-" in each:
+            low, high = map(int, each.split("-"))
+            wanted.extend([str(vlan) for vlan in range(low, high + 1)])
+        else:
+            wanted.append(each)
+    return sorted(set(expanded) - set(wanted), key=int)
+
+
+def new_diff(want, have):
+    return VlanSet.from_ranges(have) - VlanSet.from_ranges(want)
+
+
+def old(ports):
+    return [old_diff(WANT, HAVE) for port in range(ports)]
+
+
+def new(ports):
+    return [str(new_diff(WANT, HAVE)) for port in range(ports)]
+
+
+def main():
+    assert [str(VlanSet.from_ranges(each)) for each in old(1)] == new(1) == ["100-199"]
+
+    print("%d ports, allowed %s, want %s" % (PORTS, ",".join(HAVE), ",".join(WANT)))
+    for label, func in (("string expansion", old), ("VlanSet", new)):
+        best = min(timeit.repeat(lambda: func(PORTS), number=5, repeat=5)) / 5
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
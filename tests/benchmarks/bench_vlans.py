@@ -0,0 +1,77 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Overriding 1000 VLANs with 1000 others, half of them kept: the nested scan
+ios_vlans paired want and have with before against the vlan_id index, and
+the length of the command list with VLANs grouped into ranges.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_vlans.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import timeit
+
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.vlans.vlans import (
+    Vlans,
+)
+
+VLANS = 1000
+
+
+def vlans():
+    have = [dict(vlan_id=vlan_id, name="VLAN%04d" % vlan_id, mtu=1500) for vlan_id in range(2, VLANS + 2)]
+    want = [dict(vlan_id=vlan_id, name=None, mtu=None, remote_span=None, state=None, shutdown=None)
+            for vlan_id in range(VLANS // 2 + 2, VLANS // 2 + VLANS + 2)]
+    for each in want[:VLANS // 2]:
+        each.update(name="VLAN%04d" % each["vlan_id"], mtu=1500)
+    return want, have
+
+
+# the pairing overridden used to run
+def old_pairs(want, have):
+    want_local = list(want)
+    pairs = []
+    for each in have:
+        count = 0
+        for every in want_local:
+            if each["vlan_id"] == every["vlan_id"]:
+                break
+            count += 1
+        else:
+            pairs.append((each, None))
+            continue
+        pairs.append((each, every))
+        del want_local[count]
+    return pairs + [(None, each) for each in want_local]
+
+
+def new_pairs(want, have):
+    want_index = dict((each["vlan_id"], each) for each in want)
+    pairs = [(each, want_index.pop(each["vlan_id"], None)) for each in have]
+    return pairs + [(None, each) for each in want if each["vlan_id"] in want_index]
+
+
+def main():
+    want, have = vlans()
+    assert old_pairs(want, have) == new_pairs(want, have)
+
+    module = MagicMock()
+    module.params = {"state": "overridden"}
+    commands = Vlans(module)._state_overridden(want, have)
+    print("%d VLANs in have, %d in want, %d commands: %s" % (len(have), len(want), len(commands), commands))
+
+    for label, func in (
+        ("nested scan", lambda: old_pairs(want, have)),
+        ("vlan_id index", lambda: new_pairs(want, have)),
+        ("overridden", lambda: Vlans(module)._state_overridden(want, have)),
+    ):
+        best = min(timeit.repeat(func, number=5, repeat=5)) / 5
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Parsing a synthetic ``show vlan`` of 4094 VLANs: the line joining parser
+VlansFacts used before against the single pass parse_vlans. The output with
+wrapped port lists is parsed by parse_vlans only, the old parser lost the
+VLAN following every wrapped line.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_vlans_facts.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import timeit
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.facts.vlans.vlans import (
+    VlansFacts,
+)
+
+VLANS = 4094
+
+
+def show_vlan(wrapped=False):
+    lines = [
+        "",
+        "VLAN Name                             Status    Ports",
+        "---- -------------------------------- --------- -------------------------------",
+    ]
+    for vlan_id in range(1, VLANS + 1):
+        status = "act/lshut" if vlan_id % 10 == 0 else "active"
+        lines.append("%-4d VLAN%04d                         %-9s Gi1/0/1, Gi1/0/2, Gi1/0/3, Gi1/0/4" % (vlan_id, vlan_id, status))
+        if wrapped:
+            lines.append("                                                Gi1/0/5, Gi1/0/6")
+    lines += [
+        "",
+        "VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2",
+        "---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------",
+    ]
+    for vlan_id in range(1, VLANS + 1):
+        lines.append("%-4d enet  %-10d %-5d -      -      -        -    -        0      0" % (vlan_id, 100000 + vlan_id, 1500))
+    lines += [
+        "",
+        "Remote SPAN VLANs",
+        "------------------------------------------------------------------------------",
+        ",".join(str(vlan_id) for vlan_id in range(100, VLANS, 100)),
+        "",
+        "Primary Secondary Type              Ports",
+        "------- --------- ----------------- ------------------------------------------",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+# the parser VlansFacts.populate_facts used to run, without the validation
+def old_parse(spec, data):
+    objs = []
+    mtu_objs = []
+    remote_objs = []
+    final_objs = []
+    vlan_info = ""
+    temp = ""
+    vlan_name = True
+    for conf in data.split("\n"):
+        if len(list(filter(None, conf.split(" ")))) <= 2 and vlan_name:
+            temp = temp + conf
+            if len(list(filter(None, temp.split(" ")))) <= 2:
+                continue
+        if "VLAN Name" in conf:
+            vlan_info = "Name"
+        elif "VLAN Type" in conf:
+            vlan_info = "Type"
+            vlan_name = False
+        elif "Remote SPAN" in conf:
+            vlan_info = "Remote"
+            vlan_name = False
+        elif "VLAN AREHops" in conf or "STEHops" in conf:
+            vlan_info = "Hops"
+            vlan_name = False
+        elif "Primary Secondary" in conf:
+            vlan_info = "Primary"
+            vlan_name = False
+        if temp:
+            conf = temp
+            temp = ""
+        if conf and " " not in filter(None, conf.split("-")) and not conf.split(" ")[0] == "":
+            obj = old_render(spec, conf, vlan_info)
+            if "mtu" in obj:
+                mtu_objs.append(obj)
+            elif "remote_span" in obj:
+                remote_objs = obj
+            elif obj:
+                objs.append(obj)
+    for o, m in zip(objs, mtu_objs):
+        o.update(m)
+        final_objs.append(o)
+    if remote_objs:
+        for each in remote_objs.get("remote_span"):
+            for every in final_objs:
+                if each == every.get("vlan_id"):
+                    every.update({"remote_span": True})
+                    break
+    return objs
+
+
+def old_render(spec, conf, vlan_info):
+    config = deepcopy(spec)
+    if vlan_info == "Name" and "VLAN Name" not in conf:
+        conf = list(filter(None, conf.split(" ")))
+        config["vlan_id"] = int(conf[0])
+        config["name"] = conf[1]
+        if len(conf[2].split("/")) > 1:
+            config["state"] = "active" if conf[2].split("/")[0] == "act" else "suspend"
+            config["shutdown"] = "enabled"
+        else:
+            config["state"] = "active" if conf[2] == "active" else "suspend"
+            config["shutdown"] = "disabled"
+    elif vlan_info == "Type" and "VLAN Type" not in conf:
+        conf = list(filter(None, conf.split(" ")))
+        config["mtu"] = int(conf[3])
+    elif vlan_info == "Remote":
+        if len(conf.split(",")) > 1 or conf.isdigit():
+            config["remote_span"] = [int(each) for each in conf.split(",")]
+    return utils.remove_empties(config)
+
+
+def main():
+    facts = VlansFacts(MagicMock())
+    data = show_vlan()
+    wrapped = show_vlan(wrapped=True)
+    assert old_parse(facts.generated_spec, data) == facts.parse_vlans(data)
+    assert len(facts.parse_vlans(wrapped)) == VLANS
+
+    print("%d VLANs, %d lines, %d lines wrapped" % (VLANS, data.count("\n"), wrapped.count("\n")))
+    for label, func in (
+        ("line joining", lambda: old_parse(facts.generated_spec, data)),
+        ("parse_vlans", lambda: facts.parse_vlans(data)),
+        ("parse_vlans, wrapped", lambda: facts.parse_vlans(wrapped)),
+    ):
+        best = min(timeit.repeat(func, number=3, repeat=5)) / 3
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Pairing want with have for overridden on a synthetic 8 unit, 416 port stack:
+the nested scan the interface config classes used before against
+pair_by_name, and the l2_interfaces overridden state built on it.
+
+Run from a collection checkout on an ansible_collections path:
+
+    python tests/benchmarks/bench_want_have.py
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import timeit
+
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.l2_interfaces.l2_interfaces import (
+    L2_Interfaces,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
+    pair_by_name,
+)
+
+UNITS = 8
+PORTS = 52
+
+
+def stack():
+    names = ["GigabitEthernet%d/0/%d" % (unit, port)
+             for unit in range(1, UNITS + 1) for port in range(1, PORTS + 1)]
+    have = [dict(name=name, mode="access", access=dict(vlan=10)) for name in names]
+    want = [dict(name=name, mode="access", access=dict(vlan=20), trunk=None) for name in reversed(names)]
+    return want, have
+
+
+# the pairing overridden used to run
+def old_pairs(want, have):
+    pairs = []
+    for each in have:
+        for interface in want:
+            if each["name"] == interface["name"]:
+                break
+        else:
+            interface = None
+        pairs.append((each, interface))
+    return pairs
+
+
+def main():
+    want, have = stack()
+    assert old_pairs(want, have) == pair_by_name(have, want)
+
+    module = MagicMock()
+    module.params = {"state": "rendered"}
+    l2_interfaces = L2_Interfaces(module)
+
+    print("%d ports" % len(have))
+    for label, func in (
+        ("nested scan", lambda: old_pairs(want, have)),
+        ("pair_by_name", lambda: pair_by_name(have, want)),
+        ("l2 overridden", lambda: l2_interfaces._state_overridden(want, have, module)),
+    ):
+        best = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print("%-25s %8.3f ms" % (label, best * 1000))
+
+
+if __name__ == "__main__":
+    main()
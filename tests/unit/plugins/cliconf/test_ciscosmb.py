@@ -0,0 +1,521 @@
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.six.moves.urllib.request import Request, urlopen
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.ciscosmb.plugins.cliconf.ciscosmb import Cliconf
+
+
+class FakeConnection(object):
+    """ records what is sent, answers from a {command: output} map """
+
+    _ssh_type = "paramiko"
+
+    def __init__(self, outputs=None, errors=None):
+        self.outputs = outputs or dict()
+        self.errors = errors or dict()
+        self.sent = list()
+        self.waited = list()
+
+    def get_option(self, option):
+        return {"host": "192.0.2.1", "persistent_command_timeout": 30}[option]
+
+    def queue_message(self, level, message):
+        self.messages = getattr(self, "messages", []) + [(level, message)]
+
+    def get_prompt(self):
+        return b"switch#"
+
+    def send(self, command, sendonly=False, **kwargs):
+        command = command.decode()
+        self.sent.append(command)
+        if sendonly:
+            return None
+        self.waited.append(command)
+        if command in self.errors:
+            raise AnsibleConnectionFailure(self.errors[command])
+        return self.outputs.get(command, "")
+
+
+class CopyingConnection(FakeConnection):
+    """ fetches the url of a "copy <url> running-config" like the switch,
+    or uploads config to the url of a "copy running-config <url>" """
+
+    config = b"hostname sw-example\r\ninterface vlan 1\r\n"
+
+    def send(self, command, sendonly=False, **kwargs):
+        out = super(CopyingConnection, self).send(command, sendonly, **kwargs)
+        words = command.decode().split()
+        if words[0] != "copy":
+            return out
+        if words[1].endswith("-config"):
+            urlopen(Request(words[2], data=self.config, method="PUT")).read()
+            self.copied = self.config
+        else:
+            self.copied = urlopen(words[1]).read()
+        return "Copy: %d bytes copied in 00:00:01 [hh:mm:ss]" % len(self.copied)
+
+
+class FakeShell(object):
+    """ paramiko channel handing out the response in fixed chunks, or in
+    the chunks given """
+
+    def __init__(self, response, *chunks, **kwargs):
+        chunk = kwargs.get("chunk", 7)
+        self.sent = list()
+        self.timeout = None
+        self.timeouts = list()
+        if chunks:
+            self.chunks = [response] + list(chunks)
+        else:
+            self.chunks = [response[i:i + chunk] for i in range(0, len(response), chunk)]
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def recv(self, size):
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def gettimeout(self):
+        return self.timeout
+
+    def settimeout(self, timeout):
+        self.timeouts.append(timeout)
+        self.timeout = timeout
+
+
+class TestCiscoSMBCliconf(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_option = patch.object(Cliconf, "get_option")
+        self.get_option = self.mock_option.start()
+        self.options = {
+            "config_window": 0,
+            "config_cache_dir": None,
+            "config_cache_max_age": 3600,
+            "config_transfer": "none",
+            "config_transfer_address": None,
+            "config_transfer_port": None,
+            "config_transfer_dir": None,
+            "config_transfer_url": None,
+            "config_transfer_min_lines": 50,
+            "config_transfer_fetch": False,
+        }
+        self.get_option.side_effect = lambda name: self.options[name]
+
+    def tearDown(self):
+        self.mock_option.stop()
+
+    def test_edit_config_per_line(self):
+        connection = FakeConnection()
+        cliconf = Cliconf(connection)
+
+        resp = cliconf.edit_config(["vlan 10", "!", "vlan 20", "end"])
+
+        self.assertEqual(resp["request"], ["vlan 10", "vlan 20"])
+        self.assertEqual(
+            connection.waited, ["configure terminal", "vlan 10", "vlan 20", "end"]
+        )
+
+    def test_edit_config_pipelined(self):
+        self.options["config_window"] = 3
+        connection = FakeConnection()
+        candidate = ["vlan %d" % n for n in range(1, 8)]
+        connection._ssh_shell = FakeShell(*[
+            b"".join(b"switch(config)#vlan %d\r\n" % n for n in window) + b"switch(config)#"
+            for window in ([1, 2, 3], [4, 5, 6], [7])
+        ])
+        cliconf = Cliconf(connection)
+
+        resp = cliconf.edit_config(candidate)
+
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(len(resp["response"]), len(candidate))
+        # the windows are read off the channel, no prompt wait per line
+        self.assertEqual(connection.waited, ["configure terminal", "end"])
+        self.assertEqual(connection._ssh_shell.chunks, [])
+        self.assertEqual(
+            [cmd for cmd in connection.sent if cmd.startswith("vlan")], candidate
+        )
+
+    def test_edit_config_window_without_channel_per_line(self):
+        self.options["config_window"] = 3
+        connection = FakeConnection()
+        cliconf = Cliconf(connection)
+
+        cliconf.edit_config(["vlan 1", "vlan 2", "vlan 3"])
+
+        self.assertEqual(
+            connection.waited, ["configure terminal", "vlan 1", "vlan 2", "vlan 3", "end"]
+        )
+
+    def test_edit_config_pipelined_prompt_line(self):
+        self.options["config_window"] = 10
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(
+            b"switch(config)#vlan 10\r\nswitch(config)#",
+            b"switch(config)#vlan 30\r\nswitch(config)#",
+        )
+        cliconf = Cliconf(connection)
+        candidate = [
+            "vlan 10",
+            {"command": "no vlan 20", "prompt": "continue", "answer": "y"},
+            "vlan 30",
+        ]
+
+        cliconf.edit_config(candidate)
+
+        self.assertEqual(
+            connection.waited, ["configure terminal", "no vlan 20", "end"]
+        )
+        self.assertEqual(connection._ssh_shell.chunks, [])
+
+    def test_edit_config_pipelined_reports_failed_line(self):
+        self.options["config_window"] = 4
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(
+            b"switch(config)#vlan 10\r\nswitch(config)#vlan 5000\r\n% Error: bad VLAN\r\n"
+            b"switch(config)#vlan 30\r\nswitch(config)#vlan 40\r\nswitch(config)#",
+            chunk=16,
+        )
+        cliconf = Cliconf(connection)
+
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            cliconf.edit_config(["vlan 10", "vlan 5000", "vlan 30", "vlan 40", "vlan 50"])
+
+        self.assertIn("configuration line 'vlan 5000' failed", str(exc.exception))
+        self.assertIn("already sent after it: vlan 30, vlan 40", str(exc.exception))
+        # no window after the failing one
+        self.assertNotIn("vlan 50", connection.sent)
+        self.assertNotIn("end", connection.sent)
+
+    def test_edit_config_window_reads_to_last_echo(self):
+        self.options["config_window"] = 3
+        connection = FakeConnection()
+        # the first prompt arrives on its own, echoes and prompts of the
+        # later lines trail behind it
+        connection._ssh_shell = FakeShell(
+            b"switch(config)#",
+            b"vlan 10\r\nswitch(config)#",
+            b"vlan 1\r\nswitch(config)#interface vlan 1\r\n",
+            b"switch(config-if)#",
+        )
+        cliconf = Cliconf(connection)
+
+        resp = cliconf.edit_config(["vlan 10", "vlan 1", "interface vlan 1"])
+
+        self.assertEqual(resp["response"], ["", "", ""])
+        self.assertEqual(connection._ssh_shell.chunks, [])
+        self.assertEqual(connection.waited, ["configure terminal", "end"])
+
+    def test_edit_config_window_reports_error_of_later_line(self):
+        self.options["config_window"] = 3
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(
+            b"switch(config)#vlan 10\r\nswitch(config)#",
+            b"vlan 5000\r\n% Error: bad VLAN\r\nswitch(config)#",
+            b"vlan 30\r\nswitch(config)#",
+        )
+        cliconf = Cliconf(connection)
+
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            cliconf.edit_config(["vlan 10", "vlan 5000", "vlan 30", "vlan 40"])
+
+        self.assertIn("configuration line 'vlan 5000' failed", str(exc.exception))
+        self.assertIn("already sent after it: vlan 30", str(exc.exception))
+        # nothing of the window is left for the next command
+        self.assertEqual(connection._ssh_shell.chunks, [])
+        self.assertNotIn("vlan 40", connection.sent)
+
+    def test_find_failed_config_line_prefers_longest_echo(self):
+        cliconf = Cliconf(MagicMock())
+        error = "switch(config)#vlan 10\r\n% Invalid input detected"
+
+        self.assertEqual(
+            cliconf._find_failed_config_line(["vlan 1", "vlan 10"], error), "vlan 10"
+        )
+        self.assertIsNone(cliconf._find_failed_config_line(["vlan 1"], "no error here"))
+
+    def test_get_device_info_cached(self):
+        connection = FakeConnection(outputs={
+            "show version": "Active-image: flash://system/images/image1.bin\n  Version: 3.0.0.61\n",
+            "show inventory": 'NAME: "1"    DESCR: "CBS350-24P-4G 24-Port Gigabit PoE Managed Switch"\n'
+                              'PID: CBS350-24P-4G-EU   VID: V01   SN: FOC2222291D\n',
+            "show system": "System Description:     CBS350-24P-4G 24-Port Gigabit PoE Managed Switch\n"
+                           "System Name:            sw-example\n",
+        })
+        cliconf = Cliconf(connection)
+
+        info = cliconf.get_device_info()
+        cliconf.get_device_info()
+
+        self.assertEqual(info["network_os_version"], "3.0.0.61")
+        # the PID keeps the suffix the description leaves out
+        self.assertEqual(info["network_os_model"], "CBS350-24P-4G-EU")
+        self.assertEqual(info["network_os_hostname"], "sw-example")
+        self.assertEqual(connection.waited, ["show version", "show inventory", "show system"])
+
+        cliconf.edit_config(["hostname sw-renamed"])
+        cliconf.get_device_info()
+        self.assertEqual(connection.waited.count("show system"), 2)
+
+    def test_get_device_info_fw1(self):
+        connection = FakeConnection(outputs={
+            "show version": "SW version    1.4.8.6 ( date  10-Jul-2017 time  17:07:33 )\n",
+        })
+        cliconf = Cliconf(connection)
+
+        self.assertEqual(cliconf.get_device_info()["network_os_version"], "1.4.8.6")
+        cliconf.reset_device_info()
+        cliconf.get_device_info()
+        self.assertEqual(connection.waited.count("show version"), 2)
+
+    def test_check_device_type_from_model(self):
+        connection = FakeConnection(outputs={
+            "show system": "System Description:     SG500-52 52-Port Gigabit Stackable Managed Switch\n",
+        })
+        cliconf = Cliconf(connection)
+
+        self.assertEqual(cliconf.check_device_type(), "L2")
+        self.assertEqual(cliconf.check_device_type(), "L2")
+        self.assertNotIn("show vlan", connection.sent)
+        self.assertNotIn("show vlan tag 1", connection.sent)
+
+    def test_check_device_type_probe(self):
+        connection = FakeConnection(errors={"show vlan tag 1": b"% Unrecognized command"})
+        cliconf = Cliconf(connection)
+
+        self.assertEqual(cliconf.check_device_type(), "L3")
+        self.assertEqual(cliconf.check_device_type(), "L3")
+        self.assertEqual(connection.waited.count("show vlan tag 1"), 1)
+
+    def test_get_config_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.options["config_cache_dir"] = os.path.join(cache_dir, "configs")
+        system = (
+            "System Up Time (days,hour:min:sec):       483,01:39:47\n"
+            "System Name:   sw-example\n"
+            "\n"
+            "Unit Temperature (Celsius)   Status\n"
+            "---- --------------------- ----------\n"
+            " 1            55               OK\n"
+        )
+        outputs = {"show system": system, "show running-config ": "hostname sw-example"}
+
+        connection = FakeConnection(outputs=outputs)
+        self.assertEqual(Cliconf(connection).get_config(), "hostname sw-example")
+        self.assertTrue(os.path.exists(os.path.join(cache_dir, "configs", "192.0.2.1.json")))
+
+        # a new connection, the uptime and temperature moved on but the
+        # switch did not reboot
+        outputs["show system"] = system.replace("01:39:47", "01:40:07").replace(" 55 ", " 57 ")
+        connection = FakeConnection(outputs=outputs)
+        cliconf = Cliconf(connection)
+        self.assertEqual(cliconf.get_config(), "hostname sw-example")
+        self.assertEqual(connection.waited, ["show system"])
+
+        # rebooted since
+        outputs["show system"] = system.replace("483,01:39:47", "0,00:05:00")
+        cliconf.get_config()
+        self.assertEqual(connection.waited.count("show running-config "), 1)
+
+        # another switch behind the same address
+        other = FakeConnection(outputs=dict(outputs, **{"show system": system.replace("sw-example", "sw-other")}))
+        Cliconf(other).get_config()
+        self.assertEqual(other.waited.count("show running-config "), 1)
+
+        # changes sent through the plugin drop the cached copy
+        cliconf.edit_config(["vlan 10"])
+        cliconf.get_config()
+        self.assertEqual(connection.waited.count("show running-config "), 2)
+
+        self.options["config_cache_max_age"] = 0
+        cliconf.get_config()
+        self.assertEqual(connection.waited.count("show running-config "), 3)
+
+    def test_run_commands(self):
+        connection = FakeConnection(
+            outputs={"show clock": "12:00:00", "show users": "admin"},
+            errors={"show bogus": "% Unrecognized command"},
+        )
+        cliconf = Cliconf(connection)
+
+        self.assertEqual(
+            cliconf.run_commands(["show clock", {"command": "show users"}]),
+            ["12:00:00", "admin"],
+        )
+        self.assertEqual(
+            cliconf.run_commands(["show bogus", "show clock"], check_rc=False),
+            [{"error": "% Unrecognized command"}, "12:00:00"],
+        )
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            cliconf.run_commands(["show clock", "show bogus"])
+        self.assertIn("command 'show bogus' failed", str(exc.exception))
+
+    def test_command_timing(self):
+        connection = FakeConnection(outputs={"show clock": "12:00:00", "show users": "admin"})
+        cliconf = Cliconf(connection)
+
+        cliconf.run_commands(["show clock", "show users"])
+        timing = cliconf.get_command_timing()
+
+        self.assertEqual([entry["command"] for entry in timing], ["show clock", "show users"])
+        self.assertEqual([entry["bytes"] for entry in timing], [8, 5])
+        self.assertTrue(all(entry["wall_time"] >= 0 for entry in timing))
+
+    def test_iter_command_streams_lines(self):
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(
+            b"show interfaces status\r\nPort  Type\r\ngi1/1 1G\r\n\x1b[mgi1/2 1G\r\nswitch#"
+        )
+        cliconf = Cliconf(connection)
+
+        lines = cliconf.iter_command("show interfaces status")
+        self.assertEqual(next(lines), "Port  Type")
+        # only what the first line needed has been read so far
+        self.assertTrue(connection._ssh_shell.chunks)
+        self.assertEqual(list(lines), ["gi1/1 1G", "gi1/2 1G"])
+        self.assertEqual(connection._ssh_shell.sent, [b"show interfaces status\r"])
+        # command timeout while reading, the previous one restored after
+        self.assertEqual(connection._ssh_shell.timeouts, [30, None])
+
+    def test_iter_command_libssh_buffered(self):
+        connection = FakeConnection(outputs={"show clock": "12:00:00\n13:00:00"})
+        connection._ssh_type = "ansible.netcommon.libssh"
+        connection._ssh_shell = FakeShell(b"")
+        cliconf = Cliconf(connection)
+
+        self.assertEqual(list(cliconf.iter_command("show clock")), ["12:00:00", "13:00:00"])
+        self.assertEqual(connection._ssh_shell.sent, [])
+        self.assertEqual(connection.waited, ["show clock"])
+
+    def test_iter_command_early_close_drains(self):
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(b"show tech\r\n" + b"line\r\n" * 50 + b"switch#")
+        cliconf = Cliconf(connection)
+
+        lines = cliconf.iter_command("show tech")
+        next(lines)
+        lines.close()
+        self.assertEqual(connection._ssh_shell.chunks, [])
+
+    def test_iter_command_error(self):
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(b"show bogus\r\n% Unrecognized command\r\nswitch#")
+        cliconf = Cliconf(connection)
+
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            list(cliconf.iter_command("show bogus"))
+        self.assertIn("% Unrecognized command", str(exc.exception))
+
+    def test_get_to_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "tech.txt")
+        connection = FakeConnection()
+        connection._ssh_shell = FakeShell(b"show tech\r\nline 1\r\nline 2\r\nswitch#")
+
+        result = Cliconf(connection).get_to_file("show tech", path)
+
+        self.assertEqual(result, {"path": path, "bytes": 14, "lines": 2})
+        with open(path) as f:
+            self.assertEqual(f.read(), "line 1\nline 2\n")
+        self.assertEqual(os.listdir(directory), ["tech.txt"])
+
+    def test_edit_config_transfer(self):
+        self.options.update({
+            "config_transfer": "http",
+            "config_transfer_address": "127.0.0.1",
+            "config_transfer_port": 0,
+            "config_transfer_min_lines": 3,
+        })
+        connection = CopyingConnection()
+        cliconf = Cliconf(connection)
+        candidate = ["vlan %d" % n for n in range(1, 5)]
+
+        # the switch merges a copied file, it is no replace
+        self.assertFalse(cliconf.get_device_operations()["supports_replace"])
+        resp = cliconf.edit_config(candidate)
+
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(connection.copied, b"vlan 1\nvlan 2\nvlan 3\nvlan 4\n")
+        self.assertEqual(len(connection.waited), 1)
+        self.assertTrue(connection.waited[0].endswith(".cfg running-config"))
+
+        # below the threshold the CLI is used
+        cliconf.edit_config(candidate[:2])
+        self.assertIn("configure terminal", connection.waited)
+        self.assertRaises(ValueError, cliconf.edit_config, candidate[:2], replace=True)
+
+    def test_edit_config_transfer_failed(self):
+        self.options.update({"config_transfer": "staged", "config_transfer_min_lines": 1})
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.options["config_transfer_dir"] = directory
+        self.options["config_transfer_url"] = "scp://backup@192.0.2.10/configs"
+        connection = FakeConnection()
+        cliconf = Cliconf(connection)
+
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            cliconf.edit_config(["vlan 10"])
+        self.assertIn("copy of the configuration from scp://backup@192.0.2.10/configs/", str(exc.exception))
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_get_config_transfer(self):
+        self.options.update({
+            "config_transfer": "http",
+            "config_transfer_address": "127.0.0.1",
+            "config_transfer_port": 0,
+            "config_transfer_fetch": True,
+        })
+        connection = CopyingConnection()
+
+        config = Cliconf(connection).get_config(source="startup")
+
+        self.assertEqual(config, "hostname sw-example\ninterface vlan 1")
+        self.assertTrue(connection.waited[0].startswith("copy startup-config http://127.0.0.1:"))
+        self.assertNotIn("show startup-config ", connection.waited)
+
+    def test_get_config_transfer_fallback(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.options.update({
+            "config_transfer": "staged",
+            "config_transfer_dir": directory,
+            "config_transfer_url": "scp://backup@192.0.2.10/configs",
+            "config_transfer_fetch": True,
+        })
+        # the switch claims success but the file never shows up
+        connection = CopyingConnection(outputs={"show running-config ": "hostname sw-cli"})
+        connection.send = lambda command, sendonly=False, **kwargs: (
+            "Copy: 10 bytes copied" if command.startswith(b"copy")
+            else FakeConnection.send(connection, command, sendonly, **kwargs)
+        )
+
+        self.assertEqual(Cliconf(connection).get_config(), "hostname sw-cli")
+        self.assertEqual(connection.messages[0][0], "warning")
+        self.assertIn("nothing arrived", connection.messages[0][1])
@@ -0,0 +1,191 @@
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb import (
+    ciscosmb_enable_timing,
+    ciscosmb_iter_rows,
+    ciscosmb_merge_all_dicts,
+    ciscosmb_merge_dicts,
+    ciscosmb_iter_tables,
+    ciscosmb_parse_records,
+    ciscosmb_parse_table,
+    ciscosmb_split_to_tables,
+    run_commands,
+)
+
+LLDP_NEIGHBORS = """System capability legend:
+B - Bridge; R - Router; W - Wlan Access Point; T - telephone;
+
+  Port        Device ID        Port ID       System Name    Capabilities  TTL
+--------- ----------------- ------------- ----------------- ------------ -----
+gi1/4     b0:ba:6a:c2:41:80 b0:ba:6a:c2:4 b0:ba:6a:c2:41:80      W        106
+                            1:80
+gi1/5     3a:e6:da:4a:52:1e 3a:e6:da:4a:5                        O       3092
+                            2:1e
+gi1/18    00:1a:a9:49:2d:80     Gi0/2     sw-xy-zxxqwe-4.es      B        119
+                                          .example.com
+
+    Ch       Type
+-------- ------------
+Po1      Gigabit
+"""
+
+
+class TestRunCommands(unittest.TestCase):
+
+    def test_single_rpc(self):
+        module = MagicMock()
+        module._ciscosmb_connection.run_commands.return_value = [b"12:00:00", u"admin"]
+
+        responses = run_commands(module, ["show clock", "show users"], check_rc=False)
+
+        self.assertEqual(responses, [u"12:00:00", u"admin"])
+        module._ciscosmb_connection.run_commands.assert_called_once_with(
+            commands=["show clock", "show users"], check_rc=False
+        )
+
+    def test_failed_command_skipped(self):
+        module = MagicMock()
+        module._ciscosmb_connection.run_commands.return_value = [
+            {"error": u"% Unrecognized command"}, u"12:00:00",
+        ]
+
+        responses = run_commands(module, ["show bogus", "show clock"], check_rc=False)
+
+        # the error message never reaches a parser as output
+        self.assertEqual(responses, [None, u"12:00:00"])
+        module.warn.assert_called_once_with(u"command show bogus failed: % Unrecognized command")
+
+    def test_timing(self):
+        module = MagicMock(spec=[])
+        module._ciscosmb_connection = MagicMock()
+        module._ciscosmb_connection.run_commands.return_value = [u"12:00:00"]
+        module._ciscosmb_connection.get_command_timing.return_value = [
+            {"command": "show clock", "wall_time": 0.25, "bytes": 8},
+        ]
+        timing = ciscosmb_enable_timing(module)
+
+        run_commands(module, ["show clock"])
+
+        self.assertEqual(len(timing), 1)
+        self.assertEqual(timing[0]["commands"], [{"command": "show clock", "wall_time": 0.25, "bytes": 8}])
+        self.assertGreaterEqual(timing[0]["wall_time"], 0)
+
+
+class TestTables(unittest.TestCase):
+
+    def test_iter_tables(self):
+        tables = list(ciscosmb_iter_tables(LLDP_NEIGHBORS))
+
+        self.assertEqual(len(tables), 2)
+        self.assertEqual(len(tables[0][1]), 6)
+        self.assertEqual(tables[1][1], ["Po1      Gigabit"])
+
+    def test_iter_rows_merges_overflow(self):
+        table = next(ciscosmb_iter_tables(LLDP_NEIGHBORS))
+
+        rows = list(ciscosmb_iter_rows(table, allow_empty_fields=[3]))
+
+        self.assertEqual(rows[0], ("gi1/4", "b0:ba:6a:c2:41:80", "b0:ba:6a:c2:41:80", "b0:ba:6a:c2:41:80", "W", "106"))
+        self.assertEqual(rows[1][2:4], ("3a:e6:da:4a:52:1e", ""))
+        self.assertEqual(rows[2][3], "sw-xy-zxxqwe-4.es.example.com")
+        self.assertEqual(len(list(ciscosmb_iter_rows(table, allow_overflow=False))), 6)
+
+    def test_legacy_dicts(self):
+        tables = ciscosmb_split_to_tables(LLDP_NEIGHBORS)
+
+        self.assertEqual(sorted(tables), [0, 1])
+        self.assertEqual(tables[1]["data"], {0: "Po1      Gigabit"})
+        self.assertEqual(ciscosmb_parse_table(tables[1]), {0: {0: "Po1", 1: "Gigabit"}})
+
+
+class TestMergeDicts(unittest.TestCase):
+
+    def test_nested_merge(self):
+        a = {"gi1/1": {"state": "up", "ipv4": {"address": "10.0.0.1"}}}
+        b = {"gi1/1": {"mtu": 1518, "ipv4": {"address": "10.0.0.1", "subnet": "24"}}, "gi1/2": {}}
+
+        self.assertIs(ciscosmb_merge_dicts(a, b), a)
+        self.assertEqual(a, {
+            "gi1/1": {"state": "up", "mtu": 1518, "ipv4": {"address": "10.0.0.1", "subnet": "24"}},
+            "gi1/2": {},
+        })
+
+    def test_conflict_path(self):
+        a = {"gi1/1": {"ipv4": {"subnet": "24"}}}
+        b = {"gi1/1": {"ipv4": {"subnet": "16"}}}
+
+        with self.assertRaises(Exception) as context:
+            ciscosmb_merge_dicts(a, b, ["interfaces"])
+        self.assertEqual(str(context.exception), "Conflict at interfaces.gi1/1.ipv4.subnet")
+
+    def test_merge_all(self):
+        tables = [
+            {"gi1/1": {"state": "up"}, "gi1/2": {"state": "down"}},
+            {"gi1/1": {"admin_state": "up"}},
+            {},
+            {"gi1/2": {"description": None}},
+        ]
+
+        self.assertEqual(ciscosmb_merge_all_dicts({}, tables), {
+            "gi1/1": {"state": "up", "admin_state": "up"},
+            "gi1/2": {"state": "down", "description": None},
+        })
+
+
+class TestRecords(unittest.TestCase):
+
+    STATUS = """
+Port     Type         Duplex  Speed Neg      ctrl State
+-------- ------------ ------  ----- -------- ---- -----------
+gi1/1    1G-Copper    Full    1000  Enabled  Off  Up
+gi1/2    1G-Copper      --    100      --     --  Down
+
+Ch       Type    Duplex  Speed  Neg      control  State
+-------- ------- ------  -----  -------- -------  -----------
+Po1         --     --      --      --       --    Not Present
+"""
+
+    SCHEMA = [
+        {
+            "key": (0, "interface"),
+            "columns": [
+                ("type", 1, "str"),
+                ("duplex", 2, "lower"),
+                ("bandwith", 3, "kbit", (6, "Up")),
+                ("state", 6, "lower"),
+            ],
+            "null": ["--"],
+        },
+    ]
+
+    def test_typed_records(self):
+        records = list(ciscosmb_parse_records(self.STATUS, self.SCHEMA))
+
+        self.assertEqual(records, [
+            ("GigabitEthernet1/1", {"type": "1G-Copper", "duplex": "full", "bandwith": 1000000, "state": "up"}),
+            ("GigabitEthernet1/2", {"type": "1G-Copper", "duplex": None, "bandwith": None, "state": "down"}),
+        ])
+
+    def test_one_schema_per_table(self):
+        records = dict(ciscosmb_parse_records(self.STATUS, self.SCHEMA * 2))
+
+        self.assertEqual(records["Port-channel1"]["state"], "not present")
@@ -0,0 +1,73 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_interface_names import (
+    IOS_INTERFACE_TYPES,
+    InterfaceNames,
+    canonical_interface_names,
+    ios_interface_names,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
+    get_interface_type,
+    normalize_interface,
+)
+
+
+class TestCanonicalInterfaceNames(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(canonical_interface_names.normalize("gi1/0/1"), "GigabitEthernet1/0/1")
+        self.assertEqual(canonical_interface_names.normalize("te1/0/2"), "TenGigabitEthernet1/0/2")
+        self.assertEqual(canonical_interface_names.normalize("Po 1"), "Port-channel1")
+        # exact and case sensitive, PO is POS
+        self.assertEqual(canonical_interface_names.normalize("PO1"), "POS1")
+        self.assertEqual(canonical_interface_names.normalize("vlan 1"), "vlan1")
+        self.assertEqual(canonical_interface_names.normalize("oob"), "oob")
+        self.assertEqual(canonical_interface_names.normalize(""), "")
+
+    def test_short(self):
+        self.assertEqual(canonical_interface_names.short("GigabitEthernet1/0/1"), "Gi1/0/1")
+        self.assertEqual(canonical_interface_names.short("gi1/0/1"), "Gi1/0/1")
+        self.assertEqual(canonical_interface_names.short("Port-channel8"), "Po8")
+        self.assertEqual(canonical_interface_names.short("oob"), "oob")
+
+    def test_normalize_all(self):
+        self.assertEqual(
+            canonical_interface_names.normalize_all(["gi1/0/1", "fa1/0/2", "gi1/0/1"]),
+            ["GigabitEthernet1/0/1", "FastEthernet1/0/2", "GigabitEthernet1/0/1"],
+        )
+
+
+class TestIosInterfaceNames(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(normalize_interface("gi0/1"), "GigabitEthernet0/1")
+        self.assertEqual(normalize_interface("Gi 0/1"), "GigabitEthernet0/1")
+        self.assertEqual(normalize_interface("po10"), "Port-channel10")
+        self.assertEqual(normalize_interface("vlan 20"), "Vlan20")
+        self.assertEqual(normalize_interface("Loopback999"), "loopback999")
+        self.assertEqual(normalize_interface("Virtual-Template1"), "Virtual-Template1")
+        self.assertEqual(normalize_interface("Gi1/0/1:2"), "GigabitEthernet1/0/1:2")
+        self.assertIsNone(normalize_interface(None))
+
+    def test_longest_prefix(self):
+        self.assertEqual(normalize_interface("TwentyFiveGigE1/0/1"), "TwentyFiveGigE1/0/1")
+        self.assertEqual(get_interface_type("TwentyFiveGigE1/0/1"), "TwentyFiveGigE")
+        self.assertEqual(get_interface_type("Tw1/0/1"), "TwoGigabitEthernet")
+        self.assertEqual(get_interface_type("LongReachEthernet0"), "LongReachEthernet")
+        self.assertEqual(get_interface_type("lo0"), "loopback")
+        self.assertEqual(get_interface_type("Bdi1"), "unknown")
+
+    def test_short(self):
+        self.assertEqual(ios_interface_names.short("GigabitEthernet0/1"), "Gi0/1")
+        self.assertEqual(ios_interface_names.short("Vlan20"), "Vl20")
+
+    def test_bounded_cache(self):
+        names = InterfaceNames(prefixes=IOS_INTERFACE_TYPES, cache_size=4)
+        for port in range(10):
+            self.assertEqual(names.normalize("gi0/%d" % port), "GigabitEthernet0/%d" % port)
+        self.assertLessEqual(len(names._cache), 4)
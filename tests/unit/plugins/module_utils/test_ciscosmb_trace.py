@@ -0,0 +1,56 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_trace import Trace
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = os.path.join(self.tmpdir, "trace.jsonl")
+
+    def read(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_disabled(self):
+        trace = Trace()
+
+        trace.record("l2_interfaces", section="interface gi1/0/1")
+        trace.flush()
+
+        self.assertFalse(trace.enabled)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_buffered_records(self):
+        trace = Trace(self.path, buffer_size=3)
+
+        for port in range(1, 5):
+            trace.record("l2_interfaces", section="interface gi1/0/%d" % port)
+        # the first three went out together, the fourth waits
+        self.assertEqual(len(self.read()), 3)
+
+        trace.flush()
+        records = self.read()
+        self.assertEqual([record["section"] for record in records], ["interface gi1/0/%d" % n for n in range(1, 5)])
+        self.assertEqual(records[0]["source"], "l2_interfaces")
+        self.assertIn("time", records[0])
+
+    def test_unwritable_sink_turns_off(self):
+        trace = Trace(os.path.join(self.tmpdir, "missing", "trace.jsonl"))
+
+        trace.record("vlans", section="1")
+        trace.flush()
+
+        self.assertFalse(trace.enabled)
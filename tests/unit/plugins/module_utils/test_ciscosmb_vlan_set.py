@@ -0,0 +1,37 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.module_utils.ciscosmb_vlan_set import (
+    VlanSet,
+)
+
+
+class TestVlanSet(unittest.TestCase):
+
+    def test_from_ranges(self):
+        self.assertEqual(VlanSet.from_ranges(["10-20", "40"]).ranges(), ["10-20", "40"])
+        self.assertEqual(VlanSet.from_ranges("1,2,3,5-6, 7,4094").ranges(), ["1-3", "5-7", "4094"])
+        self.assertEqual(VlanSet.from_ranges([30, "20"]).ranges(), ["20", "30"])
+        self.assertEqual(VlanSet.from_ranges([]).ranges(), [])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, VlanSet.from_ranges, ["20-10"])
+        self.assertRaises(ValueError, VlanSet.from_ranges, ["0"])
+        self.assertRaises(ValueError, VlanSet.from_ranges, ["4000-4095"])
+        self.assertRaises(ValueError, VlanSet.from_ranges, ["ten"])
+
+    def test_operations(self):
+        vlans = VlanSet.from_ranges("1-4094")
+        self.assertEqual(len(vlans), 4094)
+        self.assertEqual(str(vlans - VlanSet.from_ranges("100-199,300")), "1-99,200-299,301-4094")
+        self.assertEqual(str(VlanSet.from_ranges("1-10") | VlanSet.from_ranges("11,13")), "1-11,13")
+        self.assertEqual(str(VlanSet.from_ranges("1-10") & VlanSet.from_ranges("5-20")), "5-10")
+        self.assertEqual(list(VlanSet.from_ranges("3-5,9")), [3, 4, 5, 9])
+        self.assertIn(4094, vlans)
+        self.assertNotIn(4095, vlans)
+        self.assertFalse(VlanSet.from_ranges("1-3") - VlanSet.from_ranges("1-4"))
+        self.assertEqual(VlanSet.from_ranges("1,2"), VlanSet.from_ranges("1-2"))
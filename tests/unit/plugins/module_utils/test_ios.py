@@ -0,0 +1,104 @@
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.ios import (
+    RunningConfig,
+    get_running_config,
+)
+
+RUNNING_CONFIG = """config-file-header
+sw-example
+v3.0.0.61 / RCBS3.0_930_770_007
+!
+hostname sw-example
+logging host 10.0.0.1
+ip route 0.0.0.0 0.0.0.0 10.0.0.254
+ipv6 route ::/0 fe80::1
+!
+interface vlan 20
+ name LAN-example1
+ ip address 20.30.40.50 255.128.0.0
+!
+interface GigabitEthernet1
+ switchport access vlan 90
+ logging event link-status
+!
+router ospf 1
+ network 10.0.0.0 0.0.0.255 area 0
+!
+router ospfv3 1
+!
+exit
+"""
+
+
+class TestRunningConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.connection.get_config.return_value = RUNNING_CONFIG
+
+    def test_section(self):
+        config = RunningConfig(self.connection)
+
+        self.assertEqual(
+            config.section("interface").split("\n"),
+            [
+                "interface vlan 20",
+                " name LAN-example1",
+                " ip address 20.30.40.50 255.128.0.0",
+                "interface GigabitEthernet1",
+                " switchport access vlan 90",
+                " logging event link-status",
+            ],
+        )
+        self.assertEqual(config.section("router ospfv3"), "router ospfv3 1")
+        self.assertEqual(
+            config.section("ip route", "ipv6 route"),
+            "ip route 0.0.0.0 0.0.0.0 10.0.0.254\nipv6 route ::/0 fe80::1",
+        )
+        self.assertEqual(config.section("ntp"), "")
+
+    def test_include(self):
+        config = RunningConfig(self.connection)
+
+        self.assertEqual(
+            config.include("logging"),
+            "logging host 10.0.0.1\n logging event link-status",
+        )
+
+    def test_single_download(self):
+        module = MagicMock(spec=[])
+        module._ios_running_config = RunningConfig(self.connection)
+
+        get_running_config(module, self.connection).section("interface")
+        get_running_config(module, self.connection).section("router ospf")
+        get_running_config(module, self.connection).include("logging")
+
+        self.connection.get_config.assert_called_once_with()
+
+    def test_private_snapshot_outside_facts_run(self):
+        module = MagicMock(spec=[])
+
+        get_running_config(module, self.connection).section("interface")
+        get_running_config(module, self.connection).section("interface")
+
+        self.assertEqual(self.connection.get_config.call_count, 2)
@@ -0,0 +1,47 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.interfaces.interfaces import (
+    InterfacesArgs,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.interfaces.interfaces import (
+    Interfaces,
+)
+from ansible_collections.community.ciscosmb.tests.unit.plugins.module_utils.utils import config
+
+
+class TestInterfacesMatching(unittest.TestCase):
+
+    def setUp(self):
+        module = MagicMock()
+        module.params = {"state": "rendered"}
+        self.interfaces = Interfaces(module)
+
+    def test_replaced_prefers_exact_name(self):
+        have = [
+            {"name": "GigabitEthernet1/0/10", "mtu": 9000},
+            {"name": "GigabitEthernet1/0/1", "description": "uplink"},
+        ]
+        commands = self.interfaces._state_replaced([config(InterfacesArgs, name="GigabitEthernet1/0/1", description="core")], have)
+        self.assertEqual(commands, ["interface GigabitEthernet1/0/1", 'description "core"', "no shutdown"])
+
+    def test_overridden_configures_new_interfaces(self):
+        have = [
+            {"name": "GigabitEthernet1/0/1", "description": "a"},
+            {"name": "GigabitEthernet1/0/10", "mtu": 9000},
+        ]
+        want = [
+            config(InterfacesArgs, name="GigabitEthernet1/0/2", description="new"),
+            config(InterfacesArgs, name="GigabitEthernet1/0/10", description="b"),
+        ]
+        commands = self.interfaces._state_overridden(want, have)
+        self.assertEqual(commands, [
+            "interface GigabitEthernet1/0/1", "no description",
+            "interface GigabitEthernet1/0/10", "no mtu", 'description "b"', "no shutdown",
+            "interface GigabitEthernet1/0/2", 'description "new"', "no shutdown",
+        ])
@@ -0,0 +1,60 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.l2_interfaces.l2_interfaces import (
+    L2_InterfacesArgs,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.l2_interfaces.l2_interfaces import (
+    L2_Interfaces,
+)
+from ansible_collections.community.ciscosmb.tests.unit.plugins.module_utils.utils import config
+
+
+def trunk(name, **kwargs):
+    return config(L2_InterfacesArgs, name=name, mode="trunk", trunk=kwargs)
+
+
+class TestL2InterfacesTrunkVlans(unittest.TestCase):
+
+    def setUp(self):
+        self.module = MagicMock()
+        self.module.params = {"state": "merged"}
+        self.l2_interfaces = L2_Interfaces(self.module)
+        self.have = [{"name": "GigabitEthernet1/0/1", "mode": "trunk", "trunk": {"allowed_vlans": ["1-4094"]}}]
+
+    def test_merged_adds_missing_ranges(self):
+        have = [{"name": "GigabitEthernet1/0/1", "mode": "trunk", "trunk": {"allowed_vlans": ["10-20", "40"]}}]
+        want = [trunk("GigabitEthernet1/0/1", allowed_vlans=["15-30", "40-41"])]
+        commands = self.l2_interfaces._state_merged(want, have, self.module)
+        self.assertEqual(commands, ["interface GigabitEthernet1/0/1", "switchport trunk allowed vlan add 21-30,41"])
+
+    def test_merged_subset_is_idempotent(self):
+        want = [trunk("GigabitEthernet1/0/1", allowed_vlans=["100-199"])]
+        self.assertEqual(self.l2_interfaces._state_merged(want, self.have, self.module), [])
+
+    def test_replaced_removes_ranges(self):
+        self.l2_interfaces.state = "replaced"
+        want = [trunk("GigabitEthernet1/0/1", allowed_vlans=["1-99", "200-4094"])]
+        commands = self.l2_interfaces._state_replaced(want, self.have, self.module)
+        self.assertEqual(commands, ["interface GigabitEthernet1/0/1", "switchport trunk allowed vlan remove 100-199"])
+
+    def test_new_trunk_sets_list(self):
+        want = [trunk("GigabitEthernet1/0/2", allowed_vlans=["10", "11", "12", "20"], pruning_vlans=["10"])]
+        commands = self.l2_interfaces._state_merged(want, self.have, self.module)
+        self.assertEqual(commands, [
+            "interface GigabitEthernet1/0/2",
+            "switchport trunk allowed vlan 10-12,20",
+            "switchport trunk pruning vlan 10",
+            "switchport mode trunk",
+        ])
+
+    def test_bad_range(self):
+        self.module.fail_json.side_effect = SystemExit
+        want = [trunk("GigabitEthernet1/0/1", allowed_vlans=["20-10"])]
+        self.assertRaises(SystemExit, self.l2_interfaces._state_merged, want, self.have, self.module)
+        self.assertIn("end of range not larger", self.module.fail_json.call_args[1]["msg"])
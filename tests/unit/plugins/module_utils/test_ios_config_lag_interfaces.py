@@ -0,0 +1,41 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.lag_interfaces.lag_interfaces import (
+    Lag_interfaces,
+)
+
+
+class TestLagInterfacesMatching(unittest.TestCase):
+
+    def setUp(self):
+        self.module = MagicMock()
+        self.module.params = {"state": "rendered"}
+        self.lag = Lag_interfaces(self.module)
+        self.have = [
+            {"name": "Port-channel1", "members": [{"member": "GigabitEthernet1/0/1", "mode": "active"}]},
+            {"name": "GigabitEthernet1/0/3"},
+        ]
+
+    def test_merged_matches_member_interface(self):
+        want = [{"name": "Port-channel5", "members": [
+            {"member": "GigabitEthernet1/0/3", "mode": "on"},
+            {"member": "GigabitEthernet1/0/4", "mode": "on"},
+        ]}]
+        commands = self.lag._state_merged(want, self.have, self.module)
+        self.assertEqual(commands, [
+            "interface GigabitEthernet1/0/3", "channel-group 5 mode on", "interface GigabitEthernet1/0/4",
+            "channel-group 5 mode on",
+            # every member sets the channel-group of all the members
+            "interface GigabitEthernet1/0/3", "channel-group 5 mode on", "interface GigabitEthernet1/0/4",
+            "channel-group 5 mode on",
+        ])
+
+    def test_deleted_by_name(self):
+        commands = self.lag._state_deleted([{"name": "Port-channel1"}], self.have)
+        self.assertEqual(commands, ["interface GigabitEthernet1/0/1", "no channel-group"])
@@ -0,0 +1,52 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.argspec.vlans.vlans import (
+    VlansArgs,
+)
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.config.vlans.vlans import (
+    Vlans,
+)
+from ansible_collections.community.ciscosmb.tests.unit.plugins.module_utils.utils import config
+
+
+def vlan(vlan_id, **kwargs):
+    return config(VlansArgs, vlan_id=vlan_id, **kwargs)
+
+
+class TestVlansRanges(unittest.TestCase):
+
+    def setUp(self):
+        module = MagicMock()
+        module.params = {"state": "merged"}
+        self.vlans = Vlans(module)
+        self.have = [
+            {"vlan_id": 1, "name": "default", "mtu": 1500},
+            {"vlan_id": 10, "name": "users", "mtu": 1500},
+        ] + [{"vlan_id": vlan_id, "name": "VLAN%04d" % vlan_id, "mtu": 1500} for vlan_id in range(30, 40)]
+
+    def test_merged_creates_ranges(self):
+        want = [vlan(vlan_id) for vlan_id in range(100, 200)] + [vlan(10), vlan(20, name="voice"), vlan(300)]
+        self.assertEqual(self.vlans._state_merged(want, self.have), ["vlan 100-199,300", "vlan 20", "name voice"])
+
+    def test_deleted_ranges(self):
+        self.vlans.state = "deleted"
+        self.assertEqual(self.vlans._state_deleted([], self.have), ["no vlan 10,30-39"])
+        self.assertEqual(self.vlans._state_deleted([vlan(30), vlan(31), vlan(50)], self.have), ["no vlan 30-31"])
+
+    def test_vlan_id_out_of_range(self):
+        self.vlans._module.fail_json.side_effect = SystemExit
+        self.assertRaises(SystemExit, self.vlans.set_state, [vlan(4095)], [])
+        self.assertEqual(self.vlans._module.fail_json.call_args[1]["msg"], "vlan_id 4095 is out of range 1-4094")
+
+    def test_overridden(self):
+        self.vlans.state = "overridden"
+        want = [vlan(1, name="default", mtu=1500), vlan(10, name="staff", mtu=1500)] + [vlan(vlan_id) for vlan_id in range(40, 45)]
+        self.assertEqual(self.vlans._state_overridden(want, self.have), [
+            "no vlan 30-39", "vlan 40-44", "vlan 10", "name staff",
+        ])
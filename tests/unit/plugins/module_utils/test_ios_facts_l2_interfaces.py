@@ -0,0 +1,32 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.facts.l2_interfaces.l2_interfaces import (
+    L2_InterfacesFacts,
+)
+
+
+class TestL2InterfacesFactsTrunkVlans(unittest.TestCase):
+
+    def setUp(self):
+        self.facts = L2_InterfacesFacts(MagicMock())
+
+    def test_add_lines(self):
+        conf = "\n".join([
+            "GigabitEthernet1/0/1",
+            " switchport mode trunk",
+            " switchport trunk allowed vlan add 10-20",
+            " switchport trunk allowed vlan add 21,30",
+            " switchport trunk allowed vlan remove 15",
+        ])
+        self.assertEqual(self.facts.parse_vlans(conf, "allowed vlan"), ["10-14", "16-21", "30"])
+        self.assertIsNone(self.facts.parse_vlans(conf, "pruning vlan"))
+
+    def test_all(self):
+        conf = "GigabitEthernet1/0/1\n switchport trunk allowed vlan all\n"
+        self.assertEqual(self.facts.parse_vlans(conf, "allowed vlan"), ["1-4094"])
@@ -0,0 +1,71 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.facts.vlans.vlans import (
+    VlansFacts,
+)
+
+SHOW_VLAN = """VLAN Name                             Status    Ports
+---- -------------------------------- --------- -------------------------------
+1    default                          active    Gi0/1, Gi0/2
+10   vlan_10                          active    Gi0/3, Gi0/4, Gi0/5, Gi0/6, Gi0/7
+                                                Gi0/8, Gi0/9
+20   vlan_20                          act/lshut
+30   vlan_30                          sus/lshut
+40   vlan_40                          suspended
+1002 fddi-default                     act/unsup
+1003 token-ring-default               act/unsup
+
+VLAN Type  SAID       MTU   Parent RingNo BridgeNo Stp  BrdgMode Trans1 Trans2
+---- ----- ---------- ----- ------ ------ -------- ---- -------- ------ ------
+1    enet  100001     1500  -      -      -        -    -        0      0
+10   enet  100010     1500  -      -      -        -    -        0      0
+20   enet  100020     1500  -      -      -        -    -        0      0
+30   enet  100030     1500  -      -      -        -    -        0      0
+40   enet  100040     610   -      -      -        -    -        0      0
+1002 fddi  101002     1500  -      -      -        -    -        0      0
+1003 tr    101003     1500  -      -      -        -    -        0      0
+
+Remote SPAN VLANs
+------------------------------------------------------------------------------
+20,30
+
+Primary Secondary Type              Ports
+------- --------- ----------------- ------------------------------------------"""
+
+
+class TestVlansFacts(unittest.TestCase):
+
+    def setUp(self):
+        self.facts = VlansFacts(MagicMock())
+
+    def test_parse_vlans(self):
+        vlans = self.facts.parse_vlans(SHOW_VLAN)
+        self.assertEqual([vlan["vlan_id"] for vlan in vlans], [1, 10, 20, 30, 40, 1002, 1003])
+        self.assertEqual(vlans[2], {
+            "vlan_id": 20, "name": "vlan_20", "state": "active", "shutdown": "enabled", "mtu": 1500, "remote_span": True,
+        })
+        self.assertEqual(vlans[4], {"vlan_id": 40, "name": "vlan_40", "state": "suspend", "shutdown": "disabled", "mtu": 610})
+
+    def test_wrapped_status(self):
+        data = "\n".join([
+            "VLAN Name                             Status    Ports",
+            "---- -------------------------------- --------- -------------------------------",
+            "10   a-name-that-fills-the-whole-column",
+            "                                      active    Gi0/1",
+            "20   vlan_20",
+            "                                                Gi0/2",
+        ])
+        self.assertEqual(self.facts.parse_vlans(data), [
+            {"vlan_id": 10, "name": "a-name-that-fills-the-whole-column", "state": "active", "shutdown": "disabled"},
+            {"vlan_id": 20, "name": "vlan_20"},
+        ])
+
+    def test_populate_facts(self):
+        facts = self.facts.populate_facts(None, {"ansible_network_resources": {}}, SHOW_VLAN)
+        self.assertEqual(len(facts["ansible_network_resources"]["vlans"]), 7)
@@ -0,0 +1,27 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.module_utils.network.ios.utils.utils import (
+    index_by_name,
+    pair_by_name,
+)
+
+
+class TestPairByName(unittest.TestCase):
+
+    def test_index_first_wins(self):
+        first = {"name": "GigabitEthernet1/0/1", "mtu": 1500}
+        index = index_by_name([first, {"name": "GigabitEthernet1/0/1", "mtu": 9000}])
+        self.assertIs(index["GigabitEthernet1/0/1"], first)
+
+    def test_pair(self):
+        want = [{"name": "GigabitEthernet1/0/2"}, {"name": "GigabitEthernet1/0/1"}]
+        have = [{"name": "GigabitEthernet1/0/1", "mtu": 9000}]
+        self.assertEqual(pair_by_name(want, have), [
+            ({"name": "GigabitEthernet1/0/2"}, None),
+            ({"name": "GigabitEthernet1/0/1"}, {"name": "GigabitEthernet1/0/1", "mtu": 9000}),
+        ])
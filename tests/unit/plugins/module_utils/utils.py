@@ -0,0 +1,19 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+def config(args, **kwargs):
+    """ one entry of the config of a resource module as its argument spec
+    validates it, options not given are None or their default, a dict given
+    for a suboption is filled the same way """
+    return _options(args.argument_spec["config"]["options"], kwargs)
+
+
+def _options(options, values):
+    result = dict()
+    for name, spec in options.items():
+        value = values.get(name, spec.get("default"))
+        if isinstance(value, dict) and "options" in spec:
+            value = _options(spec["options"], value)
+        result[name] = value
+    return result
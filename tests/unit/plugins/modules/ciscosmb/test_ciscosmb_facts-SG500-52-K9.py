@@ -17,7 +17,14 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible_collections.community.ciscosmb.tests.unit.compat.mock import patch
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+
+from ansible_collections.community.ciscosmb.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.ciscosmb.plugins.module_utils import ciscosmb
 from ansible_collections.community.ciscosmb.plugins.modules import facts
 from ansible_collections.community.ciscosmb.tests.unit.plugins.modules.utils import set_module_args
 from .ciscosmb_module import TestCiscoSMBModule, load_fixture
@@ -116,6 +123,138 @@ class TestCiscoSMBFactsModule(TestCiscoSMBModule):
             len(result['ansible_facts']['ansible_net_neighbors']), 9
         )
 
+    def test_ciscosmb_facts_interfaces_failed_command(self):
+        def connection_outputs(commands, check_rc):
+            self.assertFalse(check_rc)
+            return [
+                {'error': '% Unrecognized command'} if command == 'show ports jumbo-frame'
+                else load_fixture('ciscosmb_facts-SG500-52-K9-%s' % command.replace(' ', '_'))
+                for command in commands
+            ]
+
+        connection = MagicMock()
+        connection.run_commands.side_effect = connection_outputs
+        # through the real run_commands, which turns the error into None
+        self.load_fixtures = lambda commands=None: None
+        self.run_commands.side_effect = ciscosmb.run_commands
+        set_module_args(dict(gather_subset='interfaces'))
+        with patch.object(ciscosmb, 'get_connection', return_value=connection):
+            result = self.execute_module()
+
+        interfaces = result['ansible_facts']['ansible_net_interfaces']
+        self.assertIsNone(interfaces['GigabitEthernet1/1']['mtu'])
+        self.assertIsNone(interfaces['vlan1']['mtu'])
+        self.assertEqual(len(interfaces), 85)
+
+    def test_ciscosmb_facts_interfaces_status(self):
+        set_module_args(dict(gather_subset='interfaces.status'))
+        result = self.execute_module()
+
+        commands = self.run_commands.call_args[1]['commands']
+        self.assertIn('show interfaces status', commands)
+        self.assertNotIn('show lldp neighbors', commands)
+        self.assertNotIn('show ip interface', commands)
+        self.assertIn('interfaces.status', result['ansible_facts']['ansible_net_gather_subset'])
+        self.assertNotIn('ansible_net_neighbors', result['ansible_facts'])
+        self.assertNotIn('ansible_net_all_ipv4_addresses', result['ansible_facts'])
+        self.assertEqual(
+            result['ansible_facts']['ansible_net_interfaces']['GigabitEthernet1/1']['mtu'], 1518
+        )
+
+    def test_ciscosmb_facts_interfaces_but_neighbors(self):
+        set_module_args(dict(gather_subset=['interfaces', '!interfaces.neighbors']))
+        result = self.execute_module()
+
+        commands = self.run_commands.call_args[1]['commands']
+        self.assertNotIn('show lldp neighbors', commands)
+        self.assertIn('show interfaces description', commands)
+        self.assertNotIn('ansible_net_neighbors', result['ansible_facts'])
+        # sorted, the same on every run
+        gathered = result['ansible_facts']['ansible_net_gather_subset']
+        self.assertEqual(gathered, sorted(gathered))
+        self.assertNotIn('interfaces.neighbors', gathered)
+
+    def test_ciscosmb_facts_single_batch(self):
+        set_module_args(dict(gather_subset='all'))
+        result = self.execute_module()
+
+        self.assertEqual(self.run_commands.call_count, 1)
+        commands = self.run_commands.call_args[1]['commands']
+        self.assertEqual(len(commands), len(set(commands)))
+        self.assertIn('show running-config detailed', commands)
+        self.assertEqual(
+            result['ansible_facts']['ansible_net_hostname'], 'sw-abcdefg-1'
+        )
+
+    def test_ciscosmb_facts_config_file(self):
+        config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, config_dir)
+        mock_get_connection = patch('ansible_collections.community.ciscosmb.plugins.modules.facts.get_connection')
+        get_connection = mock_get_connection.start()
+        self.addCleanup(mock_get_connection.stop)
+        config = load_fixture('ciscosmb_facts-SG500-52-K9-show_running-config_detailed').encode()
+
+        def get_to_file(command, path):
+            with open(path, 'wb') as f:
+                f.write(config)
+            return {'path': path, 'bytes': len(config), 'lines': config.count(b'\n')}
+
+        get_connection.return_value.get_to_file.side_effect = get_to_file
+
+        set_module_args(dict(
+            gather_subset='config', config_dir=config_dir, config_compress=True, config_content_addressed=True,
+        ))
+        result = self.execute_module()
+
+        config_file = result['ansible_facts']['ansible_net_config_file']
+        self.assertNotIn('ansible_net_config', result['ansible_facts'])
+        self.assertNotIn('show running-config detailed', self.run_commands.call_args[1]['commands'])
+        self.assertEqual(config_file['size'], len(config))
+        self.assertEqual(config_file['sha256'], hashlib.sha256(config).hexdigest())
+        self.assertEqual(config_file['path'], os.path.join(config_dir, config_file['sha256'] + '.cfg.gz'))
+        with gzip.open(config_file['path'], 'rb') as f:
+            self.assertEqual(f.read(), config)
+        # nothing but the config is left behind
+        self.assertEqual(os.listdir(config_dir), [os.path.basename(config_file['path'])])
+
+    def test_ciscosmb_facts_timing(self):
+        set_module_args(dict(gather_subset='hardware', timing=True))
+        result = self.execute_module()
+
+        timing = result['ansible_facts']['ansible_net_timing']
+        self.assertEqual(sorted(timing['subsets']), ['default', 'hardware'])
+        self.assertEqual(timing['subsets']['hardware']['commands'], ['dir'])
+        self.assertGreaterEqual(timing['subsets']['hardware']['parse_cpu_time'], 0)
+        self.assertGreaterEqual(timing['wall_time'], 0)
+
+    def test_ciscosmb_facts_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        mock_get_connection = patch('ansible_collections.community.ciscosmb.plugins.modules.facts.get_connection')
+        get_connection = mock_get_connection.start()
+        self.addCleanup(mock_get_connection.stop)
+        get_connection.return_value.get_option.return_value = 'sw-abcdefg-1.example.com'
+
+        args = dict(gather_subset='hardware', cache_dir=cache_dir, max_age=dict(default=3600, hardware=3600))
+        set_module_args(dict(args))
+        result = self.execute_module()
+        self.assertEqual(result['ansible_facts']['ansible_net_cached_subsets'], [])
+        self.assertEqual(self.run_commands.call_count, 1)
+
+        set_module_args(dict(args))
+        result = self.execute_module()
+        self.assertEqual(sorted(result['ansible_facts']['ansible_net_cached_subsets']), ['default', 'hardware'])
+        self.assertEqual(result['ansible_facts']['ansible_net_spacefree_mb'], 6.8)
+        self.assertEqual(result['ansible_facts']['ansible_net_hostname'], 'sw-abcdefg-1')
+        # nothing went to the device
+        self.assertEqual(self.run_commands.call_count, 1)
+
+        # default is fresh, hardware expired
+        set_module_args(dict(args, max_age=dict(default=3600, hardware=0)))
+        result = self.execute_module()
+        self.assertEqual(result['ansible_facts']['ansible_net_cached_subsets'], ['default'])
+        self.assertEqual(self.run_commands.call_args[1]['commands'], ['dir'])
+
 #     def test_ciscosmb_facts_routing(self):
 #         set_module_args(dict(gather_subset='routing'))
 #         result = self.execute_module()
@@ -128,6 +128,27 @@ class TestCiscoSMBFactsModule(TestCiscoSMBModule):
 
         )
 
+    def test_ciscosmb_facts_inventory_large_stack(self):
+        blocks = []
+        # units out of order, an SFP between them, more than 8 of them
+        for unit in [10, 2, 1] + list(range(3, 10)):
+            blocks.append(
+                'NAME: "%d"   DESCR: "SG550X-48 48-Port Gigabit Stackable Managed Switch"   \n'
+                'PID: SG550X-48-K9   VID: V02   SN: SN%04d   \n' % (unit, unit)
+            )
+            blocks.append(
+                'NAME: "TenGigabitEthernet%d/0/1"    DESCR: "SFP-10G-LR"    \n'
+                'PID: SFP-10G-LR    VID: V03     SN: SFP%04d          \n' % (unit, unit)
+            )
+        inventory = "\n\n".join(blocks)
+
+        modules, units = facts.Default(None).parse_inventory(inventory)
+
+        self.assertEqual(len(modules), 20)
+        self.assertEqual([unit['name'] for unit in units], [str(n) for n in range(1, 11)])
+        self.assertEqual(units[9]['sn'], 'SN0010')
+        self.assertEqual(modules['TenGigabitEthernet10/0/1']['sn'], 'SFP0010')
+
     def test_ciscosmb_facts_hardware(self):
         set_module_args(dict(gather_subset='hardware'))
         result = self.execute_module()
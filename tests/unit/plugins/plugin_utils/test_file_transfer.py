@@ -0,0 +1,116 @@
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import socket
+import struct
+import tempfile
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.request import urlopen
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.plugin_utils.file_transfer import (
+    HttpTransfer,
+    StagedTransfer,
+    TftpTransfer,
+)
+
+CONFIG = b"".join(b"interface vlan %d\n name vlan%d\nexit\n" % (n, n) for n in range(1, 60))
+
+
+def tftp_get(port, filename):
+    """ minimal client, what the switch does for copy tftp://... """
+    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client.settimeout(5)
+    client.sendto(struct.pack("!H", 1) + filename.encode() + b"\0octet\0", ("127.0.0.1", port))
+    data = b""
+    try:
+        while True:
+            packet, server = client.recvfrom(1024)
+            opcode, block = struct.unpack("!HH", packet[:4])
+            if opcode == 5:
+                return None
+            data += packet[4:]
+            client.sendto(struct.pack("!HH", 4, block), server)
+            if len(packet) - 4 < 512:
+                return data
+    finally:
+        client.close()
+
+
+def tftp_put(port, filename, data):
+    """ the switch side of copy running-config tftp://... """
+    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client.settimeout(5)
+    client.sendto(struct.pack("!H", 2) + filename.encode() + b"\0octet\0", ("127.0.0.1", port))
+    try:
+        block = 0
+        while True:
+            packet, server = client.recvfrom(1024)
+            opcode, acked = struct.unpack("!HH", packet[:4])
+            if opcode == 5:
+                return False
+            if block * 512 > len(data):
+                return True
+            block += 1
+            client.sendto(
+                struct.pack("!HH", 3, block) + data[(block - 1) * 512:block * 512], server
+            )
+    finally:
+        client.close()
+
+
+class TestFileTransfer(unittest.TestCase):
+
+    def test_tftp(self):
+        with TftpTransfer(CONFIG, "127.0.0.1", port=0, bind="127.0.0.1") as transfer:
+            self.assertTrue(transfer.url().startswith("tftp://127.0.0.1:"))
+            self.assertIsNone(tftp_get(transfer.port, "startup-config"))
+            self.assertEqual(tftp_get(transfer.port, transfer.name), CONFIG)
+
+        self.assertEqual(transfer.served, 1)
+
+    def test_tftp_receive(self):
+        with TftpTransfer(None, "127.0.0.1", port=0, bind="127.0.0.1") as transfer:
+            self.assertIsNone(transfer.received())
+            self.assertFalse(tftp_put(transfer.port, "startup-config", CONFIG))
+            self.assertTrue(tftp_put(transfer.port, transfer.name, CONFIG))
+
+        self.assertEqual(transfer.received(), CONFIG)
+
+    def test_http(self):
+        with HttpTransfer(CONFIG, "127.0.0.1", port=0, bind="127.0.0.1") as transfer:
+            self.assertEqual(urlopen(transfer.url()).read(), CONFIG)
+            with self.assertRaises(HTTPError):
+                urlopen("http://127.0.0.1:%d/startup-config" % transfer.port)
+
+        self.assertEqual(transfer.served, 1)
+
+    def test_staged(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        with StagedTransfer(CONFIG, "scp://backup@192.0.2.10/configs/", directory) as transfer:
+            self.assertEqual(transfer.url(), "scp://backup@192.0.2.10/configs/" + transfer.name)
+            with open(os.path.join(directory, transfer.name), "rb") as f:
+                self.assertEqual(f.read(), CONFIG)
+
+        self.assertEqual(os.listdir(directory), [])
@@ -0,0 +1,88 @@
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+
+from ansible_collections.community.ciscosmb.tests.unit.compat import unittest
+from ansible_collections.community.ciscosmb.plugins.terminal.ciscosmb import (
+    STDERR_RE,
+    TerminalModule,
+    find_stderr,
+)
+
+# the separate rules terminal_stderr_re used to hold
+SEPARATE_RULES = [
+    re.compile(br"% ?Error"),
+    re.compile(br"^% \w+", re.M),
+    re.compile(br"% ?Bad secret"),
+    re.compile(br"[\r\n%] Bad passwords"),
+    re.compile(br"invalid input", re.I),
+    re.compile(br"(?:incomplete|ambiguous) command", re.I),
+    re.compile(br"connection timed out", re.I),
+    re.compile(br"[^\r\n]+ not found"),
+    re.compile(br"'[^']' +returned error code: ?\d+"),
+    re.compile(br"Bad mask", re.I),
+    re.compile(br"% ?(\S+) ?overlaps with ?(\S+)", re.I),
+    re.compile(br"[%\S] ?Error: ?[\s]+", re.I),
+    re.compile(br"[%\S] ?Informational: ?[\s]+", re.I),
+    re.compile(br"Command authorization failed"),
+]
+
+RESPONSES = [
+    (b"switch(config)#vlan 5000\r\n% Error: bad VLAN\r\n", "error"),
+    (b"% Unrecognized command\r\n", "percent_message"),
+    (b"Password: % Bad secret\r\n", "bad_secret"),
+    (b"\r\n Bad passwords\r\n", "bad_passwords"),
+    (b"show foo\r\nInvalid Input detected\r\n", "invalid_input"),
+    (b"Ambiguous command\r\n", "incomplete_command"),
+    (b"Connection timed out\r\n", "connection_timed_out"),
+    (b"file flash://x not found\r\n", "not_found"),
+    (b"'x' returned error code: 2\r\n", "returned_error_code"),
+    (b"bad mask\r\n", "bad_mask"),
+    (b"ip route %10.0.0.0/8 overlaps with 10.1.0.0/16\r\n", "overlaps"),
+    (b"sw Error: \r\n", "error_label"),
+    (b"sw Informational: \r\n", "informational"),
+    (b"Command authorization failed\r\n", "authorization_failed"),
+    (b"show running-config\r\nhostname switch\r\ninterface gi1/1\r\n", None),
+    (b" description error budget\r\nvlan 10\r\n% Error: bad VLAN\r\n", "error"),
+    (b"vlan 10\r\nscript '\n' returned error code: 1\r\n", "returned_error_code"),
+    (b" description uplink not found yet\r\n", "not_found"),
+]
+
+
+class TestStderr(unittest.TestCase):
+
+    def test_same_verdict_as_separate_rules(self):
+        for response, rule in RESPONSES:
+            match = find_stderr(response)
+            first = [m.start() for m in (r.search(response) for r in SEPARATE_RULES) if m]
+            self.assertEqual(bool(match), bool(first), response)
+            self.assertEqual(match and match.lastgroup, rule, response)
+            if first:
+                self.assertEqual(match.start(), min(first), response)
+            # the keyword shortcut never hides a match
+            self.assertEqual(bool(STDERR_RE.search(response)), bool(match), response)
+
+    def test_terminal_stderr_re_uses_find_stderr(self):
+        # network_cli calls search() and logs pattern of every entry
+        for regex in TerminalModule.terminal_stderr_re:
+            self.assertEqual(regex.pattern, STDERR_RE.pattern)
+            for response, rule in RESPONSES:
+                match = regex.search(response)
+                self.assertEqual(match and match.lastgroup, rule, response)